@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Barrido de parámetros del SIGET en paralelo: algoritmos × quantums × semillas
+
+Cada carga se genera una vez por semilla y viaja a los procesos trabajadores
+al crearlos (no en cada tarea); los resultados se entregan a medida que
+terminan. Uso:
+
+    python barrido_siget.py --quantums 1 2 4 8 --semillas 0 1 2 3 --procesos 20000
+    python barrido_siget.py --algoritmos "Round Robin" --quantums 1 2 4 8 --costo-contexto 1
+    python barrido_siget.py --cache .cache_siget   # repetir el barrido solo consulta la caché
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import astuple, dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cache_siget import CacheResultados, clave_configuracion, huella_carga, version_motor
+from nucleo_siget import (
+    POLITICAS, CostoConmutacion, ProcesoSIGET, SimuladorSIGET, TipoProceso, generar_procesos_aleatorios
+)
+
+# Cargas del proceso trabajador, recibidas una sola vez en el inicializador
+_CARGAS: Dict[int, List[tuple]] = {}
+
+
+@dataclass
+class ResultadoBarrido:
+    """Métricas de una corrida del barrido"""
+    algoritmo: str
+    quantum: Optional[int]
+    semilla: int
+    procesos: int
+    despachos: int
+    tiempo_total: int
+    espera_promedio: float
+    respuesta_promedio: float
+    espera_llegada_promedio: float  # Desde la llegada (ver ProcesoSIGET.espera_desde_llegada)
+    cambios_contexto: int
+    tiempo_sobrecarga: int
+    eficiencia: float
+    segundos: float
+
+
+def compactar_carga(procesos: Iterable[ProcesoSIGET]) -> List[tuple]:
+    """Representa la carga como tuplas para enviarla barata a otros procesos"""
+    return [(p.id, p.nombre, p.tipo.name, p.tiempo_irrupcion, p.tiempo_ejecucion,
+             p.prioridad_alerta, p.tamaño_datos) for p in procesos]
+
+
+def _iniciar_trabajador(cargas):
+    _CARGAS.update(cargas)
+
+
+def simular_carga(carga: List[tuple], algoritmo: str, quantum: Optional[int],
+                  costo: Optional[CostoConmutacion] = None) -> Tuple[int, int, int, float, float, float, int, int, float]:
+    """Simula una carga compacta y devuelve (procesos, despachos, tiempo, espera,
+    respuesta, espera desde la llegada, cambios de contexto, sobrecarga, eficiencia)"""
+    simulador = SimuladorSIGET()
+    simulador.costo_conmutacion = costo
+    simulador.procesos = [
+        ProcesoSIGET(id_, nombre, TipoProceso[tipo], irrupcion, ejecucion, prioridad, tamaño,
+                     tiempo_restante=ejecucion)
+        for id_, nombre, tipo, irrupcion, ejecucion, prioridad, tamaño in carga
+    ]
+    simulador.algoritmo_actual = algoritmo
+    if quantum is not None:
+        simulador.quantum = quantum
+    simulador.ejecutar_simulacion()
+    
+    terminados = simulador.procesos_terminados
+    cantidad = len(terminados) or 1
+    return (len(terminados), simulador.despachos, simulador.tiempo_actual,
+            sum(p.tiempo_espera for p in terminados) / cantidad,
+            sum(p.tiempo_respuesta for p in terminados) / cantidad,
+            sum(p.espera_desde_llegada for p in terminados) / cantidad,
+            simulador.cambios_contexto, simulador.tiempo_sobrecarga, simulador.eficiencia_cpu)
+
+
+def _tarea(algoritmo, quantum, semilla, costo):
+    inicio = time.perf_counter()
+    metricas = simular_carga(_CARGAS[semilla], algoritmo, quantum, costo)
+    return ResultadoBarrido(algoritmo, quantum, semilla, *metricas, time.perf_counter() - inicio)
+
+
+def combinaciones(algoritmos, quantums, semillas):
+    """Rejilla de tareas; el quantum solo varía en las políticas que lo usan"""
+    for algoritmo in algoritmos:
+        valores = quantums if POLITICAS[algoritmo].usa_quantum else [None]
+        for quantum in valores:
+            for semilla in semillas:
+                yield algoritmo, quantum, semilla
+
+
+def ejecutar_barrido(algoritmos, quantums, semillas, cantidad_procesos,
+                     trabajadores=None, costo: Optional[CostoConmutacion] = None,
+                     cache: Optional[CacheResultados] = None) -> Iterator[ResultadoBarrido]:
+    """Reparte la rejilla en un ProcessPoolExecutor y entrega cada resultado al terminar.
+
+    Las cargas dependen solo de la semilla, así que los resultados son
+    reproducibles sin importar el orden de terminación. Con ``cache``, las
+    corridas ya guardadas se entregan primero sin simular (``segundos`` es
+    el de la corrida original) y solo las demás van a los trabajadores.
+    """
+    cargas, huellas = {}, {}
+    if cache is not None:
+        # Las métricas las calcula este módulo: su código también forma parte de la clave
+        espacio = "barrido-" + version_motor((sys.modules[__name__],))
+    for semilla in semillas:
+        procesos = generar_procesos_aleatorios(cantidad_procesos, semilla)
+        cargas[semilla] = compactar_carga(procesos)
+        if cache is not None:
+            huellas[semilla] = huella_carga(procesos)
+    
+    pendientes = []
+    for algoritmo, quantum, semilla in combinaciones(algoritmos, quantums, semillas):
+        if cache is not None:
+            clave = clave_configuracion(huellas[semilla], algoritmo, quantum, costo, espacio=espacio)
+            guardado = cache.obtener(clave)
+            if guardado is not None:
+                yield ResultadoBarrido(algoritmo, quantum, semilla, *guardado)
+                continue
+        pendientes.append((algoritmo, quantum, semilla))
+    if not pendientes:
+        return
+    
+    with ProcessPoolExecutor(max_workers=trabajadores, initializer=_iniciar_trabajador,
+                             initargs=({semilla: cargas[semilla] for _, _, semilla in pendientes},)) as ejecutor:
+        futuros = [ejecutor.submit(_tarea, *tarea, costo) for tarea in pendientes]
+        for futuro in as_completed(futuros):
+            resultado = futuro.result()
+            if cache is not None:
+                clave = clave_configuracion(huellas[resultado.semilla], resultado.algoritmo,
+                                            resultado.quantum, costo, espacio=espacio)
+                cache.guardar(clave, astuple(resultado)[3:])
+            yield resultado
+
+
+class AgregadoBarrido:
+    """Acumula resultados por (algoritmo, quantum) a medida que llegan"""
+    
+    def __init__(self):
+        self._sumas: Dict[Tuple[str, Optional[int]], List[float]] = {}
+    
+    def agregar(self, resultado: ResultadoBarrido):
+        suma = self._sumas.setdefault((resultado.algoritmo, resultado.quantum), [0, 0.0, 0.0, 0.0, 0.0, 0.0])
+        suma[0] += 1
+        suma[1] += resultado.espera_promedio
+        suma[2] += resultado.respuesta_promedio
+        suma[3] += resultado.procesos / max(resultado.tiempo_total, 1)
+        suma[4] += resultado.eficiencia
+        suma[5] += resultado.espera_llegada_promedio
+    
+    def filas(self):
+        """(algoritmo, quantum, corridas, espera, respuesta, procesos por unidad de tiempo,
+        eficiencia, espera desde la llegada)"""
+        for (algoritmo, quantum), (corridas, espera, respuesta, rendimiento, eficiencia, espera_llegada) in sorted(
+                self._sumas.items(), key=lambda item: (item[0][0], item[0][1] or 0)):
+            yield (algoritmo, quantum, corridas, espera / corridas, respuesta / corridas,
+                   rendimiento / corridas, eficiencia / corridas, espera_llegada / corridas)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Barrido paralelo de algoritmos y quantums del SIGET")
+    parser.add_argument("--algoritmos", nargs="+", default=list(POLITICAS))
+    parser.add_argument("--quantums", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--semillas", type=int, nargs="+", default=list(range(4)))
+    parser.add_argument("--procesos", type=int, default=10000)
+    parser.add_argument("--trabajadores", type=int, default=os.cpu_count())
+    parser.add_argument("--costo-contexto", type=int, default=0,
+                        help="unidades de tiempo por cambio de contexto")
+    parser.add_argument("--costo-despacho", type=int, default=0,
+                        help="unidades de tiempo por despacho")
+    parser.add_argument("--cache", metavar="DIRECTORIO",
+                        help="guarda los resultados en disco y reutiliza los de corridas anteriores")
+    args = parser.parse_args(argv)
+    
+    costo = None
+    if args.costo_contexto or args.costo_despacho:
+        costo = CostoConmutacion(args.costo_contexto, args.costo_despacho)
+    cache = CacheResultados(args.cache) if args.cache else None
+    agregado = AgregadoBarrido()
+    inicio = time.perf_counter()
+    for resultado in ejecutar_barrido(args.algoritmos, args.quantums, args.semillas,
+                                      args.procesos, args.trabajadores, costo, cache):
+        agregado.agregar(resultado)
+        print(f"✅ {resultado.algoritmo} q={resultado.quantum} semilla={resultado.semilla}: "
+              f"espera {resultado.espera_llegada_promedio:.2f}, respuesta {resultado.respuesta_promedio:.2f} "
+              f"({resultado.segundos:.2f} s)")
+    
+    # La espera se cuenta desde la llegada para que las políticas sean comparables
+    print(f"\n{'Algoritmo':<22} {'q':>3} {'corridas':>8} {'espera':>9} {'respuesta':>10} "
+          f"{'proc/t':>7} {'eficiencia':>10}")
+    for algoritmo, quantum, corridas, _, respuesta, rendimiento, eficiencia, espera in agregado.filas():
+        print(f"{algoritmo:<22} {quantum if quantum is not None else '-':>3} {corridas:>8} "
+              f"{espera:>9.2f} {respuesta:>10.2f} {rendimiento:>7.3f} {eficiencia:>10.1%}")
+    print(f"\n⏱️ {time.perf_counter() - inicio:.2f} s con {args.trabajadores} trabajadores")
+    if cache is not None:
+        print(f"🗃️ Caché: {cache.aciertos} aciertos, {cache.fallos} fallos ({cache.tasa_aciertos:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
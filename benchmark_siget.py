@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Benchmark de escalado del motor de planificación del SIGET
+
+Mide el tiempo de una corrida completa para cargas crecientes y lo compara
+con n·log n, la memoria por proceso de cada representación o la carga de
+una traza binaria. La suite (``--suite``) corre cada caso en un proceso
+propio, guarda los resultados en JSON y, con ``--base``, falla si los
+eventos por segundo caen más de ``--umbral`` por ciento. Uso:
+
+    python benchmark_siget.py [--tamaños 1000 10000 100000] [--algoritmos FIFO SJF]
+    python benchmark_siget.py --memoria [--tamaños 100000]
+    python benchmark_siget.py --traza --tamaños 10000000
+    python benchmark_siget.py --suite --tamaños 10 1000 100000 10000000 --json actual.json
+    python benchmark_siget.py --suite --json actual.json --base base.json --umbral 10
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from nucleo_siget import (
+    SimuladorSIGET, POLITICAS, TipoProceso, generar_procesos_aleatorios, iterar_procesos_aleatorios
+)
+from tabla_siget import TablaProcesos
+from traza_siget import EscritorTrazaBinaria, TrazaBinaria
+
+
+def medir_escalado(tamaños, algoritmos, quantum=2, semilla=0):
+    """Devuelve filas (algoritmo, n, segundos, despachos, seg / (n·log2 n))"""
+    filas = []
+    for algoritmo in algoritmos:
+        for cantidad in tamaños:
+            simulador = SimuladorSIGET()
+            simulador.crear_procesos_aleatorios(cantidad, semilla)
+            simulador.algoritmo_actual = algoritmo
+            simulador.quantum = quantum
+            inicio = time.perf_counter()
+            simulador.ejecutar_simulacion()
+            segundos = time.perf_counter() - inicio
+            filas.append((algoritmo, cantidad, segundos, simulador.despachos,
+                          segundos / (cantidad * math.log2(max(cantidad, 2)))))
+    return filas
+
+
+def _bytes_retenidos(construir):
+    """Bytes que siguen reservados después de construir (y conservar) un objeto"""
+    gc.collect()
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    objeto = construir()
+    gc.collect()
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objeto
+    return despues - antes
+
+
+def medir_memoria(cantidad, semilla=0):
+    """Bytes por proceso: dataclasses ProcesoSIGET frente a TablaProcesos (con y sin vistas)"""
+    return [
+        ("ProcesoSIGET", _bytes_retenidos(lambda: generar_procesos_aleatorios(cantidad, semilla)) / cantidad),
+        ("TablaProcesos", _bytes_retenidos(
+            lambda: TablaProcesos.desde_procesos(generar_procesos_aleatorios(cantidad, semilla))) / cantidad),
+        ("TablaProcesos + vistas", _bytes_retenidos(
+            lambda: TablaProcesos.desde_procesos(generar_procesos_aleatorios(cantidad, semilla)).vistas()) / cantidad),
+    ]
+
+
+def memoria_residente():
+    """RSS actual del proceso en bytes (Linux); en otros sistemas, el pico"""
+    try:
+        with open("/proc/self/statm") as archivo:
+            return int(archivo.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        import resource
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico if sys.platform == "darwin" else pico * 1024
+
+
+def memoria_pico():
+    """Pico de RSS del proceso en bytes, o None si el sistema no lo informa"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico if sys.platform == "darwin" else pico * 1024
+
+
+# Hasta este tamaño la carga se genera en memoria antes de medir; más allá se
+# genera en flujo durante la corrida (y su costo entra en la medición)
+LIMITE_EN_MEMORIA = 1_000_000
+# Los casos chicos se repiten hasta sumar este tiempo y se informa el mejor
+SEGUNDOS_MINIMOS = 0.2
+
+
+def medir_caso(algoritmo, cantidad, semilla=0, quantum=2):
+    """Corre una carga sintética y devuelve sus métricas como dict.
+
+    Los eventos son admisiones + despachos + terminaciones.
+    """
+    simulador = SimuladorSIGET()
+    simulador.algoritmo_actual = algoritmo
+    simulador.quantum = quantum
+    en_flujo = cantidad > LIMITE_EN_MEMORIA
+    if en_flujo:
+        inicio = time.perf_counter()
+        simulador.ejecutar_flujo(iterar_procesos_aleatorios(cantidad, semilla))
+        mejor = time.perf_counter() - inicio
+        repeticiones = 1
+    else:
+        simulador.procesos = generar_procesos_aleatorios(cantidad, semilla)
+        mejor = math.inf
+        acumulado = 0.0
+        repeticiones = 0
+        while acumulado < SEGUNDOS_MINIMOS or not repeticiones:
+            inicio = time.perf_counter()
+            simulador.ejecutar_simulacion()
+            segundos = time.perf_counter() - inicio
+            mejor = min(mejor, segundos)
+            acumulado += segundos
+            repeticiones += 1
+    
+    eventos = simulador.cantidad_admitidos + simulador.despachos + simulador.cantidad_terminados
+    return {
+        "algoritmo": algoritmo,
+        "procesos": cantidad,
+        "semilla": semilla,
+        "quantum": quantum if POLITICAS[algoritmo].usa_quantum else None,
+        "segundos": mejor,
+        "repeticiones": repeticiones,
+        "en_flujo": en_flujo,
+        "despachos": simulador.despachos,
+        "eventos": eventos,
+        "eventos_por_seg": eventos / mejor,
+        "ns_por_despacho": mejor / max(simulador.despachos, 1) * 1e9,
+        "tiempo_simulado": simulador.tiempo_actual,
+        "rss_pico": memoria_pico(),
+    }
+
+
+def ejecutar_suite(tamaños, algoritmos, semilla=0, quantum=2, aislar=True):
+    """Mide cada (algoritmo, tamaño); con ``aislar`` cada caso usa un proceso nuevo
+    para que el pico de RSS sea solo suyo"""
+    casos = []
+    for algoritmo in algoritmos:
+        for cantidad in tamaños:
+            if aislar:
+                with ProcessPoolExecutor(max_workers=1) as ejecutor:
+                    caso = ejecutor.submit(medir_caso, algoritmo, cantidad, semilla, quantum).result()
+            else:
+                caso = medir_caso(algoritmo, cantidad, semilla, quantum)
+            casos.append(caso)
+            yield caso
+
+
+def informe_suite(casos):
+    """Documento JSON de una corrida de la suite"""
+    return {
+        "version": 1,
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "casos": list(casos),
+    }
+
+
+def comparar_con_base(actual, base, umbral):
+    """Casos cuyos eventos por segundo cayeron más de ``umbral`` % respecto de ``base``.
+
+    Devuelve (algoritmo, procesos, eventos/s base, eventos/s actual, caída %)
+    por cada regresión; los casos que no están en ambos informes se ignoran.
+    """
+    def clave(caso):
+        return caso["algoritmo"], caso["procesos"], caso["semilla"], caso["quantum"]
+    
+    previos = {clave(caso): caso for caso in base["casos"]}
+    regresiones = []
+    for caso in actual["casos"]:
+        previo = previos.get(clave(caso))
+        if previo is None:
+            continue
+        caida = (1 - caso["eventos_por_seg"] / previo["eventos_por_seg"]) * 100
+        if caida > umbral:
+            regresiones.append((caso["algoritmo"], caso["procesos"], previo["eventos_por_seg"],
+                                caso["eventos_por_seg"], caida))
+    return regresiones
+
+
+def medir_traza_binaria(cantidad, semilla=0, directorio=None):
+    """Escribe una traza binaria sintética y mide apertura, lectura de columnas y RSS"""
+    azar = random.Random(semilla)
+    tipos = list(TipoProceso)
+    descriptor, ruta = tempfile.mkstemp(suffix=".bin", dir=directorio)
+    os.close(descriptor)
+    try:
+        inicio = time.perf_counter()
+        with EscritorTrazaBinaria(ruta) as escritor:
+            tiempo = 0
+            for i in range(cantidad):
+                tiempo += azar.randint(0, 14)
+                escritor.agregar(i + 1, azar.choice(tipos), tiempo, azar.randint(1, 12),
+                                 azar.randint(1, 5), azar.randint(10, 300))
+        escritura = time.perf_counter() - inicio
+        
+        rss_antes = memoria_residente()
+        inicio = time.perf_counter()
+        traza = TrazaBinaria(ruta)
+        apertura = time.perf_counter() - inicio
+        filas = [("escritura", escritura, None), ("apertura (mmap)", apertura, memoria_residente() - rss_antes)]
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        if numpy is not None:
+            inicio = time.perf_counter()
+            columnas = traza.columnas_numpy()
+            int(columnas["ejecucion"].sum()) + int(columnas["irrupcion"].max())
+            filas.append(("recorrido NumPy", time.perf_counter() - inicio, memoria_residente() - rss_antes))
+            del columnas
+        inicio = time.perf_counter()
+        sum(traza.columnas["ejecucion"])
+        filas.append(("recorrido memoryview", time.perf_counter() - inicio, memoria_residente() - rss_antes))
+        traza.cerrar()
+        return os.path.getsize(ruta), filas
+    finally:
+        os.remove(ruta)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de escalado del motor SIGET")
+    parser.add_argument("--tamaños", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--algoritmos", nargs="+", default=list(POLITICAS))
+    parser.add_argument("--quantum", type=int, default=2)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--memoria", action="store_true",
+                        help="compara bytes por proceso de ProcesoSIGET y TablaProcesos")
+    parser.add_argument("--traza", action="store_true",
+                        help="mide carga y memoria residente de una traza binaria (p. ej. --tamaños 10000000)")
+    parser.add_argument("--suite", action="store_true",
+                        help="suite reproducible: eventos/s, RSS pico y ns por despacho por caso")
+    parser.add_argument("--json", help="archivo donde guardar los resultados de la suite")
+    parser.add_argument("--base", help="informe JSON de referencia para detectar regresiones")
+    parser.add_argument("--umbral", type=float, default=10.0,
+                        help="caída máxima tolerada de eventos/s respecto de --base, en %% (10)")
+    args = parser.parse_args(argv)
+    
+    if args.suite:
+        print(f"{'Algoritmo':<22} {'n':>9} {'seg':>9} {'eventos/s':>12} {'ns/despacho':>12} {'RSS pico':>10}")
+        casos = []
+        for caso in ejecutar_suite(args.tamaños, args.algoritmos, args.semilla, args.quantum):
+            casos.append(caso)
+            rss = f"{caso['rss_pico'] / 2**20:>6.1f} MiB" if caso["rss_pico"] is not None else f"{'-':>10}"
+            print(f"{caso['algoritmo']:<22} {caso['procesos']:>9} {caso['segundos']:>9.3f} "
+                  f"{caso['eventos_por_seg']:>12.0f} {caso['ns_por_despacho']:>12.1f} {rss}")
+        informe = informe_suite(casos)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as archivo:
+                json.dump(informe, archivo, indent=2, ensure_ascii=False)
+            print(f"\n💾 Resultados en {args.json}")
+        if args.base:
+            with open(args.base, encoding="utf-8") as archivo:
+                base = json.load(archivo)
+            regresiones = comparar_con_base(informe, base, args.umbral)
+            for algoritmo, cantidad, previo, actual, caida in regresiones:
+                print(f"❌ {algoritmo} n={cantidad}: {previo:.0f} → {actual:.0f} eventos/s (-{caida:.1f}%)")
+            if regresiones:
+                return 1
+            print(f"✅ Sin regresiones mayores a {args.umbral:.1f}% respecto de {args.base}")
+        return 0
+    
+    if args.traza:
+        for cantidad in args.tamaños:
+            tamaño, filas = medir_traza_binaria(cantidad, args.semilla)
+            print(f"Traza binaria de {cantidad} procesos ({tamaño / 2**20:.1f} MiB)")
+            for etapa, segundos, rss in filas:
+                memoria = f"{rss / 2**20:>8.1f} MiB RSS" if rss is not None else ""
+                print(f"  {etapa:<22} {segundos:>9.4f} s {memoria}")
+        return 0
+    
+    if args.memoria:
+        print(f"{'Representación':<24} {'n':>9} {'bytes/proceso':>14}")
+        for cantidad in args.tamaños:
+            for representacion, bytes_proceso in medir_memoria(cantidad, args.semilla):
+                print(f"{representacion:<24} {cantidad:>9} {bytes_proceso:>14.1f}")
+        return 0
+    
+    print(f"{'Algoritmo':<22} {'n':>9} {'seg':>9} {'despachos':>10} {'ns/(n·log n)':>13}")
+    for algoritmo, cantidad, segundos, despachos, relativo in medir_escalado(
+            args.tamaños, args.algoritmos, args.quantum, args.semilla):
+        print(f"{algoritmo:<22} {cantidad:>9} {segundos:>9.3f} {despachos:>10} {relativo * 1e9:>13.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""
+Caché de resultados de simulación por huella de la carga.
+
+La clave combina una huella estable de los procesos (blake2b sobre sus
+columnas, sin nombres) con la configuración del planificador: algoritmo,
+quantum si la política lo usa y costo de conmutación. ``CacheResultados``
+tiene dos niveles: un LRU en memoria con cantidad máxima de entradas y,
+opcionalmente, un directorio en disco con tamaño máximo que desaloja las
+entradas usadas hace más tiempo. Las entradas de disco viven en un
+subdirectorio por ``version_motor()``, que cambia con el código del motor;
+al abrir la caché se borran los de versiones anteriores. Quien guarda
+valores calculados por otro código (p. ej. las métricas de
+``barrido_siget``) incluye la huella de ese código en el ``espacio`` de la
+clave.
+"""
+
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional
+
+import estadisticas_siget
+import nucleo_siget
+from linea_tiempo_siget import LineaTiempo
+from nucleo_siget import POLITICAS, CostoConmutacion, EstadoProceso, ProcesoSIGET, SimuladorSIGET, TipoProceso
+
+# Sube si cambia el formato de las entradas o de las claves
+VERSION_FORMATO = 1
+
+_CODIGO_TIPO = {tipo: codigo for codigo, tipo in enumerate(TipoProceso)}
+_FALTA = object()
+
+# Módulos cuyo código determina los resultados guardados por simular_con_cache
+MODULOS_MOTOR = (nucleo_siget, estadisticas_siget)
+
+
+def version_motor(modulos=MODULOS_MOTOR) -> str:
+    """Huella del formato de la caché y del código fuente de ``modulos``"""
+    huella = hashlib.blake2b(str(VERSION_FORMATO).encode(), digest_size=8)
+    for modulo in modulos:
+        with open(modulo.__file__, "rb") as archivo:
+            huella.update(archivo.read())
+    return huella.hexdigest()
+
+
+def huella_carga(procesos: Iterable[ProcesoSIGET]) -> str:
+    """Huella de los datos de entrada de los procesos, en su orden (los nombres no influyen)"""
+    enteros, tipos = array("q"), array("b")
+    for proceso in procesos:
+        enteros.extend((proceso.id, proceso.tiempo_irrupcion, proceso.tiempo_ejecucion,
+                        proceso.prioridad_alerta, proceso.tamaño_datos))
+        tipos.append(_CODIGO_TIPO[proceso.tipo])
+    huella = hashlib.blake2b(digest_size=16)
+    huella.update(enteros.tobytes())
+    huella.update(tipos.tobytes())
+    return huella.hexdigest()
+
+
+def clave_configuracion(huella: str, algoritmo: str, quantum: Optional[int],
+                        costo: Optional[CostoConmutacion] = None, espacio: str = "simulacion") -> str:
+    """Clave de una corrida; ``espacio`` separa resultados con formatos distintos"""
+    if not POLITICAS[algoritmo].usa_quantum:
+        quantum = None
+    if costo is not None:
+        costo = costo.firma()
+    texto = repr((espacio, huella, algoritmo, quantum, costo))
+    return hashlib.blake2b(texto.encode(), digest_size=16).hexdigest()
+
+
+class CacheResultados:
+    """LRU en memoria más, si se indica ``directorio``, un nivel en disco acotado por bytes"""
+
+    def __init__(self, directorio=None, max_entradas: int = 256, max_bytes: int = 256 * 2**20,
+                 version: Optional[str] = None):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.version = version or version_motor()
+        self._memoria: "OrderedDict[str, object]" = OrderedDict()
+        # Entradas en disco en orden de uso (la primera es la más vieja) y sus tamaños
+        self._disco: "OrderedDict[str, int]" = OrderedDict()
+        self.bytes_disco = 0
+        self.aciertos_memoria = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+        self.desalojos_disco = 0
+        self.directorio = None
+        if directorio is not None:
+            self._abrir_directorio(directorio)
+
+    def _abrir_directorio(self, raiz):
+        os.makedirs(raiz, exist_ok=True)
+        for nombre in os.listdir(raiz):
+            ruta = os.path.join(raiz, nombre)
+            if nombre != self.version and os.path.isdir(ruta):
+                shutil.rmtree(ruta, ignore_errors=True)
+        self.directorio = os.path.join(raiz, self.version)
+        os.makedirs(self.directorio, exist_ok=True)
+        entradas = []
+        for entrada in os.scandir(self.directorio):
+            if entrada.name.endswith(".pkl"):
+                informacion = entrada.stat()
+                entradas.append((informacion.st_mtime, entrada.name[:-4], informacion.st_size))
+        for _, clave, tamaño in sorted(entradas):
+            self._disco[clave] = tamaño
+            self.bytes_disco += tamaño
+        self._desalojar_disco()
+
+    def _ruta(self, clave: str) -> str:
+        return os.path.join(self.directorio, clave + ".pkl")
+
+    def _recordar(self, clave: str, valor):
+        self._memoria[clave] = valor
+        self._memoria.move_to_end(clave)
+        while len(self._memoria) > self.max_entradas:
+            self._memoria.popitem(last=False)
+
+    def obtener(self, clave: str, defecto=None):
+        """El valor guardado con ``clave`` o ``defecto``; cuenta aciertos y fallos"""
+        valor = self._memoria.get(clave, _FALTA)
+        if valor is not _FALTA:
+            self._memoria.move_to_end(clave)
+            self.aciertos_memoria += 1
+            return valor
+        if clave in self._disco:
+            try:
+                with open(self._ruta(clave), "rb") as archivo:
+                    valor = pickle.load(archivo)
+            except (OSError, EOFError, pickle.UnpicklingError):
+                self.bytes_disco -= self._disco.pop(clave)
+            else:
+                self._disco.move_to_end(clave)
+                os.utime(self._ruta(clave))
+                self._recordar(clave, valor)
+                self.aciertos_disco += 1
+                return valor
+        self.fallos += 1
+        return defecto
+
+    def guardar(self, clave: str, valor):
+        self._recordar(clave, valor)
+        if self.directorio is None:
+            return
+        # Escritura atómica: nunca queda una entrada a medio escribir
+        descriptor, temporal = tempfile.mkstemp(dir=self.directorio, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as archivo:
+            pickle.dump(valor, archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, self._ruta(clave))
+        tamaño = os.path.getsize(self._ruta(clave))
+        self.bytes_disco += tamaño - self._disco.pop(clave, 0)
+        self._disco[clave] = tamaño
+        self._desalojar_disco()
+
+    def _desalojar_disco(self):
+        while self.bytes_disco > self.max_bytes and self._disco:
+            clave, tamaño = self._disco.popitem(last=False)
+            self.bytes_disco -= tamaño
+            self.desalojos_disco += 1
+            try:
+                os.remove(self._ruta(clave))
+            except OSError:
+                pass
+
+    def obtener_o_calcular(self, clave: str, calcular: Callable[[], object]):
+        valor = self.obtener(clave, _FALTA)
+        if valor is _FALTA:
+            valor = calcular()
+            self.guardar(clave, valor)
+        return valor
+
+    def limpiar(self):
+        """Vacía ambos niveles (los contadores se conservan)"""
+        self._memoria.clear()
+        while self._disco:
+            clave, _ = self._disco.popitem()
+            try:
+                os.remove(self._ruta(clave))
+            except OSError:
+                pass
+        self.bytes_disco = 0
+
+    @property
+    def aciertos(self) -> int:
+        return self.aciertos_memoria + self.aciertos_disco
+
+    @property
+    def tasa_aciertos(self) -> float:
+        consultas = self.aciertos + self.fallos
+        return self.aciertos / consultas if consultas else 0.0
+
+    def estadisticas(self) -> Dict[str, object]:
+        return {
+            "aciertos_memoria": self.aciertos_memoria,
+            "aciertos_disco": self.aciertos_disco,
+            "fallos": self.fallos,
+            "tasa_aciertos": self.tasa_aciertos,
+            "entradas_memoria": len(self._memoria),
+            "entradas_disco": len(self._disco),
+            "bytes_disco": self.bytes_disco,
+            "desalojos_disco": self.desalojos_disco,
+        }
+
+
+_METRICAS = ("tiempo_actual", "despachos", "cantidad_admitidos", "cantidad_terminados",
+             "cambios_contexto", "tiempo_sobrecarga", "tiempo_util")
+
+
+def _guardar_linea(linea_tiempo: LineaTiempo) -> dict:
+    return {cpu: (pista.pid.tobytes(), pista.inicio.tobytes(), pista.fin.tobytes())
+            for cpu, pista in linea_tiempo.pistas.items()}
+
+
+def _cargar_linea(linea_tiempo: LineaTiempo, guardada: dict):
+    linea_tiempo.limpiar()
+    for cpu, columnas in guardada.items():
+        pista = linea_tiempo.pista(cpu)
+        for columna, datos in zip((pista.pid, pista.inicio, pista.fin), columnas):
+            columna.frombytes(datos)
+
+
+def simular_con_cache(simulador: SimuladorSIGET, cache: CacheResultados, callback_actualizacion=None) -> bool:
+    """``simulador.ejecutar_simulacion()`` salvo que la corrida ya esté en la caché.
+
+    En un acierto se reinicia el simulador y se aplican los tiempos de cada
+    proceso, el orden de terminación, las métricas y, si se pide, la línea
+    de tiempo guardados (también se alimentan ``estadisticas``, y
+    ``cambios`` recibe todos los procesos al reiniciar); el callback se
+    llama una vez al final. Devuelve True si hubo acierto. Solo el motor
+    base sin ``instrumentacion`` usa la caché; el resto simula siempre.
+    """
+    if type(simulador) is not SimuladorSIGET or simulador.instrumentacion is not None:
+        simulador.ejecutar_simulacion(callback_actualizacion)
+        return False
+
+    procesos = simulador.procesos
+    linea_tiempo = simulador.linea_tiempo
+    clave = clave_configuracion(huella_carga(procesos), simulador.algoritmo_actual, simulador.quantum,
+                                simulador.costo_conmutacion)
+    resultado = cache.obtener(clave)
+    if resultado is None or (linea_tiempo is not None and "linea_tiempo" not in resultado):
+        simulador.ejecutar_simulacion(callback_actualizacion)
+        posicion = {id(proceso): indice for indice, proceso in enumerate(procesos)}
+        resultado = {
+            "tiempos": [(p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera, p.tiempo_respuesta) for p in procesos],
+            "orden": [posicion[id(p)] for p in simulador.procesos_terminados],
+            "metricas": {nombre: getattr(simulador, nombre) for nombre in _METRICAS},
+        }
+        if linea_tiempo is not None:
+            resultado["linea_tiempo"] = _guardar_linea(linea_tiempo)
+        cache.guardar(clave, resultado)
+        return False
+
+    simulador.resetear_simulacion()
+    for proceso, (inicio, fin, espera, respuesta) in zip(procesos, resultado["tiempos"]):
+        proceso.estado = EstadoProceso.TERMINADO
+        proceso.tiempo_restante = 0
+        proceso.tiempo_inicio = inicio
+        proceso.tiempo_fin = fin
+        proceso.tiempo_espera = espera
+        proceso.tiempo_respuesta = respuesta
+    simulador.procesos_terminados = [procesos[indice] for indice in resultado["orden"]]
+    if simulador.estadisticas is not None:
+        for proceso in simulador.procesos_terminados:
+            simulador.estadisticas.registrar(proceso)
+    for nombre, valor in resultado["metricas"].items():
+        setattr(simulador, nombre, valor)
+    if linea_tiempo is not None:
+        _cargar_linea(linea_tiempo, resultado["linea_tiempo"])
+    if callback_actualizacion:
+        callback_actualizacion()
+    return True
@@ -0,0 +1,118 @@
+"""
+Canal de instantáneas entre el hilo de la simulación y la interfaz.
+
+El motor publica, desde su propio hilo, instantáneas inmutables y
+versionadas del estado; la interfaz toma siempre la más reciente y descarta
+las intermedias. El canal guarda una sola referencia, cuya asignación es
+atómica en CPython, así que no hay bloqueos: el motor nunca espera a la
+interfaz y la interfaz nunca recorre las listas vivas del simulador.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
+
+from estadisticas_siget import EstadisticasSimulacion
+from nucleo_siget import EstadoProceso, ProcesoSIGET, SimuladorSIGET
+
+# (id, nombre, tipo, irrupción, ejecución, prioridad, tamaño, estado,
+#  restante, espera acumulada, listo desde): la espera en vivo se obtiene con
+#  espera_de_fila(fila, tiempo)
+Fila = Tuple
+
+
+@dataclass(frozen=True)
+class InstantaneaSimulacion:
+    """Estado de la simulación en un instante; no cambia una vez publicada"""
+    version: int
+    tiempo: int
+    ejecutando: bool
+    proceso_actual: Optional[str]
+    conteos: Mapping[EstadoProceso, int]
+    # Diferencia de conteos respecto de la última instantánea consumida
+    deltas: Mapping[EstadoProceso, int]
+    # Filas que cambiaron desde la última instantánea consumida, por id
+    filas: Mapping[int, Fila]
+    total_procesos: int
+    espera_promedio: float
+    respuesta_promedio: float
+    # EstadisticasSimulacion.resumen() al momento de publicar
+    estadisticas: Mapping[str, object]
+
+
+def fila_de_proceso(proceso: ProcesoSIGET) -> Fila:
+    return (proceso.id, proceso.nombre, proceso.tipo.value, proceso.tiempo_irrupcion,
+            proceso.tiempo_ejecucion, proceso.prioridad_alerta, proceso.tamaño_datos,
+            proceso.estado, proceso.tiempo_restante, proceso.tiempo_espera, proceso.listo_desde)
+
+
+def espera_de_fila(fila: Fila, tiempo: int) -> int:
+    """Tiempo de espera de la fila en ``tiempo`` (igual que ``ProcesoSIGET.espera_en``)"""
+    espera, listo_desde = fila[9], fila[10]
+    return espera if listo_desde is None else espera + tiempo - listo_desde
+
+
+class CanalInstantaneas:
+    """Canal de un solo lugar: ``publicar`` en el hilo del motor, ``recibir`` en el de Tk"""
+    
+    def __init__(self):
+        self._ultima: Optional[InstantaneaSimulacion] = None
+        self._consumida: Optional[InstantaneaSimulacion] = None
+        self._version = 0
+    
+    def conectar(self, simulador: SimuladorSIGET):
+        """Activa el registro de cambios y de estadísticas del motor; llamar antes de ejecutar"""
+        simulador.cambios = []
+        if simulador.estadisticas is None:
+            simulador.estadisticas = EstadisticasSimulacion()
+    
+    def publicar(self, simulador: SimuladorSIGET) -> InstantaneaSimulacion:
+        """Arma y publica una instantánea; se llama desde el callback del motor.
+
+        Cuesta O(procesos cambiados): las filas se toman de
+        ``simulador.cambios`` y se combinan con las de la instantánea anterior
+        si la interfaz todavía no la consumió, así no se pierde ningún cambio.
+        """
+        filas = {}
+        pendiente = self._ultima
+        if pendiente is not None and pendiente is not self._consumida:
+            filas.update(pendiente.filas)
+        
+        if simulador.cambios is not None:
+            for proceso in simulador.cambios:
+                filas[proceso.id] = fila_de_proceso(proceso)
+            simulador.cambios.clear()
+        
+        total = len(simulador.procesos) or simulador.cantidad_admitidos
+        en_ejecucion = 1 if simulador.proceso_actual is not None else 0
+        conteos = {
+            EstadoProceso.NUEVO: total - simulador.cantidad_admitidos,
+            EstadoProceso.LISTO: len(simulador.cola_listos),
+            EstadoProceso.EN_EJECUCION: en_ejecucion,
+            EstadoProceso.BLOQUEADO: simulador.cantidad_bloqueados,
+            EstadoProceso.TERMINADO: simulador.cantidad_terminados,
+        }
+        base = self._consumida.conteos if self._consumida is not None else {}
+        deltas = {estado: cantidad - base.get(estado, 0) for estado, cantidad in conteos.items()}
+        
+        self._version += 1
+        # Lecturas O(1): el motor actualiza las estadísticas en cada terminación
+        estadisticas = simulador.estadisticas
+        resumen = estadisticas.resumen() if estadisticas is not None else {}
+        espera = estadisticas.total["espera"].media if estadisticas is not None else 0.0
+        respuesta = estadisticas.total["respuesta"].media if estadisticas is not None else 0.0
+        instantanea = InstantaneaSimulacion(
+            self._version, simulador.tiempo_actual, simulador.ejecutando,
+            simulador.proceso_actual.nombre if simulador.proceso_actual is not None else None,
+            MappingProxyType(conteos), MappingProxyType(deltas), MappingProxyType(filas), total,
+            espera, respuesta, MappingProxyType(resumen))
+        self._ultima = instantanea
+        return instantanea
+    
+    def recibir(self) -> Optional[InstantaneaSimulacion]:
+        """Devuelve la instantánea más reciente no vista, o None si no hay novedades"""
+        instantanea = self._ultima
+        if instantanea is None or instantanea is self._consumida:
+            return None
+        self._consumida = instantanea
+        return instantanea
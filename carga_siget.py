@@ -0,0 +1,114 @@
+"""
+Carga de trazas de procesos SIGET desde CSV y JSONL en modo streaming.
+
+Los lectores son generadores: entregan ``ProcesoSIGET`` de a uno, en orden
+de ``tiempo_irrupcion``, sin leer el archivo completo. Pensado para
+alimentar ``SimuladorSIGET.ejecutar_flujo``.
+
+Columnas (CSV) o claves (JSONL): id, nombre (opcional), tipo,
+tiempo_irrupcion, tiempo_ejecucion, prioridad_alerta, tamaño_datos. El tipo
+acepta el nombre del enum (``MONITOREO_TRAFICO``) o su valor
+(``Monitoreo de Tráfico``).
+"""
+
+import csv
+import heapq
+import json
+from itertools import count
+from typing import Iterable, Iterator, Mapping
+
+from nucleo_siget import ProcesoSIGET, TipoProceso
+
+CAMPOS = ("id", "nombre", "tipo", "tiempo_irrupcion", "tiempo_ejecucion",
+          "prioridad_alerta", "tamaño_datos")
+
+_TIPOS_POR_TEXTO = {**{tipo.name: tipo for tipo in TipoProceso},
+                    **{tipo.value: tipo for tipo in TipoProceso}}
+
+
+def proceso_desde_registro(registro: Mapping) -> ProcesoSIGET:
+    """Convierte una fila de CSV o un objeto JSON en ``ProcesoSIGET``"""
+    try:
+        tipo = _TIPOS_POR_TEXTO[registro["tipo"]]
+    except KeyError as error:
+        raise ValueError(f"Tipo de proceso desconocido en {dict(registro)}") from error
+    id_ = int(registro["id"])
+    ejecucion = int(registro["tiempo_ejecucion"])
+    return ProcesoSIGET(id_, registro.get("nombre") or f"P{id_}", tipo,
+                        int(registro["tiempo_irrupcion"]), ejecucion,
+                        int(registro["prioridad_alerta"]), int(registro["tamaño_datos"]),
+                        tiempo_restante=ejecucion)
+
+
+def ordenar_llegadas(procesos: Iterable[ProcesoSIGET], ventana: int = 0) -> Iterator[ProcesoSIGET]:
+    """Entrega los procesos en orden de ``tiempo_irrupcion``.
+
+    Con ``ventana=0`` exige que la entrada ya esté ordenada y lanza
+    ``ValueError`` en el primer proceso fuera de orden. Con ``ventana > 0``
+    reordena con un montículo de a lo sumo ``ventana`` procesos; un proceso
+    que llega más atrasado que eso también lanza ``ValueError``.
+    """
+    ultimo = None
+    if ventana <= 0:
+        for posicion, proceso in enumerate(procesos):
+            if ultimo is not None and proceso.tiempo_irrupcion < ultimo:
+                raise ValueError(f"Proceso {proceso.id} (registro {posicion}) fuera de orden: "
+                                 f"llega en {proceso.tiempo_irrupcion} después de {ultimo}")
+            ultimo = proceso.tiempo_irrupcion
+            yield proceso
+        return
+    
+    pendientes = []
+    secuencia = count()
+    for proceso in procesos:
+        if ultimo is not None and proceso.tiempo_irrupcion < ultimo:
+            raise ValueError(f"Proceso {proceso.id} llega en {proceso.tiempo_irrupcion}, "
+                             f"más atrasado que la ventana de {ventana} (ya se entregó {ultimo})")
+        heapq.heappush(pendientes, (proceso.tiempo_irrupcion, next(secuencia), proceso))
+        if len(pendientes) > ventana:
+            ultimo, _, siguiente = heapq.heappop(pendientes)
+            yield siguiente
+    while pendientes:
+        yield heapq.heappop(pendientes)[-1]
+
+
+def leer_csv(ruta, ventana: int = 0) -> Iterator[ProcesoSIGET]:
+    """Lee una traza CSV con encabezado y la entrega ordenada por llegada"""
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        yield from ordenar_llegadas(map(proceso_desde_registro, csv.DictReader(archivo)), ventana)
+
+
+def leer_jsonl(ruta, ventana: int = 0) -> Iterator[ProcesoSIGET]:
+    """Lee una traza JSONL (un objeto por línea) y la entrega ordenada por llegada"""
+    with open(ruta, encoding="utf-8") as archivo:
+        registros = (json.loads(linea) for linea in archivo if linea.strip())
+        yield from ordenar_llegadas(map(proceso_desde_registro, registros), ventana)
+
+
+def leer_traza(ruta, ventana: int = 0) -> Iterator[ProcesoSIGET]:
+    """Elige el lector por la extensión del archivo (.csv o .jsonl)"""
+    if str(ruta).endswith((".jsonl", ".ndjson")):
+        return leer_jsonl(ruta, ventana)
+    return leer_csv(ruta, ventana)
+
+
+def _registro(proceso: ProcesoSIGET) -> dict:
+    return {"id": proceso.id, "nombre": proceso.nombre, "tipo": proceso.tipo.name,
+            "tiempo_irrupcion": proceso.tiempo_irrupcion, "tiempo_ejecucion": proceso.tiempo_ejecucion,
+            "prioridad_alerta": proceso.prioridad_alerta, "tamaño_datos": proceso.tamaño_datos}
+
+
+def escribir_csv(ruta, procesos: Iterable[ProcesoSIGET]):
+    """Guarda procesos como traza CSV"""
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=CAMPOS)
+        escritor.writeheader()
+        for proceso in procesos:
+            escritor.writerow(_registro(proceso))
+
+
+def escribir_jsonl(ruta, procesos: Iterable[ProcesoSIGET]):
+    """Guarda procesos como traza JSONL"""
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        for proceso in procesos:
+            archivo.write(json.dumps(_registro(proceso), ensure_ascii=False) + "\n")
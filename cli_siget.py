@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Corrida del SIGET sin interfaz, con salida legible por máquinas.
+
+No importa tkinter: sirve en servidores sin pantalla, y NumPy y la traza
+binaria se importan solo si se usan, para arrancar rápido. La carga sale de
+una traza (CSV, JSONL o binaria de ``traza_siget``) o de un generador; los
+procesos terminados se escriben en flujo como CSV, JSONL o un arreglo JSON,
+o al final como columnas ``.npz`` (NumPy), y las métricas agregadas como
+JSON. Ejemplos:
+
+    python cli_siget.py --traza carga.csv --algoritmo SRTF --salida resultados.csv
+    python cli_siget.py --generador sintetico --procesos 1000000 --algoritmo "Round Robin" \\
+        --quantum 4 --salida resultados.npz --resumen resumen.json
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import sys
+import time
+from array import array
+from typing import Dict, Iterator
+
+import instrumentacion_siget
+from carga_siget import leer_traza
+from estadisticas_siget import EstadisticasSimulacion
+from linea_tiempo_siget import LineaTiempo
+from nucleo_siget import (POLITICAS, CostoConmutacion, ProcesoSIGET, SimuladorSIGET, TipoProceso,
+                          iterar_procesos_aleatorios)
+
+CAMPOS_RESULTADO = ("id", "nombre", "tipo", "prioridad_alerta", "tamaño_datos", "tiempo_irrupcion",
+                    "tiempo_ejecucion", "tiempo_inicio", "tiempo_fin", "tiempo_espera", "tiempo_respuesta")
+
+_TIPOS = tuple(TipoProceso)
+_CODIGO_TIPO = {tipo: codigo for codigo, tipo in enumerate(_TIPOS)}
+
+
+def _fila(proceso: ProcesoSIGET) -> tuple:
+    return (proceso.id, proceso.nombre, proceso.tipo.name, proceso.prioridad_alerta, proceso.tamaño_datos,
+            proceso.tiempo_irrupcion, proceso.tiempo_ejecucion, proceso.tiempo_inicio, proceso.tiempo_fin,
+            proceso.tiempo_espera, proceso.tiempo_respuesta)
+
+
+class EscritorCSV:
+    """Un proceso terminado por fila, con encabezado ``CAMPOS_RESULTADO``"""
+
+    def __init__(self, ruta):
+        self._archivo = open(ruta, "w", newline="", encoding="utf-8")
+        self._escritor = csv.writer(self._archivo)
+        self._escritor.writerow(CAMPOS_RESULTADO)
+
+    def agregar(self, proceso: ProcesoSIGET):
+        self._escritor.writerow(_fila(proceso))
+
+    def cerrar(self):
+        self._archivo.close()
+
+
+class EscritorJSONL:
+    """Un objeto JSON por línea y por proceso terminado"""
+
+    def __init__(self, ruta):
+        self._archivo = open(ruta, "w", encoding="utf-8")
+
+    def agregar(self, proceso: ProcesoSIGET):
+        self._archivo.write(json.dumps(dict(zip(CAMPOS_RESULTADO, _fila(proceso))), ensure_ascii=False) + "\n")
+
+    def cerrar(self):
+        self._archivo.close()
+
+
+class EscritorJSON:
+    """Un documento JSON: un arreglo con un objeto por proceso terminado, escrito en flujo"""
+
+    def __init__(self, ruta):
+        self._archivo = open(ruta, "w", encoding="utf-8")
+        self._archivo.write("[")
+        self._separador = "\n"
+
+    def agregar(self, proceso: ProcesoSIGET):
+        self._archivo.write(self._separador + json.dumps(dict(zip(CAMPOS_RESULTADO, _fila(proceso))),
+                                                         ensure_ascii=False))
+        self._separador = ",\n"
+
+    def cerrar(self):
+        self._archivo.write("\n]\n")
+        self._archivo.close()
+
+
+class EscritorColumnas:
+    """Columnas tipadas en un ``.npz`` (``numpy.load``, pandas); requiere NumPy al cerrar.
+
+    Los resultados se acumulan en ``array`` (8 bytes por valor, 1 para tipo y
+    prioridad) y se vuelcan sin copiar. El tipo se guarda como su posición en
+    ``TipoProceso`` y el nombre no se guarda (se deriva del id).
+    """
+
+    CODIGOS = {"id": "q", "tipo": "b", "prioridad_alerta": "b", "tamaño_datos": "q",
+               "tiempo_irrupcion": "q", "tiempo_ejecucion": "q", "tiempo_inicio": "q",
+               "tiempo_fin": "q", "tiempo_espera": "q", "tiempo_respuesta": "q"}
+
+    def __init__(self, ruta):
+        self._ruta = ruta
+        self.columnas: Dict[str, array] = {nombre: array(codigo) for nombre, codigo in self.CODIGOS.items()}
+
+    def agregar(self, proceso: ProcesoSIGET):
+        columnas = self.columnas
+        columnas["id"].append(proceso.id)
+        columnas["tipo"].append(_CODIGO_TIPO[proceso.tipo])
+        columnas["prioridad_alerta"].append(proceso.prioridad_alerta)
+        columnas["tamaño_datos"].append(proceso.tamaño_datos)
+        columnas["tiempo_irrupcion"].append(proceso.tiempo_irrupcion)
+        columnas["tiempo_ejecucion"].append(proceso.tiempo_ejecucion)
+        columnas["tiempo_inicio"].append(proceso.tiempo_inicio)
+        columnas["tiempo_fin"].append(proceso.tiempo_fin)
+        columnas["tiempo_espera"].append(proceso.tiempo_espera)
+        columnas["tiempo_respuesta"].append(proceso.tiempo_respuesta)
+
+    def cerrar(self):
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError("La salida en columnas requiere NumPy (pip install numpy)") from None
+        np.savez(self._ruta, **{nombre: np.frombuffer(columna, dtype=columna.typecode)
+                                for nombre, columna in self.columnas.items()})
+
+
+FORMATOS = {"csv": EscritorCSV, "jsonl": EscritorJSONL, "json": EscritorJSON, "columnas": EscritorColumnas}
+
+
+def formato_por_extension(ruta: str) -> str:
+    # .json es un documento JSON, como en --linea-tiempo; JSON por líneas es .jsonl
+    if ruta.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if ruta.endswith(".json"):
+        return "json"
+    if ruta.endswith(".npz"):
+        return "columnas"
+    return "csv"
+
+
+@contextlib.contextmanager
+def abrir_fuente(args) -> Iterator[Iterator[ProcesoSIGET]]:
+    """Procesos ordenados por llegada según ``--traza`` o ``--generador``.
+
+    Es un administrador de contexto: al salir cierra el generador y, si la
+    traza es binaria, su mapa de memoria y su archivo.
+    """
+    if args.traza:
+        from traza_siget import MAGIA, TrazaBinaria
+        with open(args.traza, "rb") as archivo:
+            binaria = archivo.read(len(MAGIA)) == MAGIA
+        if binaria:
+            with TrazaBinaria(args.traza) as traza:
+                # El generador retiene vistas del mapa: se cierra antes que la traza
+                with contextlib.closing(traza.procesos()) as procesos:
+                    yield procesos
+            return
+        fuente = leer_traza(args.traza, args.ventana)
+    elif args.generador == "sintetico":
+        from generador_siget import generar_columnas, iterar_procesos
+        fuente = iterar_procesos(generar_columnas(args.procesos, args.semilla))
+    else:
+        fuente = iterar_procesos_aleatorios(args.procesos, args.semilla, args.carga)
+    with contextlib.closing(fuente):
+        yield fuente
+
+
+def resumen_corrida(simulador: SimuladorSIGET, segundos: float) -> Dict[str, object]:
+    """Métricas agregadas de la corrida, serializables como JSON"""
+    return {
+        "algoritmo": simulador.algoritmo_actual,
+        "quantum": simulador.quantum if POLITICAS[simulador.algoritmo_actual].usa_quantum else None,
+        "procesos": simulador.cantidad_terminados,
+        "tiempo_total": simulador.tiempo_actual,
+        "despachos": simulador.despachos,
+        "cambios_contexto": simulador.cambios_contexto,
+        "tiempo_sobrecarga": simulador.tiempo_sobrecarga,
+        "eficiencia_cpu": simulador.eficiencia_cpu,
+        "segundos": segundos,
+        "procesos_por_segundo": simulador.cantidad_terminados / segundos if segundos else 0.0,
+        "estadisticas": simulador.estadisticas.resumen(),
+    }
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Corrida del simulador SIGET sin interfaz gráfica")
+    fuente = parser.add_mutually_exclusive_group()
+    fuente.add_argument("--traza", help="traza de entrada: CSV, JSONL o binaria (traza_siget)")
+    fuente.add_argument("--generador", choices=("aleatorio", "sintetico"), default="aleatorio",
+                        help="carga generada si no hay traza (sintetico: generador_siget, requiere NumPy)")
+    parser.add_argument("--ventana", type=int, default=0,
+                        help="ventana de reordenamiento para trazas CSV/JSONL casi ordenadas")
+    parser.add_argument("--procesos", type=int, default=10000)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--carga", type=float, default=0.9, help="utilización objetivo del generador aleatorio")
+    parser.add_argument("--algoritmo", choices=list(POLITICAS), default="FIFO")
+    parser.add_argument("--quantum", type=int, default=2)
+    parser.add_argument("--costo-contexto", type=int, default=0,
+                        help="unidades de tiempo por cambio de contexto")
+    parser.add_argument("--costo-despacho", type=int, default=0,
+                        help="unidades de tiempo por despacho")
+    parser.add_argument("--salida", help="resultados por proceso (.csv, .jsonl, .json o .npz)")
+    parser.add_argument("--formato", choices=list(FORMATOS),
+                        help="formato de --salida (por defecto, según la extensión)")
+    parser.add_argument("--resumen", help="métricas agregadas en JSON (por defecto, a la salida estándar)")
+    parser.add_argument("--linea-tiempo", metavar="RUTA",
+                        help="segmentos de ejecución para Gantt: .csv, o traza de Chrome si es .json")
+    instrumentacion_siget.agregar_argumentos(parser)
+    return parser
+
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+
+    simulador = SimuladorSIGET()
+    simulador.algoritmo_actual = args.algoritmo
+    simulador.quantum = args.quantum
+    simulador.estadisticas = EstadisticasSimulacion()
+    if args.costo_contexto or args.costo_despacho:
+        simulador.costo_conmutacion = CostoConmutacion(args.costo_contexto, args.costo_despacho)
+    if args.linea_tiempo:
+        simulador.linea_tiempo = LineaTiempo()
+    instrumentacion = instrumentacion_siget.desde_argumentos(args)
+    simulador.instrumentacion = instrumentacion
+
+    escritor = None
+    if args.salida:
+        escritor = FORMATOS[args.formato or formato_por_extension(args.salida)](args.salida)
+    inicio = time.perf_counter()
+    try:
+        with abrir_fuente(args) as fuente:
+            simulador.ejecutar_flujo(fuente, al_terminar=escritor.agregar if escritor is not None else None)
+    finally:
+        if escritor is not None:
+            escritor.cerrar()
+    resumen = resumen_corrida(simulador, time.perf_counter() - inicio)
+
+    # La salida estándar queda reservada para el JSON del resumen
+    with contextlib.redirect_stdout(sys.stderr):
+        if instrumentacion is not None:
+            instrumentacion_siget.exportar_segun_argumentos(instrumentacion, args)
+        if args.salida:
+            print(f"💾 Resultados por proceso en {args.salida}")
+        if args.linea_tiempo:
+            if args.linea_tiempo.endswith(".json"):
+                simulador.linea_tiempo.exportar_chrome(args.linea_tiempo)
+            else:
+                simulador.linea_tiempo.exportar_csv(args.linea_tiempo)
+            print(f"💾 Línea de tiempo en {args.linea_tiempo}")
+    if args.resumen:
+        with open(args.resumen, "w", encoding="utf-8") as archivo:
+            json.dump(resumen, archivo, indent=2, ensure_ascii=False)
+        print(f"💾 Resumen en {args.resumen}", file=sys.stderr)
+    else:
+        json.dump(resumen, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
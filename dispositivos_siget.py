@@ -0,0 +1,306 @@
+"""
+Modelo de entrada/salida del SIGET: transferencias de datos que bloquean procesos.
+
+Cada proceso reparte su ``tiempo_ejecucion`` en ``rafagas_es + 1`` tramos de
+CPU separados por ``rafagas_es`` transferencias que suman ``tamaño_datos``
+MB. Mientras transfiere, el proceso está BLOQUEADO en la cola de su
+dispositivo (asignado por ``TipoProceso``) y la CPU sigue con otros
+procesos. Cada dispositivo atiende una transferencia a la vez, en orden de
+llegada, a ``ancho_banda`` MB por unidad de tiempo (se toma la unidad de
+tiempo del simulador como un segundo). El costo de conmutación y la
+instrumentación no se modelan: asignarlos es un ``NotImplementedError``.
+"""
+
+import heapq
+import math
+from collections import deque
+from typing import Dict, Iterator, Optional
+
+from nucleo_siget import AlgoritmoPlanificacion, EstadoProceso, ProcesoSIGET, SimuladorSIGET, TipoProceso
+
+
+class DispositivoES:
+    """Dispositivo (enlace, disco) con su cola FIFO y sus métricas"""
+
+    def __init__(self, nombre: str, ancho_banda: float):
+        if ancho_banda <= 0:
+            raise ValueError(f"Ancho de banda inválido para {nombre!r}: {ancho_banda}")
+        self.nombre = nombre
+        self.ancho_banda = ancho_banda
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.cola = deque()  # (proceso, MB, bloqueado desde)
+        self.ocupado_hasta: Optional[int] = None
+        self.tiempo_ocupado = 0
+        self.mb_transferidos = 0.0
+        self.transferencias = 0
+        self.espera_cola = 0
+
+    def duracion(self, mb: float) -> int:
+        """Unidades de tiempo enteras que lleva transferir ``mb`` (al menos una si mb > 0)"""
+        return max(1, math.ceil(mb / self.ancho_banda)) if mb > 0 else 0
+
+    def utilizacion(self, makespan: int) -> float:
+        return self.tiempo_ocupado / makespan if makespan else 0.0
+
+    def rendimiento_mb_s(self, makespan: int) -> float:
+        """MB transferidos por segundo de simulación"""
+        return self.mb_transferidos / makespan if makespan else 0.0
+
+
+class SimuladorES(SimuladorSIGET):
+    """``SimuladorSIGET`` con transferencias de E/S que se solapan con la CPU.
+
+    ``dispositivos`` mapea nombre → ancho de banda (MB/s) y ``asignacion``
+    mapea ``TipoProceso`` → nombre de dispositivo; los tipos sin asignar
+    usan el primer dispositivo. Con ``rafagas_es = 0`` no hay E/S y los
+    resultados coinciden con ``SimuladorSIGET``.
+    """
+
+    def __init__(self, dispositivos: Optional[Dict[str, float]] = None,
+                 asignacion: Optional[Dict[TipoProceso, str]] = None, rafagas_es: int = 1):
+        super().__init__()
+        if dispositivos is None:
+            dispositivos = {"red": 100.0}
+        self.dispositivos = {nombre: DispositivoES(nombre, ancho) for nombre, ancho in dispositivos.items()}
+        asignacion = asignacion or {}
+        por_defecto = next(iter(self.dispositivos))
+        for nombre in asignacion.values():
+            if nombre not in self.dispositivos:
+                raise ValueError(f"Dispositivo desconocido: {nombre!r}")
+        self.asignacion = {tipo: asignacion.get(tipo, por_defecto) for tipo in TipoProceso}
+        self.rafagas_es = rafagas_es
+        self._reiniciar_metricas()
+
+    def _reiniciar_metricas(self):
+        self.cantidad_bloqueados = 0
+        self.tiempo_cpu_ocupada = 0
+        self.tiempo_es_ocupada = 0  # Al menos un dispositivo transfiriendo
+        self.tiempo_solapado = 0  # CPU y algún dispositivo ocupados a la vez
+        self.espera_es = 0  # Tiempo total bloqueado (cola + transferencia)
+        self.makespan = 0
+        for dispositivo in self.dispositivos.values():
+            dispositivo.reiniciar()
+
+    def resetear_simulacion(self):
+        super().resetear_simulacion()
+        self._reiniciar_metricas()
+
+    @property
+    def utilizacion_cpu(self) -> float:
+        return self.tiempo_cpu_ocupada / self.makespan if self.makespan else 0.0
+
+    def cuello_de_botella(self) -> str:
+        """"CPU" o el nombre del dispositivo con mayor utilización"""
+        candidatos = {"CPU": self.utilizacion_cpu}
+        for nombre, dispositivo in self.dispositivos.items():
+            candidatos[nombre] = dispositivo.utilizacion(self.makespan)
+        return max(candidatos, key=candidatos.get)
+
+    def resumen_es(self) -> Dict[str, object]:
+        """Métricas de CPU y E/S de la última corrida"""
+        return {
+            "makespan": self.makespan,
+            "utilizacion_cpu": self.utilizacion_cpu,
+            "tiempo_solapado": self.tiempo_solapado,
+            "solapamiento": self.tiempo_solapado / self.tiempo_es_ocupada if self.tiempo_es_ocupada else 0.0,
+            "espera_es": self.espera_es,
+            "cuello_de_botella": self.cuello_de_botella(),
+            "dispositivos": {
+                nombre: {
+                    "utilizacion": dispositivo.utilizacion(self.makespan),
+                    "mb_transferidos": dispositivo.mb_transferidos,
+                    "mb_s": dispositivo.rendimiento_mb_s(self.makespan),
+                    "transferencias": dispositivo.transferencias,
+                    "espera_cola": dispositivo.espera_cola,
+                }
+                for nombre, dispositivo in self.dispositivos.items()
+            },
+        }
+
+    def _simular(self, llegadas: Iterator[ProcesoSIGET], callback_actualizacion, al_terminar):
+        """Bucle de eventos: llegadas, fines de rebanada y fines de transferencia"""
+        # El costo de conmutación y la instrumentación solo los modela el motor base
+        self._rechazar_no_admitidos("costo_conmutacion", "instrumentacion")
+        self.ejecutando = True
+        politica = AlgoritmoPlanificacion.politica(self.algoritmo_actual)
+        usa_quantum = politica.usa_quantum
+        expropiativa = politica.expropiativa
+        clave = politica.clave
+        quantum = self.quantum
+        rafagas = self.rafagas_es
+        tramos = rafagas + 1
+        asignacion = {tipo: self.dispositivos[nombre] for tipo, nombre in self.asignacion.items()}
+
+        self.cola_listos = cola = politica.crear_cola()
+        agregar = cola.agregar
+        extraer = cola.extraer
+        cambios = self.cambios
+        estadisticas = self.estadisticas
+        pista = self.linea_tiempo.pista(0) if self.linea_tiempo is not None else None
+        # Ráfagas de E/S pendientes por identidad (los ids pueden repetirse), solo de no terminados
+        pendientes: Dict[int, int] = {}
+        fines_es = []  # (fin de transferencia, secuencia, dispositivo, proceso, bloqueado desde)
+        secuencia = 0
+        dispositivos_ocupados = 0
+
+        proxima = next(llegadas, None)
+        tiempo = self.tiempo_actual
+        despachos = admitidos = terminados = bloqueados = 0
+        cpu_ocupada = es_ocupada = solapado = espera_es = 0
+        proceso = None
+        inicio = fin_rebanada = 0
+
+        def iniciar_transferencia(dispositivo, desde):
+            nonlocal secuencia
+            bloqueado, mb, bloqueado_desde = dispositivo.cola.popleft()
+            fin = desde + dispositivo.duracion(mb)
+            dispositivo.ocupado_hasta = fin
+            dispositivo.espera_cola += desde - bloqueado_desde
+            dispositivo.tiempo_ocupado += fin - desde
+            dispositivo.mb_transferidos += mb
+            dispositivo.transferencias += 1
+            secuencia += 1
+            heapq.heappush(fines_es, (fin, secuencia, dispositivo, bloqueado, bloqueado_desde))
+
+        def terminar(terminado):
+            nonlocal terminados
+            terminado.estado = EstadoProceso.TERMINADO
+            terminado.tiempo_fin = tiempo
+            terminado.tiempo_respuesta = tiempo - terminado.tiempo_irrupcion
+            del pendientes[id(terminado)]
+            terminados += 1
+            if estadisticas is not None:
+                estadisticas.registrar(terminado)
+            if al_terminar is not None:
+                al_terminar(terminado)
+
+        while True:
+            # Punto de decisión: CPU libre o política expropiativa
+            if proceso is None or expropiativa:
+                while proxima is not None and proxima.tiempo_irrupcion <= tiempo:
+                    proxima.estado = EstadoProceso.LISTO
+                    proxima.listo_desde = tiempo
+                    agregar(proxima)
+                    admitidos += 1
+                    # Sin datos no hay nada que transferir
+                    pendientes[id(proxima)] = rafagas if proxima.tamaño_datos > 0 else 0
+                    if cambios is not None:
+                        cambios.append(proxima)
+                    proxima = next(llegadas, None)
+
+                if proceso is not None and cola and cola.clave_minima() < clave(proceso):
+                    proceso.estado = EstadoProceso.LISTO
+                    proceso.listo_desde = tiempo
+                    agregar(proceso)
+                    if cambios is not None:
+                        cambios.append(proceso)
+                    proceso = None
+
+                if proceso is None and cola:
+                    proceso = extraer()
+                    proceso.estado = EstadoProceso.EN_EJECUCION
+                    proceso.tiempo_espera += tiempo - proceso.listo_desde
+                    proceso.listo_desde = None
+                    if proceso.tiempo_inicio is None:
+                        proceso.tiempo_inicio = tiempo
+                    despachos += 1
+                    # La rebanada termina, a más tardar, en el próximo pedido de E/S
+                    frontera = proceso.tiempo_ejecucion * pendientes[id(proceso)] // tramos
+                    rebanada = proceso.tiempo_restante - frontera
+                    if usa_quantum and quantum < rebanada:
+                        rebanada = quantum
+                    inicio = tiempo
+                    fin_rebanada = tiempo + rebanada
+
+            # Próximo evento
+            siguiente = fin_rebanada if proceso is not None else None
+            if fines_es and (siguiente is None or fines_es[0][0] < siguiente):
+                siguiente = fines_es[0][0]
+            if proxima is not None and (proceso is None or expropiativa):
+                if siguiente is None or proxima.tiempo_irrupcion < siguiente:
+                    siguiente = proxima.tiempo_irrupcion
+            if siguiente is None:
+                break
+
+            transcurrido = siguiente - tiempo
+            if proceso is not None:
+                cpu_ocupada += transcurrido
+                if dispositivos_ocupados:
+                    solapado += transcurrido
+            if dispositivos_ocupados:
+                es_ocupada += transcurrido
+            tiempo = siguiente
+
+            # Fines de transferencia: el proceso vuelve a la cola de listos
+            while fines_es and fines_es[0][0] <= tiempo:
+                fin, _, dispositivo, desbloqueado, bloqueado_desde = heapq.heappop(fines_es)
+                espera_es += fin - bloqueado_desde
+                bloqueados -= 1
+                if cambios is not None:
+                    cambios.append(desbloqueado)
+                if desbloqueado.tiempo_restante <= 0 and not pendientes[id(desbloqueado)]:
+                    # La transferencia era lo último que le faltaba
+                    terminar(desbloqueado)
+                else:
+                    desbloqueado.estado = EstadoProceso.LISTO
+                    desbloqueado.listo_desde = fin
+                    agregar(desbloqueado)
+                if dispositivo.cola:
+                    iniciar_transferencia(dispositivo, fin)
+                else:
+                    dispositivo.ocupado_hasta = None
+                    dispositivos_ocupados -= 1
+
+            if proceso is not None:
+                proceso.tiempo_restante -= tiempo - inicio
+                if pista is not None and tiempo > inicio:
+                    pista.agregar(proceso.id, inicio, tiempo)
+                inicio = tiempo
+                if tiempo == fin_rebanada:
+                    if cambios is not None:
+                        cambios.append(proceso)
+                    pendiente = pendientes[id(proceso)]
+                    if pendiente and proceso.tiempo_restante == proceso.tiempo_ejecucion * pendiente // tramos:
+                        # Fin del tramo de CPU: pedir la transferencia siguiente
+                        pendientes[id(proceso)] -= 1
+                        proceso.estado = EstadoProceso.BLOQUEADO
+                        bloqueados += 1
+                        dispositivo = asignacion[proceso.tipo]
+                        dispositivo.cola.append((proceso, proceso.tamaño_datos / rafagas, tiempo))
+                        if dispositivo.ocupado_hasta is None:
+                            dispositivos_ocupados += 1
+                            iniciar_transferencia(dispositivo, tiempo)
+                    elif proceso.tiempo_restante <= 0:
+                        terminar(proceso)
+                    else:
+                        # Round Robin: vuelve al final de la cola
+                        proceso.estado = EstadoProceso.LISTO
+                        proceso.listo_desde = tiempo
+                        agregar(proceso)
+                    proceso = None
+
+            # Callback para actualizar la interfaz
+            if callback_actualizacion:
+                self.tiempo_actual = tiempo
+                self.proceso_actual = proceso
+                self.despachos = despachos
+                self.cantidad_admitidos = admitidos
+                self.cantidad_terminados = terminados
+                self.cantidad_bloqueados = bloqueados
+                callback_actualizacion()
+
+        self.tiempo_actual = self.makespan = tiempo
+        self.proceso_actual = None
+        self.despachos = despachos
+        self.cantidad_admitidos = admitidos
+        self.cantidad_terminados = terminados
+        self.cantidad_bloqueados = bloqueados
+        self.tiempo_cpu_ocupada = cpu_ocupada
+        self.tiempo_es_ocupada = es_ocupada
+        self.tiempo_solapado = solapado
+        self.espera_es = espera_es
+        self.ejecutando = False
+        if callback_actualizacion:
+            callback_actualizacion()
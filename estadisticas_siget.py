@@ -0,0 +1,187 @@
+"""
+Estadísticas incrementales de espera y respuesta.
+
+Cada terminación se registra una sola vez en O(1): media y varianza con el
+algoritmo de Welford, mínimo, máximo y percentiles p50/p95/p99 con el
+estimador P² de Jain y Chlamtac, que usa cinco marcadores por percentil en
+lugar de guardar las muestras. Leer un resumen también es O(1), así que la
+interfaz puede consultarlo en cada refresco sin recorrer los terminados.
+"""
+
+import math
+from typing import Dict, List, Sequence
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+
+class EstimadorP2:
+    """Percentil ``p`` en flujo con memoria constante (algoritmo P²)"""
+
+    __slots__ = ("p", "alturas", "posiciones", "deseadas", "incrementos")
+
+    def __init__(self, p: float):
+        self.p = p
+        # Hasta tener cinco muestras, ``alturas`` guarda las muestras tal cual
+        self.alturas: List[float] = []
+        self.posiciones = [0, 1, 2, 3, 4]
+        self.deseadas = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self.incrementos = (0.0, p / 2, p, (1 + p) / 2, 1.0)
+
+    def agregar(self, valor: float):
+        q = self.alturas
+        if len(q) < 5:
+            q.append(valor)
+            if len(q) == 5:
+                q.sort()
+            return
+
+        n = self.posiciones
+        if valor < q[0]:
+            q[0] = valor
+            k = 0
+        elif valor >= q[4]:
+            q[4] = valor
+            k = 3
+        else:
+            k = 0
+            while valor >= q[k + 1]:
+                k += 1
+        for i in range(k + 1, 5):
+            n[i] += 1
+        deseadas = self.deseadas
+        for i in range(5):
+            deseadas[i] += self.incrementos[i]
+
+        # Ajustar los marcadores centrales que se alejaron de su posición deseada
+        for i in (1, 2, 3):
+            d = deseadas[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                parabolica = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1]))
+                if q[i - 1] < parabolica < q[i + 1]:
+                    q[i] = parabolica
+                else:
+                    q[i] += d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                n[i] += d
+
+    def valor(self) -> float:
+        q = self.alturas
+        if not q:
+            return 0.0
+        if len(q) < 5:
+            ordenadas = sorted(q)
+            return ordenadas[round(self.p * (len(ordenadas) - 1))]
+        return q[2]
+
+
+class EstadisticaIncremental:
+    """Cantidad, media, varianza, extremos y percentiles de una métrica"""
+
+    __slots__ = ("cantidad", "suma", "_media", "_m2", "minimo", "maximo", "percentiles")
+
+    def __init__(self, percentiles: Sequence[float] = PERCENTILES):
+        self.cantidad = 0
+        # La media se informa como suma / cantidad, exacta para tiempos enteros;
+        # la media corrida de Welford solo se usa para la varianza
+        self.suma = 0
+        self._media = 0.0
+        self._m2 = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.percentiles = {p: EstimadorP2(p) for p in percentiles}
+
+    def agregar(self, valor: float):
+        self.cantidad += 1
+        self.suma += valor
+        delta = valor - self._media
+        self._media += delta / self.cantidad
+        self._m2 += delta * (valor - self._media)
+        if valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+        for estimador in self.percentiles.values():
+            estimador.agregar(valor)
+
+    @property
+    def media(self) -> float:
+        return self.suma / self.cantidad if self.cantidad else 0.0
+
+    @property
+    def varianza(self) -> float:
+        """Varianza muestral (0 con menos de dos muestras)"""
+        return self._m2 / (self.cantidad - 1) if self.cantidad > 1 else 0.0
+
+    @property
+    def desviacion(self) -> float:
+        return math.sqrt(self.varianza)
+
+    def percentil(self, p: float) -> float:
+        return self.percentiles[p].valor()
+
+    def resumen(self) -> Dict[str, float]:
+        resumen = {
+            "cantidad": self.cantidad,
+            "media": self.media,
+            "desviacion": self.desviacion,
+            "minimo": self.minimo if self.cantidad else 0,
+            "maximo": self.maximo if self.cantidad else 0,
+        }
+        for p, estimador in self.percentiles.items():
+            resumen[f"p{round(p * 100)}"] = estimador.valor()
+        return resumen
+
+
+class EstadisticasSimulacion:
+    """Espera y respuesta de los procesos terminados, en total y por tipo y prioridad.
+
+    Se asigna a ``SimuladorSIGET.estadisticas`` y el motor llama a
+    ``registrar`` una vez por terminación.
+    """
+
+    METRICAS = ("espera", "respuesta")
+
+    def __init__(self, percentiles: Sequence[float] = PERCENTILES):
+        self._percentiles = tuple(percentiles)
+        self.reiniciar()
+
+    def _grupo(self) -> Dict[str, EstadisticaIncremental]:
+        return {metrica: EstadisticaIncremental(self._percentiles) for metrica in self.METRICAS}
+
+    def reiniciar(self):
+        self.total = self._grupo()
+        self.por_tipo: Dict[object, Dict[str, EstadisticaIncremental]] = {}
+        self.por_prioridad: Dict[int, Dict[str, EstadisticaIncremental]] = {}
+
+    @property
+    def cantidad(self) -> int:
+        return self.total["espera"].cantidad
+
+    def registrar(self, proceso):
+        """Agrega un proceso terminado"""
+        espera = proceso.tiempo_espera
+        respuesta = proceso.tiempo_respuesta
+        grupos = (
+            self.total,
+            self.por_tipo.get(proceso.tipo) or self.por_tipo.setdefault(proceso.tipo, self._grupo()),
+            self.por_prioridad.get(proceso.prioridad_alerta)
+            or self.por_prioridad.setdefault(proceso.prioridad_alerta, self._grupo()),
+        )
+        for grupo in grupos:
+            grupo["espera"].agregar(espera)
+            grupo["respuesta"].agregar(respuesta)
+
+    def resumen(self) -> Dict[str, object]:
+        """Resumen anidado; cuesta O(tipos + prioridades), no O(procesos)"""
+        def resumir(grupo):
+            return {metrica: estadistica.resumen() for metrica, estadistica in grupo.items()}
+
+        return {
+            "total": resumir(self.total),
+            "por_tipo": {getattr(tipo, "value", tipo): resumir(grupo)
+                         for tipo, grupo in self.por_tipo.items()},
+            "por_prioridad": {prioridad: resumir(grupo)
+                              for prioridad, grupo in sorted(self.por_prioridad.items())},
+        }
@@ -0,0 +1,353 @@
+"""
+Capturas del estado completo del motor SIGET: pausa, rebobinado y ramas.
+
+``capturar(simulador)`` copia en columnas (``array``) el estado de una
+simulación en pausa (``SimuladorSIGET.ejecutar_hasta``) o terminada: reloj,
+contadores, cola de listos, proceso en ejecución y el estado de cada
+proceso. Una ``CapturaMotor`` no cambia una vez tomada:
+
+- ``restaurar(simulador)`` vuelve el simulador a la captura (rebobinar),
+  escribiendo sobre sus propios procesos si la carga es la misma.
+- ``bifurcar()`` crea un simulador nuevo que sigue desde la captura, con
+  copia al escribir: cada rama recibe procesos propios para los activos y
+  los pendientes (los que todavía puede modificar, ella o quien la edita) y
+  comparte con la captura y las demás ramas los terminados, creados una
+  sola vez. Los terminados compartidos son de solo lectura: se copian si la
+  rama se reinicia o al llamar ``SimuladorSIGET.descompartir``. Una rama
+  cuesta O(activos + pendientes) y no O(historia).
+- ``guardar(ruta)`` / ``cargar_captura(ruta)`` usan un formato binario
+  versionado.
+
+Disposición del archivo (little-endian):
+
+    encabezado (32 bytes)
+        magia        8s   b"SIGETEST"
+        versión      u16  VERSION
+        banderas     u16  bit 0: simulación en pausa
+        reservado    u32
+        cantidad     u64  número de procesos n
+        metadatos    u64  largo m del bloque de metadatos
+    metadatos: JSON en UTF-8 (m bytes) con reloj, contadores, configuración
+        y largos de la cola y de los terminados
+    columnas int64 × n: COLUMNAS_ENTEROS; int8 × n: COLUMNAS_CODIGOS
+    cola: posiciones, claves y secuencias, int64 × largo de la cola
+    terminados: posiciones en orden de terminación, int64
+    nombres: UTF-8 separados por "\\0"
+
+Los tiempos opcionales (None) se guardan como -1. Las estadísticas no se
+guardan: al restaurar se reconstruyen registrando los terminados en orden,
+lo que da el mismo resultado que durante la corrida. Cualquier cambio de
+disposición o de los códigos debe subir ``VERSION``.
+"""
+
+import copy
+import json
+import struct
+import sys
+from array import array
+from operator import attrgetter, itemgetter
+from typing import Dict, List, Optional
+
+from estadisticas_siget import EstadisticasSimulacion
+from incremental_siget import PuntoControl
+from nucleo_siget import POLITICAS, CostoConmutacion, EstadoProceso, ProcesoSIGET, SimuladorSIGET, TipoProceso
+
+MAGIA = b"SIGETEST"
+VERSION = 1
+ENCABEZADO = struct.Struct("<8sHHIQQ")
+BANDERA_PAUSADA = 0x1
+
+COLUMNAS_ENTEROS = ("id", "tiempo_irrupcion", "tiempo_ejecucion", "tamaño_datos", "tiempo_restante",
+                    "tiempo_espera", "listo_desde", "tiempo_inicio", "tiempo_fin", "tiempo_respuesta")
+COLUMNAS_CODIGOS = ("tipo", "prioridad_alerta", "estado")
+_OPCIONALES = ("listo_desde", "tiempo_inicio", "tiempo_fin")
+_CONTADORES = ("despachos", "cantidad_admitidos", "cantidad_terminados", "cambios_contexto",
+               "tiempo_sobrecarga", "tiempo_util")
+
+_TIPOS = tuple(TipoProceso)
+_ESTADOS = tuple(EstadoProceso)
+# Por id del miembro: los Enum calculan su hash en Python y el id es único
+_CODIGO_TIPO = {id(tipo): codigo for codigo, tipo in enumerate(_TIPOS)}
+_CODIGO_ESTADO = {id(estado): codigo for codigo, estado in enumerate(_ESTADOS)}
+
+
+def _columna_opcional(procesos: List[ProcesoSIGET], campo: str) -> array:
+    return array("q", [-1 if valor is None else valor for valor in map(attrgetter(campo), procesos)])
+
+
+def _codigos(procesos: List[ProcesoSIGET], campo: str, codigos: Dict[int, int]) -> array:
+    return array("b", map(codigos.__getitem__, map(id, map(attrgetter(campo), procesos))))
+
+
+class CapturaMotor:
+    """Estado de un ``SimuladorSIGET`` detenido; las posiciones se refieren a ``procesos``"""
+
+    def __init__(self, tiempo: int, contadores: tuple, algoritmo: str, quantum: int,
+                 costo: Optional[CostoConmutacion], columnas: Dict[str, array], nombres: List[str],
+                 pausada: bool, proceso: int, anterior: int, cola: array, claves: array,
+                 secuencias: array, secuencia: int, terminados: array,
+                 estadisticas: Optional[EstadisticasSimulacion] = None):
+        self.tiempo = tiempo
+        self.contadores = contadores  # Valores de _CONTADORES
+        self.algoritmo = algoritmo
+        self.quantum = quantum
+        self.costo = costo
+        self.columnas = columnas
+        self.nombres = nombres
+        self.pausada = pausada
+        self.proceso = proceso  # Posición del proceso en ejecución (-1: ninguno)
+        self.anterior = anterior  # Último despachado, para contar cambios de contexto
+        self.cola = cola
+        self.claves = claves  # Vacías si la cola es FIFO
+        self.secuencias = secuencias
+        self.secuencia = secuencia
+        self.terminados = terminados
+        self.estadisticas = estadisticas
+        # Procesos alineados con la captura: los terminados compartidos entre
+        # ramas y None en el lugar de los que cada rama crea (ver bifurcar)
+        self._plantillas: Optional[List[Optional[ProcesoSIGET]]] = None
+        self._ids_plantillas: Optional[frozenset] = None
+        self._propios: Optional[List[int]] = None
+
+    def __len__(self):
+        return len(self.nombres)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes de las columnas, la cola y los terminados (sin los nombres)"""
+        return sum(columna.itemsize * len(columna) for columna in (
+            *self.columnas.values(), self.cola, self.claves, self.secuencias, self.terminados))
+
+    def _materializar(self, indices: Optional[List[int]] = None) -> List[ProcesoSIGET]:
+        """Procesos nuevos con el estado de la captura (solo los de ``indices``, si se indican)"""
+        columnas = self.columnas
+        campos = (columnas["id"], self.nombres, columnas["tipo"], columnas["tiempo_irrupcion"],
+                  columnas["tiempo_ejecucion"], columnas["prioridad_alerta"], columnas["tamaño_datos"],
+                  columnas["estado"], columnas["tiempo_restante"], columnas["tiempo_espera"],
+                  columnas["tiempo_respuesta"], columnas["tiempo_inicio"], columnas["tiempo_fin"],
+                  columnas["listo_desde"])
+        if indices is not None:
+            campos = [list(map(campo.__getitem__, indices)) for campo in campos]
+        return [ProcesoSIGET(id_, nombre, _TIPOS[tipo], irrupcion, ejecucion, prioridad, tamaño, _ESTADOS[estado],
+                             restante, espera, respuesta, inicio if inicio >= 0 else None,
+                             fin if fin >= 0 else None, listo_desde if listo_desde >= 0 else None)
+                for (id_, nombre, tipo, irrupcion, ejecucion, prioridad, tamaño, estado, restante, espera,
+                     respuesta, inicio, fin, listo_desde) in zip(*campos)]
+
+    def _plantillas_compartidas(self) -> List[Optional[ProcesoSIGET]]:
+        """Terminados que comparten las ramas, creados con la primera; None en el resto"""
+        if self._plantillas is None:
+            terminado = _CODIGO_ESTADO[id(EstadoProceso.TERMINADO)]
+            estados = self.columnas["estado"]
+            compartidos = [indice for indice in range(len(self)) if estados[indice] == terminado]
+            self._plantillas = plantillas = [None] * len(self)
+            for indice, proceso in zip(compartidos, self._materializar(compartidos)):
+                plantillas[indice] = proceso
+            self._ids_plantillas = frozenset(id(proceso) for proceso in plantillas if proceso is not None)
+            self._propios = [indice for indice in range(len(self)) if estados[indice] != terminado]
+        return self._plantillas
+
+    def _cargar_en(self, simulador: SimuladorSIGET, procesos: List[ProcesoSIGET]):
+        """Reloj, contadores, cola y terminados sobre ``procesos`` (alineados con la captura)"""
+        simulador.procesos = procesos
+        simulador.algoritmo_actual = self.algoritmo
+        simulador.quantum = self.quantum
+        # Una copia por simulador: editar el costo en una rama no cambia las demás
+        simulador.costo_conmutacion = copy.deepcopy(self.costo)
+        simulador.tiempo_actual = self.tiempo
+        for nombre, valor in zip(_CONTADORES, self.contadores):
+            setattr(simulador, nombre, valor)
+        simulador.procesos_terminados = [procesos[indice] for indice in self.terminados]
+        simulador.proceso_actual = None
+        simulador.pausa = None
+        simulador.cola_listos = []
+        if self.pausada:
+            if POLITICAS[self.algoritmo].clave is None:
+                cola = tuple(procesos[indice] for indice in self.cola)
+            else:
+                cola = (tuple((clave, secuencia, procesos[indice]) for indice, clave, secuencia
+                              in zip(self.cola, self.claves, self.secuencias)), self.secuencia)
+            proceso = procesos[self.proceso] if self.proceso >= 0 else None
+            anterior = procesos[self.anterior] if self.anterior >= 0 else None
+            simulador.proceso_actual = proceso
+            simulador.cola_listos = POLITICAS[self.algoritmo].crear_cola()
+            simulador.cola_listos.restaurar(cola)
+            simulador.pausa = PuntoControl(self.tiempo, proceso, anterior, cola, self.contadores, ())
+        if simulador.estadisticas is not None or self.estadisticas is not None:
+            if self.estadisticas is not None:
+                simulador.estadisticas = copy.deepcopy(self.estadisticas)
+            else:
+                simulador.estadisticas.reiniciar()
+                for proceso in simulador.procesos_terminados:
+                    simulador.estadisticas.registrar(proceso)
+
+    def bifurcar(self) -> SimuladorSIGET:
+        """Simulador nuevo que continúa desde la captura (``ejecutar_hasta``).
+
+        Los procesos activos y pendientes son propios de la rama: editarlos o
+        agregar procesos (p. ej. un pico de incidentes) no afecta a la
+        captura ni a las otras ramas. Los terminados se comparten y son de
+        solo lectura hasta ``descompartir()``.
+        """
+        procesos = list(self._plantillas_compartidas())
+        propios = self._propios
+        for indice, proceso in zip(propios, self._materializar(propios)):
+            procesos[indice] = proceso
+        simulador = SimuladorSIGET()
+        self._cargar_en(simulador, procesos)
+        simulador.compartidos = self._ids_plantillas
+        return simulador
+
+    def restaurar(self, simulador: SimuladorSIGET):
+        """Vuelve ``simulador`` al estado de la captura.
+
+        Si sus procesos son los mismos (por id y en el mismo orden) se
+        reescribe su estado en el lugar; si no, se reemplazan por procesos
+        nuevos. La línea de tiempo se recorta al instante de la captura y los
+        puntos de control de ``incremental_siget`` se descartan.
+        """
+        if simulador.ejecutando:
+            raise RuntimeError("No se puede restaurar una simulación en curso")
+        simulador.descompartir()
+        procesos = simulador.procesos
+        columnas = self.columnas
+        if len(procesos) == len(self) and array("q", map(attrgetter("id"), procesos)) == columnas["id"]:
+            for proceso, estado, restante, espera, listo_desde, inicio, fin, respuesta in zip(
+                    procesos, columnas["estado"], columnas["tiempo_restante"], columnas["tiempo_espera"],
+                    columnas["listo_desde"], columnas["tiempo_inicio"], columnas["tiempo_fin"],
+                    columnas["tiempo_respuesta"]):
+                proceso.estado = _ESTADOS[estado]
+                proceso.tiempo_restante = restante
+                proceso.tiempo_espera = espera
+                proceso.listo_desde = listo_desde if listo_desde >= 0 else None
+                proceso.tiempo_inicio = inicio if inicio >= 0 else None
+                proceso.tiempo_fin = fin if fin >= 0 else None
+                proceso.tiempo_respuesta = respuesta
+        else:
+            procesos = self._materializar()
+        self._cargar_en(simulador, procesos)
+        if simulador.linea_tiempo is not None:
+            simulador.linea_tiempo.recortar(self.tiempo)
+        if simulador.puntos_control is not None:
+            simulador.puntos_control.limpiar()
+        if simulador.cambios is not None:
+            simulador.cambios.extend(procesos)
+
+    def guardar(self, ruta):
+        """Escribe la captura en el formato binario de ``VERSION``"""
+        if sys.byteorder != "little":
+            raise OSError("El formato binario SIGET requiere una máquina little-endian")
+        costo = None
+        if self.costo is not None:
+            costo = {"cambio_contexto": self.costo.cambio_contexto, "despacho": self.costo.despacho,
+                     "por_tipo": {tipo.name: valor for tipo, valor in self.costo.por_tipo.items()},
+                     "por_mb": self.costo.por_mb}
+        nombres = "\0".join(self.nombres).encode("utf-8")
+        metadatos = json.dumps({
+            "tiempo": self.tiempo, "contadores": list(self.contadores), "algoritmo": self.algoritmo,
+            "quantum": self.quantum, "costo": costo, "proceso": self.proceso, "anterior": self.anterior,
+            "secuencia": self.secuencia, "cola": len(self.cola),
+            "terminados": len(self.terminados), "nombres": len(nombres),
+        }, ensure_ascii=False).encode("utf-8")
+        banderas = BANDERA_PAUSADA if self.pausada else 0
+        with open(ruta, "wb") as archivo:
+            archivo.write(ENCABEZADO.pack(MAGIA, VERSION, banderas, 0, len(self), len(metadatos)))
+            archivo.write(metadatos)
+            for campo in COLUMNAS_ENTEROS + COLUMNAS_CODIGOS:
+                self.columnas[campo].tofile(archivo)
+            for columna in (self.cola, self.claves, self.secuencias, self.terminados):
+                columna.tofile(archivo)
+            archivo.write(nombres)
+
+
+def capturar(simulador: SimuladorSIGET) -> CapturaMotor:
+    """Captura el estado de ``simulador``, en pausa o detenido.
+
+    Solo el motor base; los procesos de la cola y los terminados deben
+    estar en ``simulador.procesos`` (no sirve tras ``ejecutar_flujo``).
+    """
+    if type(simulador) is not SimuladorSIGET:
+        raise TypeError(f"Las capturas no cubren el estado de {type(simulador).__name__}")
+    if simulador.ejecutando:
+        raise RuntimeError("No se puede capturar una simulación en curso")
+    procesos = simulador.procesos
+    posicion = dict(zip(map(id, procesos), range(len(procesos))))
+
+    def indices(lista) -> array:
+        try:
+            return array("q", map(posicion.__getitem__, map(id, lista)))
+        except KeyError:
+            raise ValueError("La cola o los terminados tienen procesos que no están en simulador.procesos") from None
+
+    columnas = {campo: (_columna_opcional(procesos, campo) if campo in _OPCIONALES
+                        else array("q", map(attrgetter(campo), procesos))) for campo in COLUMNAS_ENTEROS}
+    columnas["tipo"] = _codigos(procesos, "tipo", _CODIGO_TIPO)
+    columnas["prioridad_alerta"] = array("b", map(attrgetter("prioridad_alerta"), procesos))
+    columnas["estado"] = _codigos(procesos, "estado", _CODIGO_ESTADO)
+
+    pausa = simulador.pausa
+    cola, claves, secuencias = array("q"), array("q"), array("q")
+    secuencia = 0
+    proceso = anterior = -1
+    if pausa is not None:
+        proceso, anterior = (indices([actual])[0] if actual is not None else -1
+                             for actual in (pausa.proceso, pausa.anterior))
+        if POLITICAS[simulador.algoritmo_actual].clave is None:
+            cola = indices(pausa.cola)
+        else:
+            entradas, secuencia = pausa.cola
+            cola = indices(map(itemgetter(2), entradas))
+            claves.extend(map(itemgetter(0), entradas))
+            secuencias.extend(map(itemgetter(1), entradas))
+    terminados = indices(simulador.procesos_terminados)
+    estadisticas = copy.deepcopy(simulador.estadisticas) if simulador.estadisticas is not None else None
+    return CapturaMotor(simulador.tiempo_actual, tuple(getattr(simulador, nombre) for nombre in _CONTADORES),
+                        simulador.algoritmo_actual, simulador.quantum, copy.deepcopy(simulador.costo_conmutacion),
+                        columnas, [proceso.nombre for proceso in procesos], pausa is not None,
+                        proceso, anterior, cola, claves, secuencias, secuencia, terminados, estadisticas)
+
+
+def cargar_captura(ruta) -> CapturaMotor:
+    """Lee una captura escrita con ``CapturaMotor.guardar``"""
+    with open(ruta, "rb") as archivo:
+        datos = archivo.read()
+    if len(datos) < ENCABEZADO.size:
+        raise ValueError(f"{ruta} no es una captura SIGET")
+    magia, version, banderas, _, cantidad, largo = ENCABEZADO.unpack_from(datos)
+    if magia != MAGIA:
+        raise ValueError(f"{ruta} no es una captura SIGET")
+    if version != VERSION:
+        raise ValueError(f"Versión de captura {version} no soportada (se esperaba {VERSION})")
+    desplazamiento = ENCABEZADO.size
+    metadatos = json.loads(datos[desplazamiento:desplazamiento + largo].decode("utf-8"))
+    desplazamiento += largo
+
+    def leer(codigo: str, cantidad_valores: int) -> array:
+        nonlocal desplazamiento
+        columna = array(codigo)
+        fin = desplazamiento + cantidad_valores * columna.itemsize
+        if fin > len(datos):
+            raise ValueError(f"{ruta} está truncada")
+        columna.frombytes(datos[desplazamiento:fin])
+        desplazamiento = fin
+        return columna
+
+    columnas = {campo: leer("q", cantidad) for campo in COLUMNAS_ENTEROS}
+    columnas.update((campo, leer("b", cantidad)) for campo in COLUMNAS_CODIGOS)
+    cola = leer("q", metadatos["cola"])
+    # Claves y secuencias solo si la cola de la política es un montículo
+    largo_claves = len(cola) if POLITICAS[metadatos["algoritmo"]].clave is not None else 0
+    claves = leer("q", largo_claves)
+    secuencias = leer("q", largo_claves)
+    terminados = leer("q", metadatos["terminados"])
+    nombres = datos[desplazamiento:desplazamiento + metadatos["nombres"]].decode("utf-8")
+
+    costo = metadatos["costo"]
+    if costo is not None:
+        costo = CostoConmutacion(costo["cambio_contexto"], costo["despacho"],
+                                 {TipoProceso[tipo]: valor for tipo, valor in costo["por_tipo"].items()},
+                                 costo["por_mb"])
+    return CapturaMotor(metadatos["tiempo"], tuple(metadatos["contadores"]), metadatos["algoritmo"],
+                        metadatos["quantum"], costo, columnas, nombres.split("\0") if cantidad else [],
+                        bool(banderas & BANDERA_PAUSADA), metadatos["proceso"], metadatos["anterior"],
+                        cola, claves, secuencias, metadatos["secuencia"], terminados)
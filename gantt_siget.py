@@ -0,0 +1,136 @@
+"""
+Diagrama de Gantt de la interfaz del SIGET sobre una ``LineaTiempo``.
+
+Solo se dibuja la ventana de tiempo visible y, dentro de ella, a lo sumo un
+segmento por píxel y por CPU (ver ``PistaCPU.ventana_reducida``), así que
+redibujar cuesta O(ancho · CPUs · log n) aunque la línea tenga millones de
+segmentos. La rueda desplaza; Ctrl + rueda acerca o aleja alrededor del
+puntero.
+"""
+
+import tkinter as tk
+from tkinter import ttk
+
+from linea_tiempo_siget import LineaTiempo
+
+PALETA = ("#4fc3f7", "#81c784", "#ffb74d", "#e57373", "#ba68c8", "#4db6ac",
+          "#fff176", "#f06292", "#9575cd", "#aed581", "#ff8a65", "#90a4ae")
+
+ALTO_FILA = 28
+ALTO_EJE = 24
+MARGEN = 64  # Espacio para los nombres de las CPU
+ANCHO_MINIMO_ETIQUETA = 32  # Píxeles de un segmento para escribir su pid
+
+
+def _paso_eje(unidades_por_pixel: float) -> int:
+    """Separación "redonda" (1, 2, 5 × 10^k) entre marcas, de unos 100 píxeles"""
+    objetivo = unidades_por_pixel * 100
+    paso = 1
+    while True:
+        for factor in (1, 2, 5):
+            if paso * factor >= objetivo:
+                return paso * factor
+        paso *= 10
+
+
+class DiagramaGantt(tk.Frame):
+    """Canvas con una fila por CPU y una barra de desplazamiento horizontal"""
+
+    def __init__(self, padre, colores, linea: LineaTiempo, ancho_tiempo: int = 100, **opciones):
+        super().__init__(padre, bg=colores['fondo_secundario'], **opciones)
+        self.colores = colores
+        self.linea = linea
+        self.desde = 0
+        self.ancho_tiempo = ancho_tiempo  # Unidades de tiempo visibles
+        self.seguir = True  # Mantener visible el final mientras la línea crece
+
+        self.canvas = tk.Canvas(self, bg=colores['fondo_principal'], highlightthickness=0, height=200)
+        self.barra = ttk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.desplazar)
+        self.canvas.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 0))
+        self.barra.pack(fill=tk.X, padx=10, pady=(0, 10))
+
+        self.canvas.bind("<Configure>", lambda event: self.refrescar())
+        for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(evento, self._rueda)
+
+    @property
+    def _ancho_px(self) -> int:
+        return max(self.canvas.winfo_width() - MARGEN, 1)
+
+    def refrescar(self):
+        """Redibuja la ventana [desde, desde + ancho_tiempo)"""
+        total = self.linea.fin
+        if self.seguir:
+            self.desde = max(0, total - self.ancho_tiempo)
+        hasta = self.desde + self.ancho_tiempo
+        por_pixel = self.ancho_tiempo / self._ancho_px
+        canvas = self.canvas
+        canvas.delete("all")
+        self._dibujar_eje(por_pixel, hasta)
+
+        for fila, cpu in enumerate(self.linea.cpus):
+            y0 = ALTO_EJE + fila * ALTO_FILA + 2
+            y1 = y0 + ALTO_FILA - 4
+            canvas.create_text(MARGEN - 8, (y0 + y1) / 2, text=f"CPU {cpu}", anchor=tk.E,
+                               fill=self.colores['texto_principal'], font=("Segoe UI", 9, "bold"))
+            for pid, inicio, fin in self.linea.pistas[cpu].ventana_reducida(self.desde, hasta, por_pixel):
+                x0 = MARGEN + (max(inicio, self.desde) - self.desde) / por_pixel
+                x1 = MARGEN + (min(fin, hasta) - self.desde) / por_pixel
+                if x1 - x0 < 1:
+                    x1 = x0 + 1
+                canvas.create_rectangle(x0, y0, x1, y1, fill=PALETA[pid % len(PALETA)], width=0)
+                if x1 - x0 >= ANCHO_MINIMO_ETIQUETA:
+                    canvas.create_text((x0 + x1) / 2, (y0 + y1) / 2, text=f"P{pid}",
+                                       fill="black", font=("Segoe UI", 8))
+
+        if total:
+            self.barra.set(self.desde / total, min(1.0, hasta / total))
+        else:
+            self.barra.set(0.0, 1.0)
+
+    def _dibujar_eje(self, por_pixel: float, hasta: int):
+        paso = _paso_eje(por_pixel)
+        marca = -(-self.desde // paso) * paso
+        while marca < hasta:
+            x = MARGEN + (marca - self.desde) / por_pixel
+            self.canvas.create_line(x, ALTO_EJE - 6, x, self.canvas.winfo_height(),
+                                    fill=self.colores['fondo_terciario'])
+            self.canvas.create_text(x + 3, ALTO_EJE - 14, text=str(marca), anchor=tk.W,
+                                    fill=self.colores['texto_principal'], font=("Segoe UI", 8))
+            marca += paso
+
+    def mostrar(self, desde: int, ancho_tiempo: int):
+        """Muestra la ventana indicada, acotada a la línea de tiempo"""
+        total = self.linea.fin
+        self.ancho_tiempo = max(1, int(ancho_tiempo))
+        self.desde = max(0, min(int(desde), total - self.ancho_tiempo))
+        self.seguir = self.desde + self.ancho_tiempo >= total
+        self.refrescar()
+
+    def ajustar(self):
+        """Muestra la línea de tiempo completa"""
+        self.mostrar(0, max(self.linea.fin, 1))
+
+    def acercar(self, factor: float, x: float = None):
+        """Divide el ancho visible por ``factor`` manteniendo fijo el instante bajo ``x``"""
+        fraccion = 0.5 if x is None else min(max((x - MARGEN) / self._ancho_px, 0.0), 1.0)
+        centro = self.desde + fraccion * self.ancho_tiempo
+        ancho = self.ancho_tiempo / factor
+        self.mostrar(centro - fraccion * ancho, ancho)
+
+    def desplazar(self, accion, cantidad, unidad=None):
+        """Comando de la barra de desplazamiento ("moveto" o "scroll")"""
+        if accion == "moveto":
+            desde = float(cantidad) * self.linea.fin
+        else:
+            paso = self.ancho_tiempo if unidad == "pages" else max(self.ancho_tiempo // 10, 1)
+            desde = self.desde + int(cantidad) * paso
+        self.mostrar(desde, self.ancho_tiempo)
+
+    def _rueda(self, event):
+        arriba = getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0
+        if event.state & 0x4:  # Ctrl
+            self.acercar(1.25 if arriba else 0.8, event.x)
+        else:
+            self.desplazar("scroll", -1 if arriba else 1, "units")
+        return "break"
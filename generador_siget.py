@@ -0,0 +1,198 @@
+"""
+Generador vectorizado de cargas sintéticas del SIGET (requiere NumPy).
+
+Cada ``TipoProceso`` tiene su propio proceso de llegadas: Poisson o, si
+``tasa_rafaga`` está definida, un MMPP de dos estados (normal y ráfaga) con
+permanencias exponenciales. Las ráfagas de CPU y los tamaños de datos salen
+de distribuciones configurables y las prioridades de una mezcla por tipo que
+cambia en las horas pico. Todo se genera con operaciones de arreglos, así
+que 10 millones de procesos tardan unos segundos; el resultado son columnas
+(ver ``tabla_siget.TablaProcesos.desde_columnas``) o ``ProcesoSIGET``.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from nucleo_siget import ProcesoSIGET, TipoProceso
+from tabla_siget import TablaProcesos
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional; solo lo necesita este módulo
+    np = None
+
+_TIPOS = tuple(TipoProceso)
+
+# Distribuciones: ("constante", valor), ("uniforme", mínimo, máximo),
+# ("exponencial", media), ("lognormal", media, sigma), ("pareto", mínimo, alfa)
+Distribucion = Tuple
+
+
+@dataclass
+class PerfilTipo:
+    """Llegadas, ráfagas, tamaños y prioridades de un tipo de proceso"""
+    tasa: float  # Llegadas por unidad de tiempo (en el estado normal si es MMPP)
+    rafaga: Distribucion = ("uniforme", 1, 12)
+    tamaño: Distribucion = ("uniforme", 10, 300)
+    # Probabilidad de cada prioridad de alerta 1..5 fuera de la hora pico
+    prioridades: Tuple[float, ...] = (0.2, 0.2, 0.2, 0.2, 0.2)
+    # MMPP: tasa durante las ráfagas de eventos (None = Poisson) y permanencias medias
+    tasa_rafaga: Optional[float] = None
+    duracion_normal: float = 300.0
+    duracion_rafaga: float = 30.0
+
+    @property
+    def tasa_media(self) -> float:
+        if self.tasa_rafaga is None:
+            return self.tasa
+        return ((self.tasa * self.duracion_normal + self.tasa_rafaga * self.duracion_rafaga)
+                / (self.duracion_normal + self.duracion_rafaga))
+
+
+@dataclass
+class HoraPico:
+    """Ventanas que se repiten cada ``periodo`` con una mezcla de prioridades más urgente"""
+    periodo: int = 1440  # Un día en minutos
+    ventanas: Tuple[Tuple[int, int], ...] = ((420, 540), (1020, 1140))
+    prioridades: Tuple[float, ...] = (0.4, 0.3, 0.15, 0.1, 0.05)
+
+
+PERFILES_SIGET: Dict[TipoProceso, PerfilTipo] = {
+    # Cámaras: llegadas frecuentes con ráfagas ante incidentes, lecturas cortas
+    TipoProceso.MONITOREO_TRAFICO: PerfilTipo(
+        0.06, ("exponencial", 4), ("lognormal", 150, 0.6), (0.15, 0.25, 0.35, 0.15, 0.1),
+        tasa_rafaga=0.3),
+    TipoProceso.GESTION_SEMAFOROS: PerfilTipo(
+        0.04, ("uniforme", 1, 6), ("lognormal", 60, 0.4), (0.3, 0.3, 0.2, 0.1, 0.1)),
+    # Análisis: pocos trabajos largos con datos de cola pesada
+    TipoProceso.ANALISIS_DATOS: PerfilTipo(
+        0.01, ("lognormal", 12, 0.7), ("pareto", 100, 1.8), (0.05, 0.1, 0.25, 0.3, 0.3)),
+}
+
+
+def _requerir_numpy():
+    if np is None:
+        raise ImportError("generador_siget requiere NumPy (pip install numpy)")
+
+
+def _muestrear(azar, distribucion: Distribucion, cantidad: int, minimo: int) -> "np.ndarray":
+    """Enteros int64 de la distribución, no menores que ``minimo``"""
+    nombre, *parametros = distribucion
+    if nombre == "constante":
+        valores = np.full(cantidad, parametros[0], dtype=np.float64)
+    elif nombre == "uniforme":
+        valores = azar.integers(parametros[0], parametros[1] + 1, cantidad)
+    elif nombre == "exponencial":
+        valores = azar.exponential(parametros[0], cantidad)
+    elif nombre == "lognormal":
+        media, sigma = parametros
+        valores = azar.lognormal(np.log(media) - sigma ** 2 / 2, sigma, cantidad)
+    elif nombre == "pareto":
+        escala, alfa = parametros
+        valores = (azar.pareto(alfa, cantidad) + 1) * escala
+    else:
+        raise ValueError(f"Distribución desconocida: {nombre!r}")
+    return np.maximum(np.rint(valores).astype(np.int64), minimo)
+
+
+def _llegadas(azar, perfil: PerfilTipo, cantidad: int, intensidad: float) -> "np.ndarray":
+    """Los primeros ``cantidad`` instantes de llegada (float) del tipo, ordenados"""
+    if perfil.tasa_rafaga is None:
+        return np.cumsum(azar.exponential(1 / (perfil.tasa * intensidad), cantidad))
+
+    # MMPP: alternar permanencias normal/ráfaga hasta cubrir ``cantidad`` llegadas
+    ciclo = perfil.duracion_normal + perfil.duracion_rafaga
+    tramos = 2 * int(cantidad / (perfil.tasa_media * intensidad * ciclo) * 1.2) + 4
+    while True:
+        rafaga = np.arange(tramos) % 2 == 1
+        duracion = azar.exponential(np.where(rafaga, perfil.duracion_rafaga, perfil.duracion_normal))
+        tasas = np.where(rafaga, perfil.tasa_rafaga, perfil.tasa) * intensidad
+        cuentas = azar.poisson(tasas * duracion)
+        if cuentas.sum() >= cantidad:
+            break
+        tramos *= 2
+    inicios = np.cumsum(duracion) - duracion
+    tramo = np.repeat(np.arange(tramos), cuentas)
+    instantes = inicios[tramo] + azar.random(len(tramo)) * duracion[tramo]
+    instantes.sort()
+    return instantes[:cantidad]
+
+
+def generar_columnas(cantidad: int, semilla: int = 0,
+                     perfiles: Optional[Dict[TipoProceso, PerfilTipo]] = None,
+                     hora_pico: Optional[HoraPico] = HoraPico(),
+                     intensidad: float = 1.0) -> Dict[str, "np.ndarray"]:
+    """Columnas id, tipo, irrupcion, ejecucion, prioridad y tamaño ordenadas por llegada.
+
+    ``tipo`` usa los códigos de ``tabla_siget`` (orden de ``TipoProceso``).
+    ``intensidad`` multiplica todas las tasas de llegada.
+    """
+    _requerir_numpy()
+    perfiles = perfiles or PERFILES_SIGET
+    azar = np.random.default_rng(semilla)
+    total = sum(perfil.tasa_media for perfil in perfiles.values())
+
+    # Cada tipo aporta de más según su tasa y se conservan las primeras llegadas
+    instantes, codigos = [], []
+    for tipo, perfil in perfiles.items():
+        propios = int(cantidad * perfil.tasa_media / total * 1.1) + 16
+        instantes.append(_llegadas(azar, perfil, propios, intensidad))
+        codigos.append(np.full(propios, _TIPOS.index(tipo), dtype=np.int8))
+    instantes = np.concatenate(instantes)
+    orden = np.argsort(instantes, kind="stable")[:cantidad]
+    irrupcion = instantes[orden].astype(np.int64)
+    tipo = np.concatenate(codigos)[orden]
+
+    ejecucion = np.empty(cantidad, dtype=np.int64)
+    tamaño = np.empty(cantidad, dtype=np.int64)
+    prioridad = np.empty(cantidad, dtype=np.int8)
+    if hora_pico is not None:
+        reloj = irrupcion % hora_pico.periodo
+        pico = np.zeros(cantidad, dtype=bool)
+        for inicio, fin in hora_pico.ventanas:
+            pico |= (reloj >= inicio) & (reloj < fin)
+    else:
+        pico = np.zeros(cantidad, dtype=bool)
+
+    for tipo_proceso, perfil in perfiles.items():
+        del_tipo = tipo == _TIPOS.index(tipo_proceso)
+        cuantos = int(del_tipo.sum())
+        ejecucion[del_tipo] = _muestrear(azar, perfil.rafaga, cuantos, 1)
+        tamaño[del_tipo] = _muestrear(azar, perfil.tamaño, cuantos, 0)
+        for en_pico, probabilidades in ((False, perfil.prioridades),
+                                        (True, hora_pico.prioridades if hora_pico else perfil.prioridades)):
+            mascara = del_tipo & (pico == en_pico)
+            prioridad[mascara] = azar.choice(
+                np.arange(1, 6, dtype=np.int8), size=int(mascara.sum()), p=probabilidades)
+
+    return {
+        "id": np.arange(1, cantidad + 1, dtype=np.int64),
+        "tipo": tipo,
+        "irrupcion": irrupcion,
+        "ejecucion": ejecucion,
+        "prioridad": prioridad,
+        "tamaño": tamaño,
+    }
+
+
+def tabla_desde_columnas(columnas: Dict[str, "np.ndarray"]) -> TablaProcesos:
+    """``TablaProcesos`` sobre las columnas generadas, sin copiarlas; sus vistas van al motor"""
+    return TablaProcesos.desde_columnas(**{nombre: memoryview(columna)
+                                           for nombre, columna in columnas.items()})
+
+
+def iterar_procesos(columnas: Dict[str, "np.ndarray"], bloque: int = 65536) -> Iterator[ProcesoSIGET]:
+    """``ProcesoSIGET`` en orden de llegada, creados por bloques (para ``ejecutar_flujo``)"""
+    cantidad = len(columnas["id"])
+    for inicio in range(0, cantidad, bloque):
+        fin = inicio + bloque
+        filas = zip(*(columnas[nombre][inicio:fin].tolist()
+                      for nombre in ("id", "tipo", "irrupcion", "ejecucion", "prioridad", "tamaño")))
+        for id_, tipo, irrupcion, ejecucion, prioridad, tamaño in filas:
+            yield ProcesoSIGET(id_, f"P{id_}", _TIPOS[tipo], irrupcion, ejecucion, prioridad, tamaño,
+                               tiempo_restante=ejecucion)
+
+
+def generar_procesos(cantidad: int, semilla: int = 0, **opciones) -> List[ProcesoSIGET]:
+    """Lista de ``ProcesoSIGET``; acepta las mismas opciones que ``generar_columnas``"""
+    return list(iterar_procesos(generar_columnas(cantidad, semilla, **opciones)))
@@ -0,0 +1,315 @@
+"""
+Re-simulación incremental del SIGET con puntos de control.
+
+Con una ``PuntosControl`` en ``SimuladorSIGET.puntos_control``, el motor
+guarda cada ``intervalo`` unidades de tiempo el reloj, los contadores, el
+proceso en ejecución, la cola de listos y el estado de los procesos activos
+(listos o en ejecución). Los terminados no cambian más y los que no
+llegaron conservan su estado inicial, así que un punto ocupa O(activos). Si
+hay más de ``max_puntos``, se descarta uno de cada dos y se duplica el
+intervalo: la memoria queda acotada sin importar el largo de la corrida.
+
+``resimular(simulador)`` compara la carga con la de la última corrida,
+reanuda desde el último punto anterior al primer proceso que cambió
+(editado, agregado o quitado) y se detiene en cuanto el estado vuelve a
+coincidir con el de la corrida anterior en el mismo instante; desde ahí
+copia los resultados previos en lugar de simularlos.
+"""
+
+from array import array
+from itertools import islice
+from operator import attrgetter
+from typing import Dict, List, Optional
+
+_POR_LLEGADA = attrgetter("tiempo_irrupcion")
+
+
+# Datos de entrada de los procesos que influyen en la planificación
+_CAMPOS_ENTRADA = ("tiempo_irrupcion", "tiempo_ejecucion", "prioridad_alerta", "tamaño_datos")
+
+
+def _entradas(ordenados: list) -> tuple:
+    """Columnas con los datos de entrada de ``ordenados`` (sin crear una tupla por proceso)"""
+    columnas = tuple(array("q", map(attrgetter(campo), ordenados)) for campo in _CAMPOS_ENTRADA)
+    return columnas + (list(map(attrgetter("tipo"), ordenados)),)
+
+
+_BLOQUE = 4096
+
+
+def _prefijo_comun(columnas_a: tuple, columnas_b: tuple) -> int:
+    """Largo del prefijo en el que coinciden todas las columnas paralelas.
+
+    Compara por bloques con la igualdad de listas (en C) y solo recorre
+    elemento a elemento el bloque donde está la primera diferencia.
+    """
+    largo = min(len(columnas_a[0]), len(columnas_b[0]))
+    inicio = 0
+    while inicio < largo:
+        fin = min(inicio + _BLOQUE, largo)
+        if all(a[inicio:fin] == b[inicio:fin] for a, b in zip(columnas_a, columnas_b)):
+            inicio = fin
+            continue
+        while all(a[inicio] == b[inicio] for a, b in zip(columnas_a, columnas_b)):
+            inicio += 1
+        return inicio
+    return largo
+
+
+def _resultado(proceso) -> tuple:
+    return (proceso.estado, proceso.tiempo_restante, proceso.tiempo_espera, proceso.listo_desde,
+            proceso.tiempo_inicio, proceso.tiempo_fin, proceso.tiempo_respuesta)
+
+
+def _aplicar_resultado(proceso, resultado: tuple):
+    (proceso.estado, proceso.tiempo_restante, proceso.tiempo_espera, proceso.listo_desde,
+     proceso.tiempo_inicio, proceso.tiempo_fin, proceso.tiempo_respuesta) = resultado
+
+
+class PuntoControl:
+    """Estado del motor al comienzo de un paso del bucle, antes de admitir llegadas.
+
+    ``contadores`` es (despachos, admitidos, terminados, cambios de
+    contexto, sobrecarga, tiempo útil); ``admitidos`` es además la posición
+    de la próxima llegada en la lista ordenada. ``cola`` es el ``estado()``
+    de la cola de listos.
+    """
+
+    __slots__ = ("tiempo", "proceso", "anterior", "cola", "contadores", "activos")
+
+    def __init__(self, tiempo, proceso, anterior, cola, contadores, activos):
+        self.tiempo = tiempo
+        self.proceso = proceso
+        self.anterior = anterior
+        self.cola = cola
+        self.contadores = contadores
+        self.activos = activos  # ((proceso, estado, restante, espera, listo_desde, inicio), ...)
+
+    @property
+    def cursor(self) -> int:
+        return self.contadores[1]
+
+    def restaurar_procesos(self):
+        for proceso, estado, restante, espera, listo_desde, inicio in self.activos:
+            proceso.estado = estado
+            proceso.tiempo_restante = restante
+            proceso.tiempo_espera = espera
+            proceso.listo_desde = listo_desde
+            proceso.tiempo_inicio = inicio
+            proceso.tiempo_fin = None
+            proceso.tiempo_respuesta = 0
+
+    def desplazado(self, diferencias: tuple) -> "PuntoControl":
+        """Copia con los contadores corridos (al empalmar con otra corrida)"""
+        contadores = tuple(valor + diferencia for valor, diferencia in zip(self.contadores, diferencias))
+        return PuntoControl(self.tiempo, self.proceso, self.anterior, self.cola, contadores, self.activos)
+
+
+class PuntosControl:
+    """Puntos de control de la última corrida de ``ejecutar_simulacion``"""
+
+    def __init__(self, intervalo: int = 1000, max_puntos: int = 64):
+        if intervalo < 1 or max_puntos < 2:
+            raise ValueError("Se necesita intervalo >= 1 y max_puntos >= 2")
+        self.intervalo_inicial = intervalo
+        self.max_puntos = max_puntos
+        self.limpiar()
+
+    def limpiar(self):
+        self.intervalo = self.intervalo_inicial
+        self.puntos: List[PuntoControl] = []
+        self.proximo = 0
+        # Carga ordenada y configuración de la corrida (None si no se puede reanudar)
+        self.ordenados: Optional[list] = None
+        self.entradas: Optional[tuple] = None
+        self.configuracion = None
+        self._comparacion_vacia()
+
+    def _comparacion_vacia(self):
+        # Durante una re-simulación: puntos de la corrida previa con los que comparar
+        self._previos: List[PuntoControl] = []
+        self._siguiente_previo = 0
+        self._inicio_sufijo = 0
+        self._desplazamiento = 0
+        self._cambiados = frozenset()
+        self.convergencia: Optional[tuple] = None  # (punto previo, punto nuevo)
+
+    def iniciar(self, ordenados: list, configuracion, entradas: Optional[tuple] = None):
+        """Registra la carga ordenada por llegada de la corrida que empieza"""
+        self.ordenados = ordenados
+        self.entradas = _entradas(ordenados) if entradas is None else entradas
+        self.configuracion = configuracion
+
+    def __len__(self):
+        return len(self.puntos)
+
+    def _agregar(self, punto: PuntoControl):
+        self.puntos.append(punto)
+        while len(self.puntos) > self.max_puntos:
+            self.puntos = self.puntos[::2]
+            self.intervalo *= 2
+
+    def capturar(self, tiempo: int, proceso, anterior, cola, contadores: tuple) -> bool:
+        """Guarda un punto; devuelve True si el estado convergió con la corrida previa"""
+        activos = list(cola)
+        if proceso is not None:
+            activos.append(proceso)
+        punto = PuntoControl(tiempo, proceso, anterior, cola.estado(), contadores, tuple(
+            (p, p.estado, p.tiempo_restante, p.tiempo_espera, p.listo_desde, p.tiempo_inicio)
+            for p in activos))
+
+        previos = self._previos
+        while self._siguiente_previo < len(previos) and previos[self._siguiente_previo].tiempo <= tiempo:
+            previo = previos[self._siguiente_previo]
+            self._siguiente_previo += 1
+            if previo.tiempo == tiempo and self._convergio(punto, previo, cola.firma):
+                self.convergencia = (previo, punto)
+                return True
+
+        self._agregar(punto)
+        self.proximo = (tiempo // self.intervalo + 1) * self.intervalo
+        if self._siguiente_previo < len(previos):
+            # Mientras queden puntos previos, capturar también en sus instantes
+            self.proximo = min(self.proximo, previos[self._siguiente_previo].tiempo)
+        return False
+
+    def _convergio(self, punto: PuntoControl, previo: PuntoControl, firma) -> bool:
+        # Las llegadas pendientes deben ser las mismas, ya sin procesos cambiados
+        if previo.cursor < self._inicio_sufijo or punto.cursor - previo.cursor != self._desplazamiento:
+            return False
+        if punto.proceso is not previo.proceso or punto.anterior is not previo.anterior:
+            return False
+        if any(id(activo[0]) in self._cambiados for activo in punto.activos):
+            return False
+        if firma(punto.cola) != firma(previo.cola):
+            return False
+        anteriores = {id(activo[0]): activo[1:] for activo in previo.activos}
+        return all(anteriores.get(id(activo[0])) == activo[1:] for activo in punto.activos)
+
+    def reanudar(self, punto: PuntoControl, inicio_sufijo: int, desplazamiento: int, cambiados):
+        """Prepara la comparación con los puntos previos posteriores a ``punto``"""
+        indice = self.puntos.index(punto)
+        self._comparacion_vacia()
+        self._previos = self.puntos[indice + 1:]
+        self._inicio_sufijo = inicio_sufijo
+        self._desplazamiento = desplazamiento
+        self._cambiados = frozenset(id(proceso) for proceso in cambiados)
+        self.puntos = self.puntos[:indice]
+        self.proximo = punto.tiempo
+
+    def empalmar(self, diferencias: tuple):
+        """Tras converger: agrega los puntos previos posteriores, corridos por ``diferencias``"""
+        previo, actual = self.convergencia
+        self._agregar(actual)
+        for punto in self._previos:
+            if punto.tiempo > actual.tiempo:
+                self._agregar(punto.desplazado(diferencias))
+
+    def terminar_comparacion(self):
+        self._comparacion_vacia()
+
+
+def resimular(simulador, callback_actualizacion=None) -> Dict[str, object]:
+    """Actualiza los resultados de ``simulador`` tras editar, agregar o quitar procesos.
+
+    Equivale a ``ejecutar_simulacion`` pero solo simula desde el último
+    punto de control anterior al primer cambio hasta que el plan vuelve a
+    coincidir con el previo. Si no hay una corrida previa compatible (otra
+    configuración, subclase del motor o línea de tiempo activa) simula
+    completo. Devuelve desde qué instante se reanudó, en cuál convergió
+    (None si no lo hizo) y si hizo falta la corrida completa.
+    """
+    # Importación diferida: nucleo_siget importa este módulo
+    from nucleo_siget import EstadoProceso, SimuladorSIGET
+
+    puntos = simulador.puntos_control
+    configuracion = simulador.configuracion()
+    completa = {"completa": True, "reanudado_en": 0, "convergio_en": None}
+    if (type(simulador) is not SimuladorSIGET or puntos is None or puntos.ordenados is None
+            or puntos.configuracion != configuracion or simulador.linea_tiempo is not None):
+        simulador.ejecutar_simulacion(callback_actualizacion)
+        return completa
+
+    viejos, entradas_viejas = puntos.ordenados, puntos.entradas
+    nuevos = sorted(simulador.procesos, key=_POR_LLEGADA)
+    entradas_nuevas = _entradas(nuevos)
+
+    # Primer cambio y sufijo común (las llegadas que siguen iguales); los
+    # procesos se comparan por identidad
+    columnas_viejas = (list(map(id, viejos)),) + entradas_viejas
+    columnas_nuevas = (list(map(id, nuevos)),) + entradas_nuevas
+    primero = _prefijo_comun(columnas_viejas, columnas_nuevas)
+    if primero == len(viejos) == len(nuevos):
+        return {"completa": False, "reanudado_en": None, "convergio_en": None}
+    comun = _prefijo_comun(tuple(columna[primero:][::-1] for columna in columnas_viejas),
+                           tuple(columna[primero:][::-1] for columna in columnas_nuevas))
+    sufijo_viejo, sufijo_nuevo = len(viejos) - comun, len(nuevos) - comun
+
+    # Último punto que todavía no vio ninguna llegada afectada
+    limite = min(lista[primero].tiempo_irrupcion for lista in (viejos, nuevos) if primero < len(lista))
+    candidatos = [p for p in puntos.puntos if p.cursor <= primero and p.tiempo < limite]
+    if not candidatos:
+        simulador.ejecutar_simulacion(callback_actualizacion)
+        return completa
+    punto = candidatos[-1]
+
+    # Resultados previos de lo que se re-simula, para empalmar si converge
+    anteriores = {id(activo[0]): _resultado(activo[0]) for activo in punto.activos}
+    terminados_previos = simulador.procesos_terminados
+    finales_previos = (simulador.despachos, simulador.cantidad_admitidos, simulador.cantidad_terminados,
+                       simulador.cambios_contexto, simulador.tiempo_sobrecarga, simulador.tiempo_util)
+    tiempo_previo = simulador.tiempo_actual
+
+    pedidas = punto.cursor
+
+    def llegadas():
+        # Cada llegada se guarda y se reinicia recién cuando el motor la pide:
+        # si el plan converge, las que no llegó a pedir quedan como estaban
+        nonlocal pedidas
+        for proceso in islice(nuevos, punto.cursor, None):
+            pedidas += 1
+            anteriores[id(proceso)] = _resultado(proceso)
+            proceso.estado = EstadoProceso.NUEVO
+            proceso.tiempo_restante = proceso.tiempo_ejecucion
+            proceso.tiempo_espera = 0
+            proceso.listo_desde = None
+            proceso.tiempo_respuesta = 0
+            proceso.tiempo_inicio = None
+            proceso.tiempo_fin = None
+            yield proceso
+
+    punto.restaurar_procesos()
+    puntos.reanudar(punto, sufijo_viejo, sufijo_nuevo - sufijo_viejo,
+                    viejos[primero:sufijo_viejo] + nuevos[primero:sufijo_nuevo])
+    puntos.iniciar(nuevos, configuracion, entradas_nuevas)
+
+    simulador.procesos_terminados = terminados_previos[:punto.contadores[2]]
+    # Las estadísticas se reconstruyen al final con todos los terminados
+    estadisticas, simulador.estadisticas = simulador.estadisticas, None
+    try:
+        simulador._simular(llegadas(), callback_actualizacion,
+                           simulador.procesos_terminados.append, reanudar=punto)
+        convergio_en = None
+        if puntos.convergencia is not None:
+            previo, actual = puntos.convergencia
+            convergio_en = actual.tiempo
+            for activo in actual.activos:
+                _aplicar_resultado(activo[0], anteriores[id(activo[0])])
+            for proceso in islice(nuevos, actual.cursor, pedidas):
+                _aplicar_resultado(proceso, anteriores[id(proceso)])
+            simulador.procesos_terminados.extend(terminados_previos[previo.contadores[2]:])
+            diferencias = tuple(a - b for a, b in zip(actual.contadores, previo.contadores))
+            (simulador.despachos, simulador.cantidad_admitidos, simulador.cantidad_terminados,
+             simulador.cambios_contexto, simulador.tiempo_sobrecarga, simulador.tiempo_util) = (
+                valor + diferencia for valor, diferencia in zip(finales_previos, diferencias))
+            simulador.tiempo_actual = tiempo_previo
+            puntos.empalmar(diferencias)
+    finally:
+        simulador.estadisticas = estadisticas
+        puntos.terminar_comparacion()
+
+    if estadisticas is not None:
+        estadisticas.reiniciar()
+        for proceso in simulador.procesos_terminados:
+            estadisticas.registrar(proceso)
+    return {"completa": False, "reanudado_en": punto.tiempo, "convergio_en": convergio_en}
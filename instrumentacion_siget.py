@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Instrumentación del motor del SIGET: tramos con nombre y contadores.
+
+Se activa asignando una ``Instrumentacion`` a ``SimuladorSIGET.instrumentacion``;
+sin ella el motor solo paga una comparación con None por fase. El bucle
+marca las fases admision, seleccion, espera, ejecucion y callback, y la
+corrida completa como simulacion. Los resultados se exportan como
+estadísticas de pstats (``python -m pstats perfil.prof``) o como traza de
+eventos de Chrome (chrome://tracing, Perfetto). Uso sin interfaz:
+
+    python instrumentacion_siget.py --procesos 100000 --algoritmo SJF --pstats perfil.prof --chrome traza.json
+"""
+
+import argparse
+import json
+import marshal
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Tramo raíz: el resto de las fases ocurren dentro de él
+RAIZ = "simulacion"
+
+
+class Instrumentacion:
+    """Acumula, por nombre de tramo, cantidad, tiempo total y máximo (ns).
+
+    Si ``registrar_eventos`` es verdadero también guarda cada tramo para la
+    traza de Chrome, hasta ``max_eventos``; los siguientes solo se cuentan.
+    """
+
+    def __init__(self, registrar_eventos: bool = True, max_eventos: int = 1_000_000):
+        self.reloj = time.perf_counter_ns
+        self.tramos: Dict[str, List[int]] = {}  # nombre -> [cantidad, total, máximo]
+        self.contadores: Dict[str, int] = {}
+        self.registrar_eventos = registrar_eventos
+        self.max_eventos = max_eventos
+        self.eventos: List[Tuple[str, int, int]] = []  # (nombre, inicio, duración)
+        self.eventos_descartados = 0
+
+    def tramo(self, nombre: str, inicio: int) -> int:
+        """Cierra el tramo ``nombre`` abierto en ``inicio`` y devuelve el instante actual"""
+        fin = self.reloj()
+        duracion = fin - inicio
+        acumulado = self.tramos.get(nombre)
+        if acumulado is None:
+            self.tramos[nombre] = [1, duracion, duracion]
+        else:
+            acumulado[0] += 1
+            acumulado[1] += duracion
+            if duracion > acumulado[2]:
+                acumulado[2] = duracion
+        if self.registrar_eventos:
+            if len(self.eventos) < self.max_eventos:
+                self.eventos.append((nombre, inicio, duracion))
+            else:
+                self.eventos_descartados += 1
+        return fin
+
+    def contar(self, nombre: str, cantidad: int = 1):
+        self.contadores[nombre] = self.contadores.get(nombre, 0) + cantidad
+
+    def resumen(self) -> List[Tuple[str, int, float, float, float]]:
+        """(tramo, cantidad, segundos totales, µs promedio, µs máximo), del más costoso al menos"""
+        filas = [(nombre, cantidad, total / 1e9, total / cantidad / 1e3, maximo / 1e3)
+                 for nombre, (cantidad, total, maximo) in self.tramos.items()]
+        return sorted(filas, key=lambda fila: fila[2], reverse=True)
+
+    def estadisticas_pstats(self) -> Dict[tuple, tuple]:
+        """Tramos en el formato interno de pstats: cada fase es llamada por la raíz"""
+        raiz = ("nucleo_siget.py", 0, RAIZ)
+        estadisticas = {}
+        hijos = 0
+        for nombre, (cantidad, total, _) in self.tramos.items():
+            if nombre == RAIZ:
+                continue
+            segundos = total / 1e9
+            hijos += segundos
+            llamadores = {raiz: (cantidad, cantidad, segundos, segundos)} if RAIZ in self.tramos else {}
+            estadisticas[("nucleo_siget.py", 0, nombre)] = (cantidad, cantidad, segundos, segundos, llamadores)
+        if RAIZ in self.tramos:
+            cantidad, total, _ = self.tramos[RAIZ]
+            segundos = total / 1e9
+            estadisticas[raiz] = (cantidad, cantidad, max(segundos - hijos, 0.0), segundos, {})
+        return estadisticas
+
+    def exportar_pstats(self, ruta: str):
+        """Escribe un archivo que se abre con ``pstats.Stats(ruta)``"""
+        with open(ruta, "wb") as archivo:
+            marshal.dump(self.estadisticas_pstats(), archivo)
+
+    def exportar_chrome(self, ruta: str):
+        """Escribe la traza en el formato JSON de eventos de Chrome"""
+        if self.eventos:
+            origen = min(inicio for _, inicio, _ in self.eventos)
+        else:
+            origen = 0
+        eventos = [{"name": nombre, "ph": "X", "ts": (inicio - origen) / 1e3, "dur": duracion / 1e3,
+                    "pid": 1, "tid": 1}
+                   for nombre, inicio, duracion in self.eventos]
+        fin = max((evento["ts"] + evento["dur"] for evento in eventos), default=0)
+        eventos.extend({"name": nombre, "ph": "C", "ts": fin, "pid": 1, "tid": 1, "args": {nombre: valor}}
+                       for nombre, valor in self.contadores.items())
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump({"traceEvents": eventos, "displayTimeUnit": "ns",
+                       "otherData": {"eventos_descartados": self.eventos_descartados}}, archivo)
+
+
+def imprimir_resumen(instrumentacion: Instrumentacion, salida=sys.stdout):
+    print(f"{'Tramo':<12} {'cantidad':>10} {'seg':>9} {'µs prom':>9} {'µs máx':>10}", file=salida)
+    for nombre, cantidad, segundos, promedio, maximo in instrumentacion.resumen():
+        print(f"{nombre:<12} {cantidad:>10} {segundos:>9.3f} {promedio:>9.3f} {maximo:>10.1f}", file=salida)
+    for nombre, valor in sorted(instrumentacion.contadores.items()):
+        print(f"  {nombre}: {valor}", file=salida)
+
+
+def agregar_argumentos(parser: argparse.ArgumentParser):
+    """Opciones de perfilado comunes a las herramientas sin interfaz"""
+    parser.add_argument("--pstats", metavar="RUTA",
+                        help="guarda el perfil por fase (abrir con python -m pstats RUTA)")
+    parser.add_argument("--chrome", metavar="RUTA",
+                        help="guarda la traza de eventos de Chrome (chrome://tracing, Perfetto)")
+
+
+def desde_argumentos(args):
+    """Instrumentacion si se pidió alguna exportación, o None"""
+    if not (args.pstats or args.chrome):
+        return None
+    return Instrumentacion(registrar_eventos=bool(args.chrome))
+
+
+def exportar_segun_argumentos(instrumentacion: Instrumentacion, args):
+    if args.pstats:
+        instrumentacion.exportar_pstats(args.pstats)
+        print(f"💾 Perfil pstats en {args.pstats}")
+    if args.chrome:
+        instrumentacion.exportar_chrome(args.chrome)
+        print(f"💾 Traza de Chrome en {args.chrome}")
+
+
+def main(argv=None):
+    # Importación diferida: nucleo_siget importa este módulo
+    from carga_siget import leer_traza
+    from nucleo_siget import POLITICAS, SimuladorSIGET, iterar_procesos_aleatorios
+
+    parser = argparse.ArgumentParser(description="Corrida perfilada del motor SIGET, sin interfaz")
+    parser.add_argument("--traza", help="traza CSV/JSONL de entrada (por defecto, carga sintética)")
+    parser.add_argument("--procesos", type=int, default=100000)
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--algoritmo", choices=list(POLITICAS), default="FIFO")
+    parser.add_argument("--quantum", type=int, default=2)
+    agregar_argumentos(parser)
+    args = parser.parse_args(argv)
+
+    instrumentacion = desde_argumentos(args) or Instrumentacion(registrar_eventos=False)
+    simulador = SimuladorSIGET()
+    simulador.algoritmo_actual = args.algoritmo
+    simulador.quantum = args.quantum
+    simulador.instrumentacion = instrumentacion
+    fuente = leer_traza(args.traza) if args.traza else iterar_procesos_aleatorios(args.procesos, args.semilla)
+    simulador.ejecutar_flujo(fuente)
+
+    imprimir_resumen(instrumentacion)
+    exportar_segun_argumentos(instrumentacion, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Línea de tiempo de ejecución del SIGET: qué proceso ocupó cada CPU y cuándo.
+
+Se activa asignando una ``LineaTiempo`` a ``SimuladorSIGET.linea_tiempo``. El
+motor registra cada tramo ejecutado como un segmento (cpu, pid, inicio, fin);
+los tramos contiguos del mismo proceso en la misma CPU (p. ej. una llegada
+que no desaloja en SRTF) se funden en uno, así que hay un segmento por
+cambio de contexto. Cada CPU guarda sus segmentos en tres ``array`` de
+enteros de 8 bytes ordenados por tiempo: 24 bytes por segmento, y buscar
+una ventana cuesta O(log n). No importa tkinter (ver ``gantt_siget``).
+"""
+
+import csv
+import heapq
+import json
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterator, List, Tuple
+
+Segmento = Tuple[int, int, int, int]  # (cpu, pid, inicio, fin)
+
+_FILAS_POR_ESCRITURA = 65536
+
+
+class PistaCPU:
+    """Segmentos de una CPU en columnas, ordenados y sin solaparse"""
+
+    __slots__ = ("pid", "inicio", "fin")
+
+    def __init__(self):
+        self.pid = array("q")
+        self.inicio = array("q")
+        self.fin = array("q")
+
+    def __len__(self):
+        return len(self.pid)
+
+    def agregar(self, pid: int, inicio: int, fin: int):
+        """Agrega un tramo; si continúa el último del mismo proceso, lo extiende"""
+        if self.pid and self.fin[-1] == inicio and self.pid[-1] == pid:
+            self.fin[-1] = fin
+        else:
+            self.pid.append(pid)
+            self.inicio.append(inicio)
+            self.fin.append(fin)
+
+    def primero_desde(self, tiempo: int) -> int:
+        """Índice del primer segmento que termina después de ``tiempo``"""
+        return bisect_right(self.fin, tiempo)
+
+    def ventana(self, desde: int, hasta: int) -> Iterator[Tuple[int, int, int]]:
+        """(pid, inicio, fin) de los segmentos que se solapan con [desde, hasta)"""
+        pid, inicio, fin = self.pid, self.inicio, self.fin
+        for indice in range(self.primero_desde(desde), len(pid)):
+            if inicio[indice] >= hasta:
+                break
+            yield pid[indice], inicio[indice], fin[indice]
+
+    def ventana_reducida(self, desde: int, hasta: int, resolucion: float) -> List[Tuple[int, int, int]]:
+        """Como ``ventana``, pero a lo sumo un segmento por cada ``resolucion`` unidades.
+
+        Tras tomar un segmento se salta con búsqueda binaria al primero que
+        termina en la celda siguiente, así que el costo es O(celdas · log n)
+        aunque la ventana abarque millones de segmentos.
+        """
+        pid, inicio, fin = self.pid, self.inicio, self.fin
+        cantidad = len(pid)
+        indice = self.primero_desde(desde)
+        visibles = []
+        while indice < cantidad and inicio[indice] < hasta:
+            visibles.append((pid[indice], inicio[indice], fin[indice]))
+            # Fin de la celda en la que termina este segmento
+            celda = desde + (int((fin[indice] - desde) / resolucion) + 1) * resolucion
+            if indice + 1 < cantidad and fin[indice + 1] <= celda:
+                indice = bisect_right(fin, celda, indice + 1)
+            else:
+                indice += 1
+        return visibles
+
+
+class LineaTiempo:
+    """Segmentos de ejecución de todas las CPU"""
+
+    def __init__(self):
+        self.pistas: Dict[int, PistaCPU] = {}
+
+    def pista(self, cpu: int) -> PistaCPU:
+        """La pista de ``cpu``, creada si hace falta (el motor guarda la referencia)"""
+        pista = self.pistas.get(cpu)
+        if pista is None:
+            pista = self.pistas[cpu] = PistaCPU()
+        return pista
+
+    def registrar(self, cpu: int, pid: int, inicio: int, fin: int):
+        self.pista(cpu).agregar(pid, inicio, fin)
+
+    def limpiar(self):
+        """Vacía las pistas conservando los objetos (el motor puede tener referencias)"""
+        for pista in self.pistas.values():
+            del pista.pid[:], pista.inicio[:], pista.fin[:]
+
+    def recortar(self, tiempo: int):
+        """Descarta lo ejecutado después de ``tiempo`` (al volver a un estado anterior)"""
+        for pista in self.pistas.values():
+            indice = bisect_right(pista.inicio, tiempo - 1)  # Primer segmento que empieza en tiempo o después
+            del pista.pid[indice:], pista.inicio[indice:], pista.fin[indice:]
+            if pista.fin and pista.fin[-1] > tiempo:
+                pista.fin[-1] = tiempo
+
+    def __len__(self):
+        return sum(len(pista) for pista in self.pistas.values())
+
+    @property
+    def cpus(self) -> List[int]:
+        return sorted(self.pistas)
+
+    @property
+    def fin(self) -> int:
+        """Fin del último segmento (0 si no hay ninguno)"""
+        return max((pista.fin[-1] for pista in self.pistas.values() if pista), default=0)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(columna.itemsize * len(columna) for pista in self.pistas.values()
+                   for columna in (pista.pid, pista.inicio, pista.fin))
+
+    def segmentos(self) -> Iterator[Segmento]:
+        """Todos los segmentos, ordenados por inicio (y por CPU en caso de empate)"""
+        def de_la_pista(cpu, pista):
+            for pid, inicio, fin in zip(pista.pid, pista.inicio, pista.fin):
+                yield inicio, cpu, pid, fin
+
+        for inicio, cpu, pid, fin in heapq.merge(*(de_la_pista(cpu, pista)
+                                                   for cpu, pista in sorted(self.pistas.items()))):
+            yield cpu, pid, inicio, fin
+
+    def exportar_csv(self, ruta) -> int:
+        """Escribe cpu, pid, inicio, fin en flujo; devuelve la cantidad de segmentos"""
+        cantidad = 0
+        with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(("cpu", "pid", "inicio", "fin"))
+            for segmento in self.segmentos():
+                escritor.writerow(segmento)
+                cantidad += 1
+        return cantidad
+
+    def exportar_chrome(self, ruta, nombres: Dict[int, str] = None) -> int:
+        """Escribe la traza de eventos de Chrome en flujo (una fila por CPU).
+
+        Una unidad de tiempo de la simulación se muestra como 1 µs.
+        """
+        cantidad = 0
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+            metadatos = [json.dumps({"name": "thread_name", "ph": "M", "pid": 1, "tid": cpu,
+                                     "args": {"name": f"CPU {cpu}"}}) for cpu in self.cpus]
+            archivo.write(",\n".join(metadatos))
+            bloque = []
+            for cpu, pid, inicio, fin in self.segmentos():
+                nombre = nombres.get(pid, f"P{pid}") if nombres else f"P{pid}"
+                bloque.append(json.dumps({"name": nombre, "ph": "X", "ts": inicio, "dur": fin - inicio,
+                                          "pid": 1, "tid": cpu, "args": {"pid": pid}}, ensure_ascii=False))
+                cantidad += 1
+                if len(bloque) == _FILAS_POR_ESCRITURA:
+                    archivo.write(",\n" + ",\n".join(bloque))
+                    bloque = []
+            if bloque:
+                archivo.write(",\n" + ",\n".join(bloque))
+            archivo.write("\n]}\n")
+        return cantidad
@@ -0,0 +1,114 @@
+"""
+Evaluación vectorizada de lotes de cargas de trabajo con NumPy.
+
+Cada lote son B cargas de n procesos descritas por arreglos (B, n) de
+llegada, ráfaga, prioridad y tamaño de datos. Los resultados por proceso
+coinciden con los de ``SimuladorSIGET`` para las políticas no expropiativas
+FIFO, SJF y Prioridad, incluida la convención de espera del motor: la espera
+cuenta desde la admisión en el primer punto de decisión posterior a la
+llegada. ``espera_llegada`` cuenta desde la llegada y es la que conviene
+para comparar con las políticas expropiativas.
+"""
+
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional; solo lo necesita este módulo
+    np = None
+
+ALGORITMOS_LOTE = ("FIFO", "SJF", "Prioridad")
+
+
+@dataclass
+class ResultadoLote:
+    """Resultados por proceso, arreglos (B, n) en el orden de entrada"""
+    inicio: "np.ndarray"
+    fin: "np.ndarray"
+    espera: "np.ndarray"
+    respuesta: "np.ndarray"
+    espera_llegada: "np.ndarray"  # fin - llegada - ráfaga
+
+
+def _como_matriz(valores):
+    matriz = np.asarray(valores, dtype=np.int64)
+    return matriz[None, :] if matriz.ndim == 1 else matriz
+
+
+def _inicios_fifo(llegada, rafaga):
+    """Inicios en orden de llegada: fin_i = max(fin_{i-1}, a_i) + b_i con sumas acumuladas"""
+    acumulada = np.cumsum(rafaga, axis=1)
+    previa = acumulada - rafaga
+    # fin_i = acumulada_i + max_{j<=i}(a_j - previa_j)
+    fin = acumulada + np.maximum.accumulate(llegada - previa, axis=1)
+    return fin - rafaga
+
+
+def _inicios_por_clave(llegada, rafaga, clave):
+    """Inicios eligiendo la menor clave entre los admitidos; n pasos vectorizados sobre el lote"""
+    filas, cantidad = llegada.shape
+    indices = np.arange(filas)
+    # Empates por orden de admisión, que es la posición tras ordenar por llegada
+    compuesta = clave * cantidad + np.arange(cantidad)
+    infinito = np.iinfo(np.int64).max
+    pendiente = np.ones_like(llegada, dtype=bool)
+    inicio = np.empty_like(llegada)
+    tiempo = np.zeros(filas, dtype=np.int64)
+    for _ in range(cantidad):
+        # CPU ociosa: saltar a la próxima llegada pendiente
+        proxima = np.where(pendiente, llegada, infinito).min(axis=1)
+        tiempo = np.maximum(tiempo, proxima)
+        admitido = pendiente & (llegada <= tiempo[:, None])
+        elegido = np.where(admitido, compuesta, infinito).argmin(axis=1)
+        inicio[indices, elegido] = tiempo
+        pendiente[indices, elegido] = False
+        tiempo = tiempo + rafaga[indices, elegido]
+    return inicio
+
+
+def evaluar_lote(llegada, rafaga, prioridad=None, tamaño_datos=None, algoritmo="FIFO"):
+    """Calcula inicio, fin, espera y respuesta de cada proceso de cada carga.
+
+    FIFO se resuelve con ordenamiento y sumas acumuladas en O(B·n log n);
+    SJF y Prioridad avanzan n puntos de decisión vectorizados sobre las B
+    cargas, O(B·n²) operaciones de NumPy. ``tamaño_datos`` se acepta por
+    simetría con ``ProcesoSIGET``; como en el motor, no afecta la CPU.
+    """
+    if np is None:
+        raise ImportError("evaluar_lote requiere NumPy (pip install numpy)")
+    if algoritmo not in ALGORITMOS_LOTE:
+        raise ValueError(f"Algoritmo sin versión por lotes: {algoritmo}")
+    
+    llegada = _como_matriz(llegada)
+    rafaga = _como_matriz(rafaga)
+    prioridad = _como_matriz(prioridad) if prioridad is not None else np.ones_like(llegada)
+    if tamaño_datos is not None and _como_matriz(tamaño_datos).shape != llegada.shape:
+        raise ValueError("tamaño_datos no coincide con la forma del lote")
+    if rafaga.shape != llegada.shape or prioridad.shape != llegada.shape:
+        raise ValueError("llegada, ráfaga y prioridad deben tener la misma forma")
+    if llegada.size == 0:
+        return ResultadoLote(llegada.copy(), llegada.copy(), llegada.copy(), llegada.copy(), llegada.copy())
+    
+    # Orden estable por llegada, igual que el cursor de llegadas del motor
+    orden = np.argsort(llegada, axis=1, kind="stable")
+    llegada_o = np.take_along_axis(llegada, orden, axis=1)
+    rafaga_o = np.take_along_axis(rafaga, orden, axis=1)
+    if algoritmo == "FIFO":
+        inicio_o = _inicios_fifo(llegada_o, rafaga_o)
+    else:
+        clave = rafaga_o if algoritmo == "SJF" else np.take_along_axis(prioridad, orden, axis=1)
+        inicio_o = _inicios_por_clave(llegada_o, rafaga_o, clave)
+    fin_o = inicio_o + rafaga_o
+    
+    # Admisión: primer inicio de despacho (punto de decisión) >= llegada
+    despachos = np.sort(inicio_o, axis=1)
+    desplazamiento = (np.arange(llegada_o.shape[0]) * (int(fin_o.max()) + 1))[:, None]
+    posicion = np.searchsorted((despachos + desplazamiento).ravel(),
+                               (llegada_o + desplazamiento).ravel()).reshape(llegada_o.shape)
+    admision = despachos.ravel()[posicion]
+    
+    inverso = np.argsort(orden, axis=1)
+    inicio = np.take_along_axis(inicio_o, inverso, axis=1)
+    fin = np.take_along_axis(fin_o, inverso, axis=1)
+    espera = np.take_along_axis(inicio_o - admision, inverso, axis=1)
+    return ResultadoLote(inicio, fin, espera, fin - llegada, fin - llegada - rafaga)
@@ -0,0 +1,296 @@
+"""
+Motor del SIGET con N núcleos.
+
+``SimuladorMultinucleo`` reutiliza la interfaz de ``SimuladorSIGET``
+(``ejecutar_simulacion``, ``ejecutar_flujo``, callbacks, ``cambios`` y
+``estadisticas``) y reemplaza el bucle de eventos: el próximo núcleo en
+liberarse sale de un montículo de fines de rebanada, así que cada evento
+cuesta O(log N) además del costo de la cola de la política. Hay dos modos:
+
+- ``"compartida"``: una sola cola de listos para todos los núcleos.
+- ``"por_nucleo"``: una cola por núcleo, llegadas repartidas en ronda y
+  robo de trabajo cuando un núcleo queda sin procesos.
+
+Con un núcleo y cola compartida los resultados coinciden con
+``SimuladorSIGET`` para todas las políticas. El costo de conmutación y la
+instrumentación no se modelan: asignarlos es un ``NotImplementedError``.
+"""
+
+import heapq
+from itertools import chain
+from typing import Dict, Iterator, List, Optional
+
+from nucleo_siget import AlgoritmoPlanificacion, EstadoProceso, ProcesoSIGET, SimuladorSIGET
+
+MODOS = ("compartida", "por_nucleo")
+
+
+class ColasPorNucleo:
+    """Vista de solo lectura de las colas de cada núcleo como una sola cola de listos"""
+    __slots__ = ("colas",)
+
+    def __init__(self, colas):
+        self.colas = colas
+
+    def __len__(self):
+        return sum(len(cola) for cola in self.colas)
+
+    def __iter__(self):
+        return chain.from_iterable(self.colas)
+
+
+class SimuladorMultinucleo(SimuladorSIGET):
+    """Simula ``nucleos`` CPUs que despachan desde la cola compartida o desde colas propias"""
+
+    def __init__(self, nucleos: int = 4, modo: str = "compartida"):
+        super().__init__()
+        if nucleos < 1:
+            raise ValueError("Se necesita al menos un núcleo")
+        if modo not in MODOS:
+            raise ValueError(f"Modo desconocido: {modo!r} (opciones: {', '.join(MODOS)})")
+        self.nucleos = nucleos
+        self.modo = modo
+        self.procesos_actuales: List[Optional[ProcesoSIGET]] = [None] * nucleos
+        self.ocupado_por_nucleo: List[int] = [0] * nucleos
+        self.migraciones = 0
+        self.robos = 0
+        self.makespan = 0
+
+    def resetear_simulacion(self):
+        super().resetear_simulacion()
+        self.procesos_actuales = [None] * self.nucleos
+        self.ocupado_por_nucleo = [0] * self.nucleos
+        self.migraciones = 0
+        self.robos = 0
+        self.makespan = 0
+
+    @property
+    def utilizacion_por_nucleo(self) -> List[float]:
+        """Fracción del makespan en que cada núcleo estuvo ejecutando"""
+        if not self.makespan:
+            return [0.0] * self.nucleos
+        return [ocupado / self.makespan for ocupado in self.ocupado_por_nucleo]
+
+    @property
+    def utilizacion(self) -> float:
+        """Utilización media de los núcleos"""
+        porcentajes = self.utilizacion_por_nucleo
+        return sum(porcentajes) / len(porcentajes)
+
+    def _simular(self, llegadas: Iterator[ProcesoSIGET], callback_actualizacion, al_terminar):
+        """Bucle de eventos con un montículo de (fin de rebanada, núcleo, versión)"""
+        # El costo de conmutación y la instrumentación solo los modela el motor base
+        self._rechazar_no_admitidos("costo_conmutacion", "instrumentacion")
+        self.ejecutando = True
+        politica = AlgoritmoPlanificacion.politica(self.algoritmo_actual)
+        usa_quantum = politica.usa_quantum
+        expropiativa = politica.expropiativa
+        clave = politica.clave
+        quantum = self.quantum
+        nucleos = self.nucleos
+        compartida = self.modo == "compartida"
+
+        if compartida:
+            colas = [politica.crear_cola()] * nucleos
+            self.cola_listos = colas[0]
+        else:
+            colas = [politica.crear_cola() for _ in range(nucleos)]
+            self.cola_listos = ColasPorNucleo(colas)
+        cambios = self.cambios
+        estadisticas = self.estadisticas
+        linea_tiempo = self.linea_tiempo
+        pistas = [linea_tiempo.pista(nucleo) for nucleo in range(nucleos)] if linea_tiempo is not None else None
+
+        actuales = self.procesos_actuales
+        ocupado = self.ocupado_por_nucleo
+        inicio = [0] * nucleos  # Inicio de la rebanada (o de la última sincronización)
+        version = [0] * nucleos  # Invalida eventos de rebanadas desalojadas
+        libres = list(range(nucleos))  # Montículo: se ocupa primero el de menor índice
+        eventos = []  # (fin de rebanada, núcleo, versión)
+        # Política expropiativa con cola compartida: (-clave, núcleo, versión) del
+        # proceso en ejecución; las claves viejas solo sobreestiman (ver peor)
+        en_ejecucion = []
+        ultimo_nucleo: Dict[int, int] = {}  # Por identidad (los ids pueden repetirse), solo no terminados
+        en_colas = 0
+        reparto = 0
+
+        proxima = next(llegadas, None)
+        tiempo = self.tiempo_actual
+        despachos = admitidos = terminados = migraciones = robos = 0
+
+        def sincronizar(nucleo):
+            """Descuenta lo ejecutado desde ``inicio`` para que la clave sea la vigente"""
+            corrido = tiempo - inicio[nucleo]
+            if corrido:
+                actuales[nucleo].tiempo_restante -= corrido
+                ocupado[nucleo] += corrido
+                if pistas is not None:
+                    pistas[nucleo].agregar(actuales[nucleo].id, inicio[nucleo], tiempo)
+                inicio[nucleo] = tiempo
+
+        def despachar(nucleo, proceso):
+            nonlocal despachos, migraciones
+            proceso.estado = EstadoProceso.EN_EJECUCION
+            proceso.tiempo_espera += tiempo - proceso.listo_desde
+            proceso.listo_desde = None
+            if proceso.tiempo_inicio is None:
+                proceso.tiempo_inicio = tiempo
+            despachos += 1
+            anterior = ultimo_nucleo.get(id(proceso))
+            if anterior is not None and anterior != nucleo:
+                migraciones += 1
+            ultimo_nucleo[id(proceso)] = nucleo
+
+            rebanada = proceso.tiempo_restante
+            if usa_quantum and quantum < rebanada:
+                rebanada = quantum
+            actuales[nucleo] = proceso
+            inicio[nucleo] = tiempo
+            version[nucleo] += 1
+            heapq.heappush(eventos, (tiempo + rebanada, nucleo, version[nucleo]))
+            if expropiativa and compartida:
+                heapq.heappush(en_ejecucion, (-clave(proceso), nucleo, version[nucleo]))
+
+        def desalojar(nucleo):
+            proceso = actuales[nucleo]
+            proceso.estado = EstadoProceso.LISTO
+            proceso.listo_desde = tiempo
+            colas[nucleo].agregar(proceso)
+            actuales[nucleo] = None
+            version[nucleo] += 1
+            if cambios is not None:
+                cambios.append(proceso)
+
+        def peor():
+            """Núcleo cuyo proceso tiene la mayor clave vigente y esa clave.
+
+            Las claves (restante, prioridad) no crecen mientras el proceso
+            corre, así que una entrada vieja solo sobreestima: basta con
+            refrescar la cima hasta que su clave guardada sea la vigente.
+            """
+            while True:
+                negativa, nucleo, vigente = en_ejecucion[0]
+                if vigente != version[nucleo]:
+                    heapq.heappop(en_ejecucion)
+                    continue
+                sincronizar(nucleo)
+                actual = clave(actuales[nucleo])
+                if actual == -negativa:
+                    return nucleo, actual
+                heapq.heapreplace(en_ejecucion, (-actual, nucleo, vigente))
+
+        while True:
+            # Admitir los procesos que ya llegaron
+            destinos = []
+            while proxima is not None and proxima.tiempo_irrupcion <= tiempo:
+                proxima.estado = EstadoProceso.LISTO
+                proxima.listo_desde = tiempo
+                if compartida:
+                    destino = 0
+                else:
+                    destino = reparto
+                    reparto = (reparto + 1) % nucleos
+                    destinos.append(destino)
+                colas[destino].agregar(proxima)
+                en_colas += 1
+                admitidos += 1
+                if cambios is not None:
+                    cambios.append(proxima)
+                proxima = next(llegadas, None)
+
+            # Ocupar los núcleos libres; sin trabajo propio, robar de otra cola
+            while libres and en_colas:
+                nucleo = heapq.heappop(libres)
+                cola = colas[nucleo]
+                if not cola:
+                    victima = nucleo
+                    while True:
+                        victima = (victima + 1) % nucleos
+                        if colas[victima]:
+                            break
+                    cola = colas[victima]
+                    robos += 1
+                en_colas -= 1
+                despachar(nucleo, cola.extraer())
+
+            # Política expropiativa: un proceso listo mejor desaloja al peor en ejecución
+            if expropiativa and en_colas:
+                if compartida:
+                    cola = colas[0]
+                    while cola:
+                        nucleo, peor_clave = peor()
+                        if not cola.clave_minima() < peor_clave:
+                            break
+                        desalojar(nucleo)
+                        despachar(nucleo, cola.extraer())
+                else:
+                    for nucleo in set(destinos):
+                        cola = colas[nucleo]
+                        if cola and actuales[nucleo] is not None:
+                            sincronizar(nucleo)
+                            if cola.clave_minima() < clave(actuales[nucleo]):
+                                desalojar(nucleo)
+                                despachar(nucleo, cola.extraer())
+
+            # Próximo evento: fin de una rebanada o, si hay núcleos libres o la
+            # política es expropiativa, la próxima llegada
+            while eventos and eventos[0][2] != version[eventos[0][1]]:
+                heapq.heappop(eventos)
+            siguiente = eventos[0][0] if eventos else None
+            if proxima is not None and (libres or expropiativa):
+                if siguiente is None or proxima.tiempo_irrupcion < siguiente:
+                    siguiente = proxima.tiempo_irrupcion
+            if siguiente is None:
+                break
+            tiempo = siguiente
+
+            # Cerrar las rebanadas que terminan ahora
+            while eventos and eventos[0][0] == tiempo:
+                _, nucleo, vigente = heapq.heappop(eventos)
+                if vigente != version[nucleo]:
+                    continue
+                sincronizar(nucleo)
+                proceso = actuales[nucleo]
+                if cambios is not None:
+                    cambios.append(proceso)
+                actuales[nucleo] = None
+                version[nucleo] += 1
+                heapq.heappush(libres, nucleo)
+                if proceso.tiempo_restante <= 0:
+                    proceso.estado = EstadoProceso.TERMINADO
+                    proceso.tiempo_fin = tiempo
+                    proceso.tiempo_respuesta = tiempo - proceso.tiempo_irrupcion
+                    del ultimo_nucleo[id(proceso)]
+                    terminados += 1
+                    if estadisticas is not None:
+                        estadisticas.registrar(proceso)
+                    if al_terminar is not None:
+                        al_terminar(proceso)
+                else:
+                    # Round Robin: vuelve al final de la cola de su núcleo
+                    proceso.estado = EstadoProceso.LISTO
+                    proceso.listo_desde = tiempo
+                    colas[nucleo].agregar(proceso)
+                    en_colas += 1
+
+            # Callback para actualizar la interfaz
+            if callback_actualizacion:
+                self.tiempo_actual = tiempo
+                self.proceso_actual = next((p for p in actuales if p is not None), None)
+                self.despachos = despachos
+                self.cantidad_admitidos = admitidos
+                self.cantidad_terminados = terminados
+                self.migraciones = migraciones
+                self.robos = robos
+                callback_actualizacion()
+
+        self.tiempo_actual = self.makespan = tiempo
+        self.proceso_actual = None
+        self.despachos = despachos
+        self.cantidad_admitidos = admitidos
+        self.cantidad_terminados = terminados
+        self.migraciones = migraciones
+        self.robos = robos
+        self.ejecutando = False
+        if callback_actualizacion:
+            callback_actualizacion()
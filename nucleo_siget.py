@@ -0,0 +1,636 @@
+"""
+Núcleo del simulador SIGET: modelo de procesos y motor de planificación.
+
+Este módulo no depende de tkinter, de modo que el motor puede ejecutarse
+sin pantalla (servidores, pruebas, barridos de parámetros).
+"""
+
+import copy
+import heapq
+import random
+from collections import deque
+from enum import Enum
+from dataclasses import dataclass
+from operator import attrgetter, itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from estadisticas_siget import EstadisticasSimulacion
+from incremental_siget import PuntoControl, PuntosControl
+from instrumentacion_siget import RAIZ, Instrumentacion
+from linea_tiempo_siget import LineaTiempo
+
+
+class EstadoProceso(Enum):
+    NUEVO = "Nuevo"
+    LISTO = "Listo"
+    EN_EJECUCION = "En Ejecución"
+    BLOQUEADO = "Bloqueado"
+    TERMINADO = "Terminado"
+
+class TipoProceso(Enum):
+    MONITOREO_TRAFICO = "Monitoreo de Tráfico"
+    GESTION_SEMAFOROS = "Gestión de Semáforos"
+    ANALISIS_DATOS = "Análisis de Datos"
+
+@dataclass
+class ProcesoSIGET:
+    id: int
+    nombre: str
+    tipo: TipoProceso
+    tiempo_irrupcion: int  # Tiempo de llegada
+    tiempo_ejecucion: int  # Tiempo de CPU necesario
+    prioridad_alerta: int  # 1-5 (1 = máxima prioridad)
+    tamaño_datos: int  # MB
+    estado: EstadoProceso = EstadoProceso.NUEVO
+    tiempo_restante: int = 0
+    tiempo_espera: int = 0  # Liquidado al salir de la cola de listos (ver espera_en)
+    tiempo_respuesta: int = 0
+    tiempo_inicio: Optional[int] = None
+    tiempo_fin: Optional[int] = None
+    listo_desde: Optional[int] = None  # Entrada a la cola de listos (None si no está en ella)
+    
+    def espera_en(self, tiempo: int) -> int:
+        """Tiempo de espera en el instante ``tiempo``, calculado en O(1)"""
+        if self.listo_desde is None:
+            return self.tiempo_espera
+        return self.tiempo_espera + tiempo - self.listo_desde
+    
+    @property
+    def espera_desde_llegada(self) -> Optional[int]:
+        """Tiempo sin CPU desde la llegada hasta el fin (None si no terminó).
+
+        A diferencia de ``tiempo_espera``, que cuenta desde la admisión, no
+        depende de cuándo la política vuelve a decidir: sirve para comparar
+        políticas expropiativas con no expropiativas.
+        """
+        if self.tiempo_fin is None:
+            return None
+        return self.tiempo_fin - self.tiempo_irrupcion - self.tiempo_ejecucion
+
+class AlgoritmoPlanificacion:
+    @staticmethod
+    def fifo(procesos: List[ProcesoSIGET]) -> List[ProcesoSIGET]:
+        """First In, First Out - Ordena por tiempo de irrupción"""
+        return sorted(procesos, key=lambda p: p.tiempo_irrupcion)
+    
+    @staticmethod
+    def sjf(procesos: List[ProcesoSIGET]) -> List[ProcesoSIGET]:
+        """Shortest Job First - Ordena por tiempo de ejecución"""
+        return sorted(procesos, key=lambda p: p.tiempo_ejecucion)
+    
+    @staticmethod
+    def prioridad(procesos: List[ProcesoSIGET]) -> List[ProcesoSIGET]:
+        """Por prioridad de alerta (menor número = mayor prioridad)"""
+        return sorted(procesos, key=lambda p: p.prioridad_alerta)
+    
+    @staticmethod
+    def round_robin(procesos: List[ProcesoSIGET], quantum: int = 2) -> List[ProcesoSIGET]:
+        """Round Robin - Implementación especial con quantum"""
+        # Para Round Robin, devolvemos la lista original ya que se maneja diferente
+        return procesos
+
+    @staticmethod
+    def politica(algoritmo: str) -> "PoliticaPlanificacion":
+        """Devuelve la política registrada para el algoritmo"""
+        return POLITICAS[algoritmo]
+    
+    @staticmethod
+    def crear_cola(algoritmo: str) -> "ColaFIFO":
+        """Crea la cola de listos que corresponde al algoritmo"""
+        return POLITICAS[algoritmo].crear_cola()
+
+class ColaFIFO:
+    """Cola de listos en orden de admisión (FIFO y Round Robin) sobre un deque"""
+    __slots__ = ("_cola",)
+    
+    def __init__(self):
+        self._cola = deque()
+    
+    def agregar(self, proceso: ProcesoSIGET):
+        """Encola el proceso al final en O(1)"""
+        self._cola.append(proceso)
+    
+    def extraer(self) -> ProcesoSIGET:
+        """Saca el primer proceso en O(1)"""
+        return self._cola.popleft()
+    
+    def __len__(self):
+        return len(self._cola)
+    
+    def __iter__(self):
+        return iter(self._cola)
+    
+    def estado(self) -> tuple:
+        """Contenido en orden, para puntos de control"""
+        return tuple(self._cola)
+    
+    def restaurar(self, estado: tuple):
+        self._cola.clear()
+        self._cola.extend(estado)
+    
+    @staticmethod
+    def firma(estado: tuple) -> tuple:
+        """Identidad del orden de despacho de un ``estado()``"""
+        return tuple(map(id, estado))
+
+class ColaPrioridad:
+    """Cola de listos sobre un montículo binario ordenado por ``clave``.
+
+    Sale primero el proceso de menor clave; los empates se resuelven por
+    orden de admisión. Agregar y extraer cuestan O(log n), consultar el
+    mínimo O(1).
+    """
+    __slots__ = ("_monticulo", "_clave", "_secuencia")
+    
+    def __init__(self, clave: Callable[[ProcesoSIGET], int]):
+        self._monticulo = []
+        self._clave = clave
+        self._secuencia = 0
+    
+    def agregar(self, proceso: ProcesoSIGET):
+        """Inserta el proceso en O(log n)"""
+        self._secuencia += 1
+        heapq.heappush(self._monticulo, (self._clave(proceso), self._secuencia, proceso))
+    
+    def extraer(self) -> ProcesoSIGET:
+        """Saca el proceso de menor clave en O(log n)"""
+        return heapq.heappop(self._monticulo)[-1]
+    
+    def clave_minima(self):
+        """Clave del próximo proceso a despachar en O(1)"""
+        return self._monticulo[0][0]
+    
+    def __len__(self):
+        return len(self._monticulo)
+    
+    def __iter__(self):
+        # Orden del montículo, no de despacho
+        return (entrada[-1] for entrada in self._monticulo)
+    
+    def estado(self) -> tuple:
+        """Entradas del montículo y secuencia, para puntos de control"""
+        return tuple(self._monticulo), self._secuencia
+    
+    def restaurar(self, estado: tuple):
+        entradas, self._secuencia = estado
+        self._monticulo[:] = entradas
+    
+    @staticmethod
+    def firma(estado: tuple) -> tuple:
+        """Orden de despacho de un ``estado()``: la secuencia absoluta no importa, solo la relativa"""
+        return tuple((entrada[0], id(entrada[-1])) for entrada in sorted(estado[0], key=itemgetter(0, 1)))
+
+class PoliticaPlanificacion:
+    """Política de planificación: elige entre los procesos listos en cada punto de decisión.
+
+    Los puntos de decisión son el fin de un proceso, la expiración del
+    quantum (``usa_quantum``) y, en las políticas expropiativas, cada
+    llegada: el proceso en ejecución se reemplaza si el mejor proceso listo
+    tiene una ``clave`` estrictamente menor. Sin ``clave`` la cola es FIFO.
+    """
+    
+    def __init__(self, nombre: str, clave: Optional[Callable[[ProcesoSIGET], int]] = None,
+                 expropiativa: bool = False, usa_quantum: bool = False):
+        self.nombre = nombre
+        self.clave = clave
+        self.expropiativa = expropiativa
+        self.usa_quantum = usa_quantum
+    
+    def crear_cola(self):
+        """Cola de listos de la política: deque O(1) o montículo O(log n) por operación"""
+        if self.clave is None:
+            return ColaFIFO()
+        return ColaPrioridad(self.clave)
+
+# Políticas disponibles por nombre; registrar aquí algoritmos nuevos.
+# Costo por despacho: FIFO y Round Robin O(1); el resto O(log n), con una
+# comparación O(1) adicional por llegada en las expropiativas.
+POLITICAS: Dict[str, PoliticaPlanificacion] = {
+    "FIFO": PoliticaPlanificacion("FIFO"),
+    "SJF": PoliticaPlanificacion("SJF", attrgetter("tiempo_restante")),
+    "Prioridad": PoliticaPlanificacion("Prioridad", attrgetter("prioridad_alerta")),
+    "Round Robin": PoliticaPlanificacion("Round Robin", usa_quantum=True),
+    "SRTF": PoliticaPlanificacion("SRTF", attrgetter("tiempo_restante"), expropiativa=True),
+    "Prioridad Expropiativa": PoliticaPlanificacion(
+        "Prioridad Expropiativa", attrgetter("prioridad_alerta"), expropiativa=True),
+}
+
+class CostoConmutacion:
+    """Tiempo que se pierde al despachar un proceso, en unidades enteras.
+
+    Cada despacho paga ``despacho``; si además cambia el proceso que ocupa
+    la CPU se paga el cambio de contexto: ``por_tipo[tipo]`` (o
+    ``cambio_contexto`` si el tipo no figura) más ``por_mb`` por cada MB de
+    ``tamaño_datos``, que aproxima recargar el conjunto de trabajo.
+    """
+    
+    def __init__(self, cambio_contexto: int = 0, despacho: int = 0,
+                 por_tipo: Optional[Dict[TipoProceso, int]] = None, por_mb: float = 0.0):
+        self.cambio_contexto = cambio_contexto
+        self.despacho = despacho
+        self.por_tipo = por_tipo or {}
+        self.por_mb = por_mb
+    
+    def firma(self) -> tuple:
+        """Valores que determinan el costo; el objeto es mutable, así que se compara esto"""
+        return (self.cambio_contexto, self.despacho,
+                tuple(sorted((tipo.name, valor) for tipo, valor in self.por_tipo.items())), self.por_mb)
+    
+    def __call__(self, proceso: ProcesoSIGET, cambio: bool) -> int:
+        costo = self.despacho
+        if cambio:
+            costo += self.por_tipo.get(proceso.tipo, self.cambio_contexto)
+            if self.por_mb:
+                costo += int(proceso.tamaño_datos * self.por_mb)
+        return costo
+
+def iterar_procesos_aleatorios(cantidad: int, semilla: int = 0, carga: float = 0.9) -> Iterator[ProcesoSIGET]:
+    """Genera en flujo, ordenados por llegada, los mismos procesos que ``generar_procesos_aleatorios``"""
+    azar = random.Random(semilla)
+    tipos = list(TipoProceso)
+    tiempo = 0
+    for i in range(cantidad):
+        ejecucion = azar.randint(1, 12)
+        yield ProcesoSIGET(i + 1, f"P{i + 1}", azar.choice(tipos), tiempo,
+                           ejecucion, azar.randint(1, 5), azar.randint(10, 300),
+                           tiempo_restante=ejecucion)
+        # Separación media de 6.5 / carga unidades entre llegadas
+        tiempo += azar.randint(0, int(13 / carga))
+
+def generar_procesos_aleatorios(cantidad: int, semilla: int = 0, carga: float = 0.9) -> List[ProcesoSIGET]:
+    """Genera procesos aleatorios reproducibles con la utilización de CPU indicada"""
+    return list(iterar_procesos_aleatorios(cantidad, semilla, carga))
+
+class SimuladorSIGET:
+    def __init__(self):
+        self.procesos: List[ProcesoSIGET] = []
+        self.procesos_terminados: List[ProcesoSIGET] = []
+        self.algoritmo_actual = "FIFO"
+        self.quantum = 2
+        self.tiempo_actual = 0
+        self.ejecutando = False
+        self.proceso_actual: Optional[ProcesoSIGET] = None
+        self.cola_listos: List[ProcesoSIGET] = []
+        self.despachos = 0
+        self.cantidad_admitidos = 0
+        self.cantidad_terminados = 0
+        # Procesos en E/S; el motor base no bloquea (ver dispositivos_siget)
+        self.cantidad_bloqueados = 0
+        # Si es una lista, el motor agrega cada proceso cuyo estado o tiempos
+        # cambian; quien la consume (p. ej. canal_siget) la vacía
+        self.cambios: Optional[List[ProcesoSIGET]] = None
+        # Costo de despacho y cambio de contexto (None = gratis) y sus métricas
+        self.costo_conmutacion: Optional[CostoConmutacion] = None
+        self.cambios_contexto = 0
+        self.tiempo_sobrecarga = 0
+        self.tiempo_util = 0
+        # Si se asigna un EstadisticasSimulacion, el motor registra en él
+        # cada terminación (ver estadisticas_siget)
+        self.estadisticas: Optional[EstadisticasSimulacion] = None
+        # Tramos y contadores por fase del motor (ver instrumentacion_siget)
+        self.instrumentacion: Optional[Instrumentacion] = None
+        # Segmentos de ejecución por CPU para el diagrama de Gantt (ver linea_tiempo_siget)
+        self.linea_tiempo: Optional[LineaTiempo] = None
+        # Puntos de control para re-simular solo lo que cambia (ver incremental_siget)
+        self.puntos_control: Optional[PuntosControl] = None
+        # Estado del bucle si ejecutar_hasta dejó la simulación en pausa
+        self.pausa: Optional[PuntoControl] = None
+        # ids de procesos compartidos con otras ramas (ver estado_siget); se
+        # copian antes de escribirlos
+        self.compartidos: Optional[frozenset] = None
+        
+    def crear_procesos_ejemplo(self):
+        """Crea procesos de ejemplo para el SIGET"""
+        self.procesos = [
+            ProcesoSIGET(1, "Monitoreo Centro", TipoProceso.MONITOREO_TRAFICO, 0, 8, 1, 150),
+            ProcesoSIGET(2, "Semaforos Avenida Principal", TipoProceso.GESTION_SEMAFOROS, 2, 5, 2, 80),
+            ProcesoSIGET(3, "Análisis Patrones", TipoProceso.ANALISIS_DATOS, 4, 12, 3, 300),
+            ProcesoSIGET(4, "Monitoreo Periferia", TipoProceso.MONITOREO_TRAFICO, 6, 6, 2, 120),
+            ProcesoSIGET(5, "Semaforos Intersección", TipoProceso.GESTION_SEMAFOROS, 8, 3, 1, 60),
+            ProcesoSIGET(6, "Reporte Estadísticas", TipoProceso.ANALISIS_DATOS, 10, 7, 4, 200)
+        ]
+        
+        # Inicializar tiempo restante
+        for proceso in self.procesos:
+            proceso.tiempo_restante = proceso.tiempo_ejecucion
+    
+    def crear_procesos_aleatorios(self, cantidad: int, semilla: int = 0):
+        """Crea una carga aleatoria reproducible a partir de ``semilla``"""
+        self.procesos = generar_procesos_aleatorios(cantidad, semilla)
+    
+    def resetear_simulacion(self):
+        """Reinicia la simulación"""
+        self.tiempo_actual = 0
+        self.ejecutando = False
+        self.proceso_actual = None
+        self.pausa = None
+        self.cola_listos = []
+        self.procesos_terminados = []
+        self.despachos = 0
+        self.cantidad_admitidos = 0
+        self.cantidad_terminados = 0
+        self.cantidad_bloqueados = 0
+        self.cambios_contexto = 0
+        self.tiempo_sobrecarga = 0
+        self.tiempo_util = 0
+        if self.cambios is not None:
+            self.cambios.extend(self.procesos)
+        if self.estadisticas is not None:
+            self.estadisticas.reiniciar()
+        if self.linea_tiempo is not None:
+            self.linea_tiempo.limpiar()
+        if self.puntos_control is not None:
+            self.puntos_control.limpiar()
+        self.descompartir()
+        
+        for proceso in self.procesos:
+            proceso.estado = EstadoProceso.NUEVO
+            proceso.tiempo_restante = proceso.tiempo_ejecucion
+            proceso.tiempo_espera = 0
+            proceso.listo_desde = None
+            proceso.tiempo_respuesta = 0
+            proceso.tiempo_inicio = None
+            proceso.tiempo_fin = None
+    
+    def descompartir(self):
+        """Reemplaza los procesos compartidos con otras ramas por copias propias"""
+        if self.compartidos:
+            compartidos = self.compartidos
+            self.procesos = [copy.copy(proceso) if id(proceso) in compartidos else proceso
+                             for proceso in self.procesos]
+        self.compartidos = None
+    
+    @property
+    def eficiencia_cpu(self) -> float:
+        """Fracción del tiempo de CPU usado en ejecutar procesos y no en conmutar"""
+        total = self.tiempo_util + self.tiempo_sobrecarga
+        return self.tiempo_util / total if total else 1.0
+    
+    def tiempo_espera_actual(self, proceso: ProcesoSIGET) -> int:
+        """Tiempo de espera de ``proceso`` en el instante actual de la simulación"""
+        return proceso.espera_en(self.tiempo_actual)
+    
+    def ejecutar_simulacion(self, callback_actualizacion=None):
+        """Ejecuta la simulación por eventos discretos, sin pausas.
+
+        El reloj salta directamente al siguiente evento: una llegada (si la
+        CPU está ociosa o la política es expropiativa), el fin de un proceso
+        o la expiración del quantum. El ritmo visual, si se necesita, lo
+        aporta ``callback_actualizacion``. Las llegadas se recorren con un
+        cursor sobre los procesos ordenados por ``tiempo_irrupcion`` y la
+        política elige sobre la cola de listos vigente, así que una corrida
+        cuesta O(n log n). El tiempo de espera se liquida al salir de la cola
+        de listos (ver ``ProcesoSIGET.espera_en``) en lugar de recorrerla en
+        cada paso.
+        """
+        self.resetear_simulacion()
+        self._simular(iter(self._ordenar_carga()), callback_actualizacion, self.procesos_terminados.append)
+    
+    def _ordenar_carga(self) -> List[ProcesoSIGET]:
+        ordenados = sorted(self.procesos, key=attrgetter("tiempo_irrupcion"))
+        if self.puntos_control is not None:
+            self.puntos_control.iniciar(ordenados, self.configuracion())
+        return ordenados
+    
+    def configuracion(self) -> tuple:
+        """Algoritmo, quantum y valores del costo de conmutación, comparables entre corridas"""
+        costo = self.costo_conmutacion
+        return self.algoritmo_actual, self.quantum, costo.firma() if costo is not None else None
+    
+    def ejecutar_hasta(self, limite: Optional[int], callback_actualizacion=None) -> bool:
+        """Simula hasta el primer punto de decisión en o después de ``limite`` y pausa.
+
+        Si la simulación está en pausa la continúa (``limite=None``: hasta el
+        final); si no, empieza desde cero como ``ejecutar_simulacion``. Los
+        procesos que aún no llegaron, incluidos los agregados o editados
+        durante la pausa, se reinician antes de seguir. Devuelve True si quedó
+        en pausa y False si terminó (ver estado_siget para capturar, restaurar
+        y bifurcar el estado en pausa).
+        """
+        if type(self)._simular is not SimuladorSIGET._simular:
+            raise NotImplementedError(f"{type(self).__name__} no admite pausas")
+        pausa = self.pausa
+        if pausa is None:
+            self.resetear_simulacion()
+            llegadas = iter(self._ordenar_carga())
+        else:
+            pendientes = sorted(((indice, proceso) for indice, proceso in enumerate(self.procesos)
+                                 if proceso.estado is EstadoProceso.NUEVO),
+                                key=lambda par: par[1].tiempo_irrupcion)
+            llegadas = self._reiniciar_al_llegar(pendientes)
+        self._simular(llegadas, callback_actualizacion, self.procesos_terminados.append,
+                      reanudar=pausa, hasta=limite)
+        return self.pausa is not None
+    
+    def _rechazar_no_admitidos(self, *atributos: str):
+        """Para motores de subclases: error si está asignado un gancho que su bucle no atiende"""
+        for atributo in atributos:
+            if getattr(self, atributo) is not None:
+                raise NotImplementedError(f"{type(self).__name__} no admite {atributo}")
+    
+    def _reiniciar_al_llegar(self, pendientes) -> Iterator[ProcesoSIGET]:
+        """Reinicia cada proceso pendiente cuando el motor lo pide; copia antes los compartidos"""
+        compartidos = self.compartidos
+        for indice, proceso in pendientes:
+            if compartidos and id(proceso) in compartidos:
+                proceso = self.procesos[indice] = copy.copy(proceso)
+            proceso.tiempo_restante = proceso.tiempo_ejecucion
+            proceso.tiempo_espera = 0
+            proceso.listo_desde = None
+            proceso.tiempo_respuesta = 0
+            proceso.tiempo_inicio = None
+            proceso.tiempo_fin = None
+            yield proceso
+    
+    def ejecutar_flujo(self, fuente: Iterable[ProcesoSIGET], callback_actualizacion=None,
+                       al_terminar: Optional[Callable[[ProcesoSIGET], None]] = None):
+        """Simula procesos que llegan de un iterable ordenado por ``tiempo_irrupcion``.
+
+        La fuente se consume a medida que el reloj alcanza cada llegada, así
+        que la memoria queda acotada por la cola de listos y no por el largo
+        de la traza (ver ``carga_siget``). Los procesos terminados no se
+        guardan: se entregan a ``al_terminar``, si se indica.
+        """
+        self.resetear_simulacion()
+        self._simular(iter(fuente), callback_actualizacion, al_terminar)
+    
+    def _simular(self, llegadas: Iterator[ProcesoSIGET], callback_actualizacion, al_terminar,
+                 reanudar: Optional[PuntoControl] = None, hasta: Optional[int] = None):
+        """Bucle de eventos sobre un iterador de llegadas ordenadas.
+
+        Con ``reanudar`` se parte del reloj, la cola y los contadores de ese
+        punto de control; ``llegadas`` empieza en la primera no admitida. Con
+        ``hasta``, el bucle se detiene en el primer punto de decisión con el
+        reloj en ``hasta`` o después y deja su estado en ``self.pausa``.
+
+        Las llegadas se admiten en los puntos de decisión, y ``tiempo_espera``
+        cuenta desde la admisión: en las políticas no expropiativas, la
+        espera entre la llegada y el siguiente punto de decisión no se
+        incluye. Para comparar políticas, ver ``ProcesoSIGET.espera_desde_llegada``.
+        """
+        self.ejecutando = True
+        politica = AlgoritmoPlanificacion.politica(self.algoritmo_actual)
+        usa_quantum = politica.usa_quantum
+        expropiativa = politica.expropiativa
+        clave = politica.clave
+        quantum = self.quantum
+        
+        self.cola_listos = cola = politica.crear_cola()
+        agregar = cola.agregar
+        extraer = cola.extraer
+        cambios = self.cambios
+        estadisticas = self.estadisticas
+        costo = self.costo_conmutacion
+        medir = self.instrumentacion
+        pista = self.linea_tiempo.pista(0) if self.linea_tiempo is not None else None
+        if medir is not None:
+            inicio_corrida = marca = medir.reloj()
+        proxima = next(llegadas, None)
+        tiempo = self.tiempo_actual
+        anterior = None
+        cambios_contexto = sobrecarga = util = 0
+        despachos = 0
+        admitidos = 0
+        terminados = 0
+        proceso = None
+        pausa = None
+        puntos = self.puntos_control
+        if reanudar is not None:
+            cola.restaurar(reanudar.cola)
+            tiempo, proceso, anterior = reanudar.tiempo, reanudar.proceso, reanudar.anterior
+            despachos, admitidos, terminados, cambios_contexto, sobrecarga, util = reanudar.contadores
+        
+        while True:
+            # Punto de control; en una re-simulación, termina si el plan convergió
+            if puntos is not None and tiempo >= puntos.proximo:
+                if puntos.capturar(tiempo, proceso, anterior, cola,
+                                   (despachos, admitidos, terminados, cambios_contexto, sobrecarga, util)):
+                    break
+            if hasta is not None and tiempo >= hasta and (proceso is not None or cola or proxima is not None):
+                pausa = PuntoControl(tiempo, proceso, anterior, cola.estado(),
+                                     (despachos, admitidos, terminados, cambios_contexto, sobrecarga, util), ())
+                break
+            
+            # Admitir los procesos que ya llegaron
+            while proxima is not None and proxima.tiempo_irrupcion <= tiempo:
+                proxima.estado = EstadoProceso.LISTO
+                proxima.listo_desde = tiempo
+                agregar(proxima)
+                admitidos += 1
+                if cambios is not None:
+                    cambios.append(proxima)
+                proxima = next(llegadas, None)
+            
+            # Política expropiativa: una llegada mejor desaloja al proceso actual
+            if proceso is not None and cola and cola.clave_minima() < clave(proceso):
+                proceso.estado = EstadoProceso.LISTO
+                proceso.listo_desde = tiempo
+                agregar(proceso)
+                if cambios is not None:
+                    cambios.append(proceso)
+                proceso = None
+                if medir is not None:
+                    medir.contar("desalojos")
+            if medir is not None:
+                marca = medir.tramo("admision", marca)
+            
+            # Seleccionar siguiente proceso
+            if proceso is None:
+                if not cola:
+                    if proxima is None:
+                        break
+                    # CPU ociosa: saltar a la siguiente llegada
+                    tiempo = proxima.tiempo_irrupcion
+                    if medir is not None:
+                        medir.contar("cpu_ociosa")
+                    continue
+                proceso = extraer()
+                cambio = proceso is not anterior
+                if cambio:
+                    cambios_contexto += 1
+                    anterior = proceso
+                if costo is not None:
+                    # El proceso sigue esperando mientras se conmuta
+                    costo_despacho = costo(proceso, cambio)
+                    tiempo += costo_despacho
+                    sobrecarga += costo_despacho
+                if medir is not None:
+                    marca = medir.tramo("seleccion", marca)
+                proceso.estado = EstadoProceso.EN_EJECUCION
+                proceso.tiempo_espera += tiempo - proceso.listo_desde
+                proceso.listo_desde = None
+                if proceso.tiempo_inicio is None:
+                    proceso.tiempo_inicio = tiempo
+                despachos += 1
+                if medir is not None:
+                    marca = medir.tramo("espera", marca)
+            
+            # Avanzar el reloj hasta el fin del proceso, del quantum o, si la
+            # política es expropiativa, hasta la próxima llegada
+            rebanada = proceso.tiempo_restante
+            if usa_quantum and quantum < rebanada:
+                rebanada = quantum
+            if expropiativa and proxima is not None:
+                hasta_llegada = proxima.tiempo_irrupcion - tiempo
+                if hasta_llegada < rebanada:
+                    # Negativo si la llegada ocurrió durante la conmutación
+                    rebanada = hasta_llegada if hasta_llegada > 0 else 0
+            proceso.tiempo_restante -= rebanada
+            tiempo += rebanada
+            util += rebanada
+            if pista is not None and rebanada:
+                pista.agregar(proceso.id, tiempo - rebanada, tiempo)
+            if cambios is not None:
+                cambios.append(proceso)
+            
+            if proceso.tiempo_restante <= 0:
+                proceso.estado = EstadoProceso.TERMINADO
+                proceso.tiempo_fin = tiempo
+                proceso.tiempo_respuesta = tiempo - proceso.tiempo_irrupcion
+                terminados += 1
+                if estadisticas is not None:
+                    estadisticas.registrar(proceso)
+                if al_terminar is not None:
+                    al_terminar(proceso)
+                proceso = None
+            elif not expropiativa:
+                # Round Robin: vuelve al final de la cola
+                proceso.estado = EstadoProceso.LISTO
+                proceso.listo_desde = tiempo
+                agregar(proceso)
+                proceso = None
+            if medir is not None:
+                marca = medir.tramo("ejecucion", marca)
+            
+            # Callback para actualizar la interfaz
+            if callback_actualizacion:
+                self.tiempo_actual = tiempo
+                self.proceso_actual = proceso
+                self.despachos = despachos
+                self.cantidad_admitidos = admitidos
+                self.cantidad_terminados = terminados
+                self.cambios_contexto = cambios_contexto
+                self.tiempo_sobrecarga = sobrecarga
+                self.tiempo_util = util
+                callback_actualizacion()
+                if medir is not None:
+                    marca = medir.tramo("callback", marca)
+        
+        self.tiempo_actual = tiempo
+        self.proceso_actual = proceso if pausa is not None else None
+        self.pausa = pausa
+        self.despachos = despachos
+        self.cantidad_admitidos = admitidos
+        self.cantidad_terminados = terminados
+        self.cambios_contexto = cambios_contexto
+        self.tiempo_sobrecarga = sobrecarga
+        self.tiempo_util = util
+        self.ejecutando = False
+        if medir is not None:
+            medir.tramo(RAIZ, inicio_corrida)
+            medir.contar("llegadas", admitidos)
+            medir.contar("despachos", despachos)
+            medir.contar("terminaciones", terminados)
+            medir.contar("cambios_contexto", cambios_contexto)
+        if callback_actualizacion:
+            callback_actualizacion()
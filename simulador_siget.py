@@ -1,182 +1,39 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
+import asyncio
 import threading
 import time
-from enum import Enum
-from dataclasses import dataclass
-from typing import List, Optional
-import random
 
-class EstadoProceso(Enum):
-    NUEVO = "Nuevo"
-    LISTO = "Listo"
-    EN_EJECUCION = "En Ejecución"
-    BLOQUEADO = "Bloqueado"
-    TERMINADO = "Terminado"
+from nucleo_siget import (
+    EstadoProceso, TipoProceso, ProcesoSIGET,
+    AlgoritmoPlanificacion, SimuladorSIGET, POLITICAS
+)
+from cache_siget import CacheResultados, simular_con_cache
+from canal_siget import CanalInstantaneas, fila_de_proceso
+from tabla_virtual_siget import TablaVirtual
+from gantt_siget import DiagramaGantt
+from linea_tiempo_siget import LineaTiempo
+from tiempo_real_siget import ReproductorTiempoReal
 
-class TipoProceso(Enum):
-    MONITOREO_TRAFICO = "Monitoreo de Tráfico"
-    GESTION_SEMAFOROS = "Gestión de Semáforos"
-    ANALISIS_DATOS = "Análisis de Datos"
-
-@dataclass
-class ProcesoSIGET:
-    id: int
-    nombre: str
-    tipo: TipoProceso
-    tiempo_irrupcion: int  # Tiempo de llegada
-    tiempo_ejecucion: int  # Tiempo de CPU necesario
-    prioridad_alerta: int  # 1-5 (1 = máxima prioridad)
-    tamaño_datos: int  # MB
-    estado: EstadoProceso = EstadoProceso.NUEVO
-    tiempo_restante: int = 0
-    tiempo_espera: int = 0
-    tiempo_respuesta: int = 0
-    tiempo_inicio: Optional[int] = None
-    tiempo_fin: Optional[int] = None
-
-class AlgoritmoPlanificacion:
-    @staticmethod
-    def fifo(procesos: List[ProcesoSIGET]) -> List[ProcesoSIGET]:
-        """First In, First Out - Ordena por tiempo de irrupción"""
-        return sorted(procesos, key=lambda p: p.tiempo_irrupcion)
-    
-    @staticmethod
-    def sjf(procesos: List[ProcesoSIGET]) -> List[ProcesoSIGET]:
-        """Shortest Job First - Ordena por tiempo de ejecución"""
-        return sorted(procesos, key=lambda p: p.tiempo_ejecucion)
-    
-    @staticmethod
-    def prioridad(procesos: List[ProcesoSIGET]) -> List[ProcesoSIGET]:
-        """Por prioridad de alerta (menor número = mayor prioridad)"""
-        return sorted(procesos, key=lambda p: p.prioridad_alerta)
-    
-    @staticmethod
-    def round_robin(procesos: List[ProcesoSIGET], quantum: int = 2) -> List[ProcesoSIGET]:
-        """Round Robin - Implementación especial con quantum"""
-        # Para Round Robin, devolvemos la lista original ya que se maneja diferente
-        return procesos
-
-class SimuladorSIGET:
-    def __init__(self):
-        self.procesos: List[ProcesoSIGET] = []
-        self.procesos_terminados: List[ProcesoSIGET] = []
-        self.algoritmo_actual = "FIFO"
-        self.quantum = 2
-        self.tiempo_actual = 0
-        self.ejecutando = False
-        self.proceso_actual: Optional[ProcesoSIGET] = None
-        self.cola_listos: List[ProcesoSIGET] = []
-        
-    def crear_procesos_ejemplo(self):
-        """Crea procesos de ejemplo para el SIGET"""
-        self.procesos = [
-            ProcesoSIGET(1, "Monitoreo Centro", TipoProceso.MONITOREO_TRAFICO, 0, 8, 1, 150),
-            ProcesoSIGET(2, "Semaforos Avenida Principal", TipoProceso.GESTION_SEMAFOROS, 2, 5, 2, 80),
-            ProcesoSIGET(3, "Análisis Patrones", TipoProceso.ANALISIS_DATOS, 4, 12, 3, 300),
-            ProcesoSIGET(4, "Monitoreo Periferia", TipoProceso.MONITOREO_TRAFICO, 6, 6, 2, 120),
-            ProcesoSIGET(5, "Semaforos Intersección", TipoProceso.GESTION_SEMAFOROS, 8, 3, 1, 60),
-            ProcesoSIGET(6, "Reporte Estadísticas", TipoProceso.ANALISIS_DATOS, 10, 7, 4, 200)
-        ]
-        
-        # Inicializar tiempo restante
-        for proceso in self.procesos:
-            proceso.tiempo_restante = proceso.tiempo_ejecucion
-    
-    def resetear_simulacion(self):
-        """Reinicia la simulación"""
-        self.tiempo_actual = 0
-        self.ejecutando = False
-        self.proceso_actual = None
-        self.cola_listos = []
-        self.procesos_terminados = []
-        
-        for proceso in self.procesos:
-            proceso.estado = EstadoProceso.NUEVO
-            proceso.tiempo_restante = proceso.tiempo_ejecucion
-            proceso.tiempo_espera = 0
-            proceso.tiempo_respuesta = 0
-            proceso.tiempo_inicio = None
-            proceso.tiempo_fin = None
-    
-    def ejecutar_simulacion(self, callback_actualizacion=None):
-        """Ejecuta la simulación con el algoritmo seleccionado"""
-        self.resetear_simulacion()
-        self.ejecutando = True
-        
-        # Crear cola de procesos ordenada según el algoritmo
-        if self.algoritmo_actual == "FIFO":
-            cola_procesos = AlgoritmoPlanificacion.fifo(self.procesos.copy())
-        elif self.algoritmo_actual == "SJF":
-            cola_procesos = AlgoritmoPlanificacion.sjf(self.procesos.copy())
-        elif self.algoritmo_actual == "Prioridad":
-            cola_procesos = AlgoritmoPlanificacion.prioridad(self.procesos.copy())
-        else:  # Round Robin
-            cola_procesos = self.procesos.copy()
-        
-        # Simular ejecución
-        while cola_procesos or self.cola_listos or self.proceso_actual:
-            # Actualizar estados de procesos que llegan
-            for proceso in cola_procesos[:]:
-                if proceso.tiempo_irrupcion <= self.tiempo_actual:
-                    proceso.estado = EstadoProceso.LISTO
-                    self.cola_listos.append(proceso)
-                    cola_procesos.remove(proceso)
-            
-            # Seleccionar siguiente proceso
-            if not self.proceso_actual and self.cola_listos:
-                if self.algoritmo_actual == "Round Robin":
-                    self.proceso_actual = self.cola_listos.pop(0)
-                else:
-                    # Para otros algoritmos, el orden ya está definido
-                    self.proceso_actual = self.cola_listos.pop(0)
-                
-                self.proceso_actual.estado = EstadoProceso.EN_EJECUCION
-                if self.proceso_actual.tiempo_inicio is None:
-                    self.proceso_actual.tiempo_inicio = self.tiempo_actual
-            
-            # Ejecutar proceso actual
-            if self.proceso_actual:
-                tiempo_ejecucion = min(self.quantum if self.algoritmo_actual == "Round Robin" 
-                                    else self.proceso_actual.tiempo_restante, 
-                                    self.proceso_actual.tiempo_restante)
-                
-                # Simular ejecución
-                time.sleep(0.5)  # Pausa visual
-                
-                self.proceso_actual.tiempo_restante -= tiempo_ejecucion
-                self.tiempo_actual += tiempo_ejecucion
-                
-                # Actualizar tiempo de espera de otros procesos
-                for proceso in self.cola_listos:
-                    proceso.tiempo_espera += tiempo_ejecucion
-                
-                # Verificar si el proceso terminó
-                if self.proceso_actual.tiempo_restante <= 0:
-                    self.proceso_actual.estado = EstadoProceso.TERMINADO
-                    self.proceso_actual.tiempo_fin = self.tiempo_actual
-                    self.proceso_actual.tiempo_respuesta = (self.proceso_actual.tiempo_fin - 
-                                                          self.proceso_actual.tiempo_irrupcion)
-                    self.procesos_terminados.append(self.proceso_actual)
-                    self.proceso_actual = None
-                else:
-                    # Para Round Robin, mover a la cola
-                    if self.algoritmo_actual == "Round Robin":
-                        self.proceso_actual.estado = EstadoProceso.LISTO
-                        self.cola_listos.append(self.proceso_actual)
-                        self.proceso_actual = None
-            
-            # Callback para actualizar la interfaz
-            if callback_actualizacion:
-                callback_actualizacion()
-        
-        self.ejecutando = False
-        if callback_actualizacion:
-            callback_actualizacion()
+# Refrescos de la interfaz por segundo durante la simulación
+FPS_REFRESCO = 30
 
 class InterfazSimulador:
     def __init__(self):
         self.simulador = SimuladorSIGET()
+        self.simulador.linea_tiempo = LineaTiempo()
+        # Ventana del diagrama de Gantt, si está abierta
+        self.diagrama_gantt = None
+        # Unidades de tiempo simulado por segundo real, para que la simulación
+        # sea observable (ver tiempo_real_siget); el motor en sí no espera
+        # nunca (0 = sin pausas)
+        self.velocidad = 2.0
+        self.hilo_simulacion = None
+        # Corridas sin pausas ya hechas: repetirlas tras resetear no vuelve a simular
+        self.cache = CacheResultados()
+        # El hilo de la simulación publica instantáneas; el hilo de Tk muestra
+        # la más reciente como mucho FPS_REFRESCO veces por segundo
+        self.canal = CanalInstantaneas()
         self.ventana = tk.Tk()
         self.ventana.title("🚦 Simulador SIGET - Sistema Inteligente de Gestión del Tráfico")
         self.ventana.geometry("1400x900")
@@ -188,6 +45,7 @@ class InterfazSimulador:
         self.crear_interfaz()
         self.simulador.crear_procesos_ejemplo()
         self.actualizar_tabla()
+        self.ventana.after(1000 // FPS_REFRESCO, self.ciclo_refresco)
     
     def configurar_tema_oscuro(self):
         """Configura el tema oscuro moderno"""
@@ -300,8 +158,8 @@ class InterfazSimulador:
         
         self.var_algoritmo = tk.StringVar(value="FIFO")
         combo_algoritmo = ttk.Combobox(frame_controles_inner, textvariable=self.var_algoritmo,
-                                      values=["FIFO", "SJF", "Prioridad", "Round Robin"],
-                                      state="readonly", width=15, style='Modern.TCombobox')
+                                      values=list(POLITICAS),
+                                      state="readonly", width=22, style='Modern.TCombobox')
         combo_algoritmo.grid(row=0, column=1, padx=5, pady=5)
         combo_algoritmo.bind("<<ComboboxSelected>>", self.cambiar_algoritmo)
         
@@ -346,6 +204,14 @@ class InterfazSimulador:
                                      cursor="hand2")
         btn_crear_procesos.pack(side=tk.LEFT, padx=8)
         
+        btn_gantt = tk.Button(frame_botones, text="📈 Diagrama de Gantt", 
+                            command=self.abrir_gantt, 
+                            bg=self.colores['boton_primario'], fg='white',
+                            font=("Segoe UI", 11, "bold"), 
+                            padx=25, pady=8, relief=tk.FLAT,
+                            cursor="hand2")
+        btn_gantt.pack(side=tk.LEFT, padx=8)
+        
         # Frame principal con dos columnas
         frame_principal = tk.Frame(self.ventana, bg=self.colores['fondo_principal'])
         frame_principal.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
@@ -358,22 +224,9 @@ class InterfazSimulador:
                                    relief=tk.RAISED, bd=2)
         frame_tabla.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
         
-        # Crear tabla de procesos con estilo moderno
-        columnas = ("ID", "Nombre", "Tipo", "T. Irrupción", "T. Ejecución", 
-                   "Prioridad", "Tamaño (MB)", "Estado", "T. Restante", "T. Espera")
-        
-        self.tabla_procesos = ttk.Treeview(frame_tabla, columns=columnas, show="headings", 
-                                          height=18, style='Modern.Treeview')
-        
-        for col in columnas:
-            self.tabla_procesos.heading(col, text=col)
-            self.tabla_procesos.column(col, width=90, anchor=tk.CENTER)
-        
-        scrollbar_tabla = ttk.Scrollbar(frame_tabla, orient=tk.VERTICAL, command=self.tabla_procesos.yview)
-        self.tabla_procesos.configure(yscrollcommand=scrollbar_tabla.set)
-        
-        self.tabla_procesos.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        scrollbar_tabla.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        # Tabla virtualizada: solo materializa las filas visibles
+        self.tabla_procesos = TablaVirtual(frame_tabla, self.colores, filas_visibles=18)
+        self.tabla_procesos.pack(fill=tk.BOTH, expand=True)
         
         # Columna derecha - Información de simulación
         frame_info = tk.LabelFrame(frame_principal, text="📈 Información de Simulación", 
@@ -447,7 +300,7 @@ class InterfazSimulador:
     
     def ejecutar_simulacion(self):
         """Inicia la ejecución de la simulación en un hilo separado"""
-        if self.simulador.ejecutando:
+        if self.hilo_simulacion is not None and self.hilo_simulacion.is_alive():
             messagebox.showwarning("Advertencia", "La simulación ya está en ejecución")
             return
         
@@ -458,15 +311,25 @@ class InterfazSimulador:
             self.log_evento(f"Quantum: {self.simulador.quantum}")
         
         # Ejecutar en hilo separado para no bloquear la interfaz
-        thread = threading.Thread(target=self.simulador.ejecutar_simulacion, 
-                                 args=(self.actualizar_interfaz,))
-        thread.daemon = True
-        thread.start()
+        self.canal.conectar(self.simulador)
+        self.hilo_simulacion = threading.Thread(target=self.ejecutar_motor, daemon=True)
+        self.hilo_simulacion.start()
+    
+    def ejecutar_motor(self):
+        """Cuerpo del hilo de la simulación: al ritmo de ``velocidad`` o sin pausas (con caché)"""
+        if self.velocidad:
+            reproductor = ReproductorTiempoReal(self.simulador, self.velocidad,
+                                                al_publicar=self.actualizar_interfaz)
+            asyncio.run(reproductor.ejecutar())
+        else:
+            simular_con_cache(self.simulador, self.cache, self.actualizar_interfaz)
     
     def resetear_simulacion(self):
         """Resetea la simulación"""
         self.simulador.resetear_simulacion()
         self.actualizar_tabla()
+        if self.diagrama_gantt is not None:
+            self.diagrama_gantt.refrescar()
         self.actualizar_informacion()
         self.log_evento("=== SIMULACIÓN RESETEADA ===")
     
@@ -476,40 +339,53 @@ class InterfazSimulador:
         self.actualizar_tabla()
         self.log_evento("Procesos de ejemplo creados")
     
+    def abrir_gantt(self):
+        """Abre (o trae al frente) la ventana con el diagrama de Gantt de la corrida"""
+        if self.diagrama_gantt is not None:
+            self.diagrama_gantt.winfo_toplevel().lift()
+            return
+        ventana = tk.Toplevel(self.ventana)
+        ventana.title("📈 Diagrama de Gantt")
+        ventana.geometry("1100x260")
+        ventana.configure(bg=self.colores['fondo_principal'])
+        self.diagrama_gantt = DiagramaGantt(ventana, self.colores, self.simulador.linea_tiempo)
+        self.diagrama_gantt.pack(fill=tk.BOTH, expand=True)
+        
+        def cerrar():
+            self.diagrama_gantt = None
+            ventana.destroy()
+        ventana.protocol("WM_DELETE_WINDOW", cerrar)
+    
     def actualizar_interfaz(self):
-        """Actualiza la interfaz durante la simulación"""
-        self.ventana.after(0, self.actualizar_tabla)
-        self.ventana.after(0, self.actualizar_informacion)
+        """Publica una instantánea desde el hilo de la simulación"""
+        # El motor no espera a la interfaz: si Tk va atrasado, las
+        # instantáneas intermedias se combinan y se descartan
+        self.canal.publicar(self.simulador)
+    
+    def ciclo_refresco(self):
+        """Muestra la instantánea más reciente como mucho FPS_REFRESCO veces por segundo"""
+        instantanea = self.canal.recibir()
+        if instantanea is not None:
+            self.aplicar_instantanea(instantanea)
+        self.ventana.after(1000 // FPS_REFRESCO, self.ciclo_refresco)
+    
+    def aplicar_instantanea(self, instantanea):
+        """Actualiza tabla e información a partir de una instantánea del canal"""
+        # La espera de los procesos listos visibles se recalcula al redibujar
+        self.tabla_procesos.actualizar(instantanea.filas.values(), instantanea.tiempo)
+        
+        self.mostrar_informacion(instantanea.tiempo, instantanea.proceso_actual,
+                                 instantanea.conteos[EstadoProceso.TERMINADO],
+                                 instantanea.total_procesos, instantanea.espera_promedio,
+                                 instantanea.respuesta_promedio, instantanea.estadisticas)
+        if self.diagrama_gantt is not None:
+            self.diagrama_gantt.refrescar()
     
     def actualizar_tabla(self):
-        """Actualiza la tabla de procesos con tema oscuro"""
-        # Limpiar tabla
-        for item in self.tabla_procesos.get_children():
-            self.tabla_procesos.delete(item)
-        
-        # Agregar procesos
-        for proceso in self.simulador.procesos + self.simulador.procesos_terminados:
-            estado_color = self.obtener_color_estado(proceso.estado)
-            
-            self.tabla_procesos.insert("", "end", values=(
-                proceso.id,
-                proceso.nombre,
-                proceso.tipo.value,
-                proceso.tiempo_irrupcion,
-                proceso.tiempo_ejecucion,
-                proceso.prioridad_alerta,
-                proceso.tamaño_datos,
-                proceso.estado.value,
-                proceso.tiempo_restante,
-                proceso.tiempo_espera
-            ), tags=(estado_color,))
-        
-        # Configurar colores del tema oscuro
-        self.tabla_procesos.tag_configure("Nuevo", background=self.colores['nuevo'], foreground='white')
-        self.tabla_procesos.tag_configure("Listo", background=self.colores['listo'], foreground='black')
-        self.tabla_procesos.tag_configure("En Ejecución", background=self.colores['ejecucion'], foreground='white')
-        self.tabla_procesos.tag_configure("Bloqueado", background=self.colores['bloqueado'], foreground='white')
-        self.tabla_procesos.tag_configure("Terminado", background=self.colores['terminado'], foreground='white')
+        """Reemplaza las filas de la tabla por todos los procesos (fuera de la simulación)"""
+        self.tabla_procesos.reemplazar(
+            [fila_de_proceso(proceso) for proceso in self.simulador.procesos],
+            self.simulador.tiempo_actual)
     
     def obtener_color_estado(self, estado):
         """Obtiene el color correspondiente al estado del proceso"""
@@ -523,33 +399,45 @@ class InterfazSimulador:
         return colores.get(estado, "Nuevo")
     
     def actualizar_informacion(self):
-        """Actualiza la información de simulación con tema oscuro"""
-        self.label_tiempo.config(text=f"Tiempo Actual: {self.simulador.tiempo_actual}")
+        """Actualiza la información de simulación leyendo el simulador (fuera de la simulación)"""
+        estadisticas = self.simulador.estadisticas
+        resumen = estadisticas.resumen() if estadisticas is not None else {}
+        proceso_actual = self.simulador.proceso_actual
+        self.mostrar_informacion(self.simulador.tiempo_actual,
+                                 proceso_actual.nombre if proceso_actual else None,
+                                 self.simulador.cantidad_terminados, len(self.simulador.procesos),
+                                 estadisticas.total["espera"].media if estadisticas else 0,
+                                 estadisticas.total["respuesta"].media if estadisticas else 0,
+                                 resumen)
+    
+    def mostrar_informacion(self, tiempo, proceso_actual, procesos_terminados, total_procesos,
+                            tiempo_promedio_espera, tiempo_promedio_respuesta, estadisticas=None):
+        """Muestra la información de simulación con tema oscuro"""
+        self.label_tiempo.config(text=f"Tiempo Actual: {tiempo}")
         
-        if self.simulador.proceso_actual:
+        if proceso_actual:
             self.label_proceso_actual.config(
-                text=f"Proceso Actual: {self.simulador.proceso_actual.nombre}",
+                text=f"Proceso Actual: {proceso_actual}",
                 fg=self.colores['texto_acento']
             )
         else:
             self.label_proceso_actual.config(text="Proceso Actual: Ninguno", 
                                            fg=self.colores['texto_secundario'])
         
-        # Calcular estadísticas
-        procesos_terminados = len(self.simulador.procesos_terminados)
-        total_procesos = len(self.simulador.procesos)
-        
         if procesos_terminados > 0:
-            tiempo_promedio_espera = sum(p.tiempo_espera for p in self.simulador.procesos_terminados) / procesos_terminados
-            tiempo_promedio_respuesta = sum(p.tiempo_respuesta for p in self.simulador.procesos_terminados) / procesos_terminados
-            
             stats_text = f"""📊 Procesos Terminados: {procesos_terminados}/{total_procesos}
 ⏱️ Tiempo Promedio de Espera: {tiempo_promedio_espera:.2f}
 🔄 Tiempo Promedio de Respuesta: {tiempo_promedio_respuesta:.2f}
-⏰ Tiempo Total de Simulación: {self.simulador.tiempo_actual}"""
+⏰ Tiempo Total de Simulación: {tiempo}"""
+            if estadisticas:
+                espera = estadisticas["total"]["espera"]
+                stats_text += (f"\n📈 Espera p50/p95/p99: {espera['p50']:.1f} / "
+                               f"{espera['p95']:.1f} / {espera['p99']:.1f}")
+                for tipo, metricas in estadisticas["por_tipo"].items():
+                    stats_text += f"\n   • {tipo}: p95 espera {metricas['espera']['p95']:.1f}"
         else:
             stats_text = f"""📊 Procesos Terminados: {procesos_terminados}/{total_procesos}
-⏰ Tiempo de Simulación: {self.simulador.tiempo_actual}"""
+⏰ Tiempo de Simulación: {tiempo}"""
         
         self.label_stats.config(text=stats_text)
     
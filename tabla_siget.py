@@ -0,0 +1,231 @@
+"""
+Tabla de procesos compacta en columnas (struct of arrays).
+
+Cada atributo de ``ProcesoSIGET`` se guarda en una columna ``array`` de
+ancho fijo en lugar de un objeto con ``__dict__`` por proceso. Las vistas
+``VistaProceso`` (con ``__slots__``) exponen los mismos atributos, así que
+el motor y la interfaz funcionan sin cambios sobre la tabla.
+"""
+
+from array import array
+from typing import Iterable, List, Optional
+
+from nucleo_siget import EstadoProceso, ProcesoSIGET, TipoProceso
+
+_ESTADOS = tuple(EstadoProceso)
+_CODIGO_ESTADO = {estado: codigo for codigo, estado in enumerate(_ESTADOS)}
+_TIPOS = tuple(TipoProceso)
+_CODIGO_TIPO = {tipo: codigo for codigo, tipo in enumerate(_TIPOS)}
+
+# Valor de las columnas opcionales (tiempo_inicio, tiempo_fin, listo_desde) para None
+SIN_VALOR = -1
+
+# Columnas y su código de tipo de ``array``
+COLUMNAS = (
+    ("id", "q"),
+    ("tipo", "b"),
+    ("irrupcion", "q"),
+    ("ejecucion", "q"),
+    ("prioridad", "b"),
+    ("tamaño", "q"),
+    ("estado", "b"),
+    ("restante", "q"),
+    ("espera", "q"),
+    ("listo_desde", "q"),
+    ("respuesta", "q"),
+    ("inicio", "q"),
+    ("fin", "q"),
+)
+
+
+class TablaProcesos:
+    """Procesos en columnas de ancho fijo: 83 bytes por proceso (más los nombres, si se conservan)"""
+    
+    def __init__(self):
+        for nombre, codigo in COLUMNAS:
+            setattr(self, nombre, array(codigo))
+        # Nombres solo si se piden; si no, se derivan del id
+        self.nombres: Optional[List[str]] = None
+    
+    @classmethod
+    def desde_procesos(cls, procesos: Iterable[ProcesoSIGET], conservar_nombres: bool = False) -> "TablaProcesos":
+        """Copia procesos existentes a una tabla nueva"""
+        tabla = cls()
+        if conservar_nombres:
+            tabla.nombres = []
+        for proceso in procesos:
+            tabla.agregar(proceso.id, proceso.tipo, proceso.tiempo_irrupcion, proceso.tiempo_ejecucion,
+                          proceso.prioridad_alerta, proceso.tamaño_datos, proceso.nombre)
+        return tabla
+    
+    @classmethod
+    def desde_columnas(cls, id, tipo, irrupcion, ejecucion, prioridad, tamaño) -> "TablaProcesos":
+        """Tabla de solo lectura sobre columnas de entrada existentes (sin copiarlas).
+
+        Acepta cualquier secuencia indexable con ``itemsize`` (``array``,
+        ``memoryview``); solo se reservan las columnas de estado.
+        """
+        tabla = cls()
+        cantidad = len(id)
+        tabla.id, tabla.tipo, tabla.irrupcion = id, tipo, irrupcion
+        tabla.ejecucion, tabla.prioridad, tabla.tamaño = ejecucion, prioridad, tamaño
+        tabla.estado = array("b", bytes(cantidad))
+        tabla.restante = array("q", ejecucion.tobytes())
+        for nombre in ("espera", "respuesta"):
+            setattr(tabla, nombre, array("q", bytes(8 * cantidad)))
+        for nombre in ("listo_desde", "inicio", "fin"):
+            setattr(tabla, nombre, array("q", [SIN_VALOR]) * cantidad)
+        return tabla
+    
+    def agregar(self, id_: int, tipo: TipoProceso, tiempo_irrupcion: int, tiempo_ejecucion: int,
+                prioridad_alerta: int, tamaño_datos: int, nombre: Optional[str] = None) -> int:
+        """Agrega un proceso NUEVO y devuelve su índice"""
+        self.id.append(id_)
+        self.tipo.append(_CODIGO_TIPO[tipo])
+        self.irrupcion.append(tiempo_irrupcion)
+        self.ejecucion.append(tiempo_ejecucion)
+        self.prioridad.append(prioridad_alerta)
+        self.tamaño.append(tamaño_datos)
+        self.estado.append(_CODIGO_ESTADO[EstadoProceso.NUEVO])
+        self.restante.append(tiempo_ejecucion)
+        self.espera.append(0)
+        self.listo_desde.append(SIN_VALOR)
+        self.respuesta.append(0)
+        self.inicio.append(SIN_VALOR)
+        self.fin.append(SIN_VALOR)
+        if self.nombres is not None:
+            self.nombres.append(nombre if nombre is not None else f"P{id_}")
+        return len(self.id) - 1
+    
+    def __len__(self):
+        return len(self.id)
+    
+    def __getitem__(self, indice: int) -> "VistaProceso":
+        if not -len(self.id) <= indice < len(self.id):
+            raise IndexError(indice)
+        return VistaProceso(self, indice % len(self.id))
+    
+    def vistas(self) -> List["VistaProceso"]:
+        """Lista de vistas para asignar a ``SimuladorSIGET.procesos``"""
+        return [VistaProceso(self, indice) for indice in range(len(self.id))]
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados por los datos de las columnas"""
+        return sum(len(columna) * columna.itemsize
+                   for columna in (getattr(self, nombre) for nombre, _ in COLUMNAS))
+    
+    def columnas_numpy(self) -> dict:
+        """Columnas como arreglos de NumPy que comparten memoria con la tabla (sin copia)"""
+        try:
+            import numpy as np  # Opcional, y se importa recién aquí para no demorar el arranque
+        except ImportError:
+            raise ImportError("columnas_numpy requiere NumPy (pip install numpy)") from None
+        return {nombre: np.frombuffer(getattr(self, nombre), dtype=codigo) for nombre, codigo in COLUMNAS}
+
+
+def _opcional(valor: int) -> Optional[int]:
+    return None if valor == SIN_VALOR else valor
+
+
+class VistaProceso:
+    """Vista liviana de una fila de ``TablaProcesos`` con la interfaz de ``ProcesoSIGET``"""
+    __slots__ = ("_tabla", "_indice")
+    
+    def __init__(self, tabla: TablaProcesos, indice: int):
+        self._tabla = tabla
+        self._indice = indice
+    
+    def __repr__(self):
+        return (f"VistaProceso(id={self.id}, estado={self.estado.value}, "
+                f"tiempo_restante={self.tiempo_restante})")
+    
+    @property
+    def id(self) -> int:
+        return self._tabla.id[self._indice]
+    
+    @property
+    def nombre(self) -> str:
+        if self._tabla.nombres is None:
+            return f"P{self.id}"
+        return self._tabla.nombres[self._indice]
+    
+    @property
+    def tipo(self) -> TipoProceso:
+        return _TIPOS[self._tabla.tipo[self._indice]]
+    
+    @property
+    def tiempo_irrupcion(self) -> int:
+        return self._tabla.irrupcion[self._indice]
+    
+    @property
+    def tiempo_ejecucion(self) -> int:
+        return self._tabla.ejecucion[self._indice]
+    
+    @property
+    def prioridad_alerta(self) -> int:
+        return self._tabla.prioridad[self._indice]
+    
+    @property
+    def tamaño_datos(self) -> int:
+        return self._tabla.tamaño[self._indice]
+    
+    @property
+    def estado(self) -> EstadoProceso:
+        return _ESTADOS[self._tabla.estado[self._indice]]
+    
+    @estado.setter
+    def estado(self, valor: EstadoProceso):
+        self._tabla.estado[self._indice] = _CODIGO_ESTADO[valor]
+    
+    @property
+    def tiempo_restante(self) -> int:
+        return self._tabla.restante[self._indice]
+    
+    @tiempo_restante.setter
+    def tiempo_restante(self, valor: int):
+        self._tabla.restante[self._indice] = valor
+    
+    @property
+    def tiempo_espera(self) -> int:
+        return self._tabla.espera[self._indice]
+    
+    @tiempo_espera.setter
+    def tiempo_espera(self, valor: int):
+        self._tabla.espera[self._indice] = valor
+    
+    @property
+    def listo_desde(self) -> Optional[int]:
+        return _opcional(self._tabla.listo_desde[self._indice])
+    
+    @listo_desde.setter
+    def listo_desde(self, valor: Optional[int]):
+        self._tabla.listo_desde[self._indice] = SIN_VALOR if valor is None else valor
+    
+    @property
+    def tiempo_respuesta(self) -> int:
+        return self._tabla.respuesta[self._indice]
+    
+    @tiempo_respuesta.setter
+    def tiempo_respuesta(self, valor: int):
+        self._tabla.respuesta[self._indice] = valor
+    
+    @property
+    def tiempo_inicio(self) -> Optional[int]:
+        return _opcional(self._tabla.inicio[self._indice])
+    
+    @tiempo_inicio.setter
+    def tiempo_inicio(self, valor: Optional[int]):
+        self._tabla.inicio[self._indice] = SIN_VALOR if valor is None else valor
+    
+    @property
+    def tiempo_fin(self) -> Optional[int]:
+        return _opcional(self._tabla.fin[self._indice])
+    
+    @tiempo_fin.setter
+    def tiempo_fin(self, valor: Optional[int]):
+        self._tabla.fin[self._indice] = SIN_VALOR if valor is None else valor
+    
+    # Misma semántica de espera que ProcesoSIGET
+    espera_en = ProcesoSIGET.espera_en
+    espera_desde_llegada = ProcesoSIGET.espera_desde_llegada
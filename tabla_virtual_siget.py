@@ -0,0 +1,253 @@
+"""
+Tabla de procesos virtualizada para la interfaz del SIGET.
+
+``AlmacenFilas`` guarda todas las filas (ver ``canal_siget.fila_de_proceso``)
+y un índice con el orden y el filtro vigentes; ``TablaVirtual`` solo
+materializa en el Treeview las filas visibles y pagina sobre ese índice,
+así que dibujar cuesta O(filas visibles) sin importar cuántos procesos haya.
+"""
+
+import time
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, List, Optional
+
+from canal_siget import Fila, espera_de_fila
+from nucleo_siget import EstadoProceso, TipoProceso
+
+COLUMNAS = ("ID", "Nombre", "Tipo", "T. Irrupción", "T. Ejecución",
+            "Prioridad", "Tamaño (MB)", "Estado", "T. Restante", "T. Espera")
+
+# Columnas cuyos valores cambian durante la simulación
+_COLUMNAS_DINAMICAS = {7, 8, 9}
+_ORDEN_ESTADO = {estado: posicion for posicion, estado in enumerate(EstadoProceso)}
+TODOS = "Todos"
+
+
+class AlmacenFilas:
+    """Filas por id más un índice ordenado y filtrado que se reconstruye a demanda.
+
+    Actualizar filas cuesta O(1) por fila. El índice se reconstruye en
+    O(n log n) solo si cambió algo que afecta el orden o el filtro, y como
+    mucho cada ``intervalo_reindexado`` segundos mientras cambian columnas
+    dinámicas (estado, restante, espera).
+    """
+    
+    def __init__(self, intervalo_reindexado: float = 1.0):
+        self.filas: Dict[int, Fila] = {}
+        self.indice: List[int] = []
+        self.columna_orden: Optional[int] = None
+        self.descendente = False
+        self.filtro_estado: Optional[EstadoProceso] = None
+        self.filtro_tipo: Optional[str] = None
+        self.filtro_prioridad: Optional[int] = None
+        self.intervalo_reindexado = intervalo_reindexado
+        self._sucio = False
+        self._dinamico_pendiente = False
+        self._ultimo_reindexado = 0.0
+    
+    def __len__(self):
+        return len(self.indice)
+    
+    def limpiar(self):
+        self.filas.clear()
+        self.indice = []
+    
+    def _depende_de_dinamicas(self) -> bool:
+        return self.filtro_estado is not None or self.columna_orden in _COLUMNAS_DINAMICAS
+    
+    def actualizar(self, filas):
+        """Reemplaza o agrega filas; marca el índice si cambia su orden o filtro"""
+        for fila in filas:
+            id_ = fila[0]
+            if id_ not in self.filas:
+                self._sucio = True
+            self.filas[id_] = fila
+            if not self._sucio:
+                self._dinamico_pendiente = True
+    
+    def quitar(self, ids):
+        for id_ in ids:
+            self.filas.pop(id_, None)
+        self._sucio = True
+    
+    def ordenar(self, columna: Optional[int], descendente: bool = False):
+        self.columna_orden = columna
+        self.descendente = descendente
+        self._sucio = True
+    
+    def filtrar(self, estado: Optional[EstadoProceso] = None, tipo: Optional[str] = None,
+                prioridad: Optional[int] = None):
+        self.filtro_estado, self.filtro_tipo, self.filtro_prioridad = estado, tipo, prioridad
+        self._sucio = True
+    
+    def reindexar(self, tiempo: int = 0, forzar: bool = False):
+        """Reconstruye el índice si hace falta (ver docstring de la clase)"""
+        ahora = time.monotonic()
+        dinamico = (self._dinamico_pendiente and self._depende_de_dinamicas()
+                    and ahora - self._ultimo_reindexado >= self.intervalo_reindexado)
+        if not (self._sucio or dinamico or forzar):
+            return
+        self._sucio = self._dinamico_pendiente = False
+        self._ultimo_reindexado = ahora
+        
+        filas = self.filas.values()
+        if self.filtro_estado is not None:
+            filas = [f for f in filas if f[7] == self.filtro_estado]
+        if self.filtro_tipo is not None:
+            filas = [f for f in filas if f[2] == self.filtro_tipo]
+        if self.filtro_prioridad is not None:
+            filas = [f for f in filas if f[5] == self.filtro_prioridad]
+        
+        columna = self.columna_orden
+        if columna is None:
+            self.indice = [f[0] for f in filas]
+            if self.descendente:
+                self.indice.reverse()
+            return
+        if columna == 7:
+            clave = lambda f: _ORDEN_ESTADO[f[7]]
+        elif columna == 9:
+            clave = lambda f: espera_de_fila(f, tiempo)
+        else:
+            clave = lambda f: f[columna]
+        self.indice = [f[0] for f in sorted(filas, key=clave, reverse=self.descendente)]
+    
+    def pagina(self, inicio: int, cantidad: int) -> List[Fila]:
+        """Filas visibles desde la posición ``inicio`` del índice"""
+        filas = self.filas
+        return [filas[id_] for id_ in self.indice[inicio:inicio + cantidad] if id_ in filas]
+
+
+class TablaVirtual(tk.Frame):
+    """Treeview con un número fijo de filas que pagina sobre un ``AlmacenFilas``"""
+    
+    def __init__(self, padre, colores, filas_visibles: int = 18, **opciones):
+        super().__init__(padre, bg=colores['fondo_secundario'], **opciones)
+        self.colores = colores
+        self.almacen = AlmacenFilas()
+        self.filas_visibles = filas_visibles
+        self.desplazamiento = 0
+        self.tiempo = 0
+        
+        self._crear_filtros()
+        
+        cuerpo = tk.Frame(self, bg=colores['fondo_secundario'])
+        cuerpo.pack(fill=tk.BOTH, expand=True)
+        self.arbol = ttk.Treeview(cuerpo, columns=COLUMNAS, show="headings",
+                                  height=filas_visibles, style='Modern.Treeview')
+        for posicion, columna in enumerate(COLUMNAS):
+            self.arbol.heading(columna, text=columna,
+                               command=lambda posicion=posicion: self.alternar_orden(posicion))
+            self.arbol.column(columna, width=90, anchor=tk.CENTER)
+        self.barra = ttk.Scrollbar(cuerpo, orient=tk.VERTICAL, command=self.desplazar)
+        self.arbol.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.barra.pack(side=tk.RIGHT, fill=tk.Y, pady=10)
+        
+        # Colores por estado, configurados una sola vez
+        self.arbol.tag_configure("Nuevo", background=colores['nuevo'], foreground='white')
+        self.arbol.tag_configure("Listo", background=colores['listo'], foreground='black')
+        self.arbol.tag_configure("En Ejecución", background=colores['ejecucion'], foreground='white')
+        self.arbol.tag_configure("Bloqueado", background=colores['bloqueado'], foreground='white')
+        self.arbol.tag_configure("Terminado", background=colores['terminado'], foreground='white')
+        
+        # Las únicas filas materializadas: se reutilizan al desplazarse
+        self._iids = [self.arbol.insert("", "end", values=()) for _ in range(filas_visibles)]
+        self._mostradas: List[Optional[tuple]] = [None] * filas_visibles
+        
+        for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.arbol.bind(evento, self._rueda)
+    
+    def _crear_filtros(self):
+        barra = tk.Frame(self, bg=self.colores['fondo_secundario'])
+        barra.pack(fill=tk.X, padx=10, pady=(8, 0))
+        self.var_estado = tk.StringVar(value=TODOS)
+        self.var_tipo = tk.StringVar(value=TODOS)
+        self.var_prioridad = tk.StringVar(value=TODOS)
+        filtros = (
+            ("Estado:", self.var_estado, [TODOS] + [estado.value for estado in EstadoProceso]),
+            ("Tipo:", self.var_tipo, [TODOS] + [tipo.value for tipo in TipoProceso]),
+            ("Prioridad:", self.var_prioridad, [TODOS] + [str(p) for p in range(1, 6)]),
+        )
+        for texto, variable, valores in filtros:
+            tk.Label(barra, text=texto, font=("Segoe UI", 9, "bold"),
+                     bg=self.colores['fondo_secundario'],
+                     fg=self.colores['texto_principal']).pack(side=tk.LEFT, padx=(0, 4))
+            combo = ttk.Combobox(barra, textvariable=variable, values=valores, state="readonly",
+                                 width=20, style='Modern.TCombobox')
+            combo.pack(side=tk.LEFT, padx=(0, 12))
+            combo.bind("<<ComboboxSelected>>", self._aplicar_filtros)
+    
+    def _aplicar_filtros(self, event=None):
+        estado = self.var_estado.get()
+        tipo = self.var_tipo.get()
+        prioridad = self.var_prioridad.get()
+        self.almacen.filtrar(
+            EstadoProceso(estado) if estado != TODOS else None,
+            tipo if tipo != TODOS else None,
+            int(prioridad) if prioridad != TODOS else None)
+        self.desplazamiento = 0
+        self.refrescar()
+    
+    def alternar_orden(self, columna: int):
+        """Ordena por la columna; un segundo clic invierte el sentido"""
+        descendente = self.almacen.columna_orden == columna and not self.almacen.descendente
+        self.almacen.ordenar(columna, descendente)
+        self.refrescar()
+    
+    def actualizar(self, filas, tiempo: int):
+        """Incorpora filas nuevas o cambiadas y redibuja la ventana visible"""
+        self.almacen.actualizar(filas)
+        self.tiempo = tiempo
+        self.refrescar()
+    
+    def reemplazar(self, filas, tiempo: int):
+        """Reemplaza todas las filas (p. ej. al crear procesos nuevos)"""
+        self.almacen.limpiar()
+        self.almacen.actualizar(filas)
+        self.desplazamiento = 0
+        self.tiempo = tiempo
+        self.refrescar()
+    
+    def refrescar(self):
+        """Dibuja solo las filas visibles; O(filas visibles) salvo si hay que reindexar"""
+        self.almacen.reindexar(self.tiempo)
+        total = len(self.almacen)
+        self.desplazamiento = max(0, min(self.desplazamiento, total - self.filas_visibles))
+        pagina = self.almacen.pagina(self.desplazamiento, self.filas_visibles)
+        
+        for posicion, iid in enumerate(self._iids):
+            if posicion < len(pagina):
+                fila = pagina[posicion]
+                estado = fila[7]
+                valores = fila[:7] + (estado.value, fila[8], espera_de_fila(fila, self.tiempo))
+            else:
+                valores = ()
+                estado = None
+            if self._mostradas[posicion] == valores:
+                continue
+            self._mostradas[posicion] = valores
+            self.arbol.item(iid, values=valores, tags=(estado.value,) if estado else ())
+        
+        if total:
+            self.barra.set(self.desplazamiento / total,
+                           min(1.0, (self.desplazamiento + self.filas_visibles) / total))
+        else:
+            self.barra.set(0.0, 1.0)
+    
+    def desplazar(self, accion, cantidad, unidad=None):
+        """Comando de la barra de desplazamiento ("moveto" o "scroll")"""
+        total = len(self.almacen)
+        if accion == "moveto":
+            self.desplazamiento = int(float(cantidad) * total)
+        elif accion == "scroll":
+            paso = self.filas_visibles if unidad == "pages" else 1
+            self.desplazamiento += int(cantidad) * paso
+        self.refrescar()
+    
+    def _rueda(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.desplazar("scroll", -3, "units")
+        else:
+            self.desplazar("scroll", 3, "units")
+        return "break"
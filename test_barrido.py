@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Pruebas del barrido paralelo de parámetros
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from barrido_siget import compactar_carga, combinaciones, ejecutar_barrido, simular_carga
+from nucleo_siget import generar_procesos_aleatorios
+
+
+def test_barrido_reproducible_desde_las_semillas():
+    """El barrido en paralelo da lo mismo que simular cada tarea en serie"""
+    algoritmos, quantums, semillas = ["FIFO", "Round Robin"], [1, 3], [5, 6]
+    resultados = {(r.algoritmo, r.quantum, r.semilla): r
+                  for r in ejecutar_barrido(algoritmos, quantums, semillas, 300, trabajadores=2)}
+    
+    assert sorted(resultados, key=str) == sorted(combinaciones(algoritmos, quantums, semillas), key=str)
+    for (algoritmo, quantum, semilla), resultado in resultados.items():
+        carga = compactar_carga(generar_procesos_aleatorios(300, semilla))
+        procesos, despachos, tiempo, espera, respuesta, espera_llegada, *_ = simular_carga(carga, algoritmo, quantum)
+        assert (resultado.procesos, resultado.despachos, resultado.tiempo_total) == (procesos, despachos, tiempo)
+        assert (resultado.espera_promedio, resultado.respuesta_promedio) == (espera, respuesta)
+        assert resultado.espera_llegada_promedio == espera_llegada >= espera
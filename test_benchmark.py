@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la suite de benchmark (casos reproducibles y detección de regresiones)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import benchmark_siget
+from benchmark_siget import comparar_con_base, ejecutar_suite, informe_suite, medir_caso
+
+
+def test_casos_reproducibles_desde_la_semilla(monkeypatch):
+    monkeypatch.setattr(benchmark_siget, "SEGUNDOS_MINIMOS", 0)
+    primero = medir_caso("Round Robin", 2000, semilla=3, quantum=2)
+    segundo = medir_caso("Round Robin", 2000, semilla=3, quantum=2)
+    for campo in ("despachos", "eventos", "tiempo_simulado", "quantum"):
+        assert primero[campo] == segundo[campo]
+    assert primero["eventos"] == 2000 + primero["despachos"] + 2000
+    assert primero["eventos_por_seg"] > 0 and primero["ns_por_despacho"] > 0
+    
+    # En flujo da lo mismo que en memoria
+    monkeypatch.setattr(benchmark_siget, "LIMITE_EN_MEMORIA", 100)
+    en_flujo = medir_caso("Round Robin", 2000, semilla=3, quantum=2)
+    assert en_flujo["en_flujo"] and en_flujo["despachos"] == primero["despachos"]
+
+
+def test_regresion_por_encima_del_umbral(monkeypatch):
+    monkeypatch.setattr(benchmark_siget, "SEGUNDOS_MINIMOS", 0)
+    base = informe_suite(ejecutar_suite([100], ["FIFO", "SJF"], aislar=False))
+    actual = informe_suite(dict(caso) for caso in base["casos"])
+    assert comparar_con_base(actual, base, umbral=10) == []
+    
+    actual["casos"][1]["eventos_por_seg"] = base["casos"][1]["eventos_por_seg"] * 0.8
+    regresiones = comparar_con_base(actual, base, umbral=10)
+    assert [(algoritmo, cantidad) for algoritmo, cantidad, *_ in regresiones] == [("SJF", 100)]
+    assert abs(regresiones[0][-1] - 20) < 1e-9
+    assert comparar_con_base(actual, base, umbral=25) == []
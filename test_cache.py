@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la caché de resultados
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import barrido_siget
+from barrido_siget import ejecutar_barrido
+from cache_siget import CacheResultados, clave_configuracion, huella_carga, simular_con_cache
+from estadisticas_siget import EstadisticasSimulacion
+from linea_tiempo_siget import LineaTiempo
+from nucleo_siget import CostoConmutacion, SimuladorSIGET, generar_procesos_aleatorios
+
+
+def test_huella_estable_y_sensible_a_la_carga():
+    a = generar_procesos_aleatorios(300, 1)
+    b = generar_procesos_aleatorios(300, 1)
+    for proceso in b:
+        proceso.nombre = "otro"
+    assert huella_carga(a) == huella_carga(b)
+    b[10].tiempo_ejecucion += 1
+    assert huella_carga(a) != huella_carga(b)
+
+
+def test_clave_segun_configuracion():
+    huella = huella_carga(generar_procesos_aleatorios(50, 0))
+    # El quantum no importa en políticas que no lo usan
+    assert clave_configuracion(huella, "FIFO", 2) == clave_configuracion(huella, "FIFO", 8)
+    assert clave_configuracion(huella, "Round Robin", 2) != clave_configuracion(huella, "Round Robin", 8)
+    assert (clave_configuracion(huella, "SJF", None, CostoConmutacion(1))
+            != clave_configuracion(huella, "SJF", None, CostoConmutacion(2)))
+
+
+def test_lru_en_memoria_y_contadores():
+    cache = CacheResultados(max_entradas=2)
+    cache.guardar("a", 1)
+    cache.guardar("b", 2)
+    assert cache.obtener("a") == 1
+    cache.guardar("c", 3)  # Desaloja "b", la menos usada
+    assert cache.obtener("b") is None
+    assert cache.obtener("c") == 3
+    assert (cache.aciertos_memoria, cache.fallos) == (2, 1)
+    assert cache.obtener_o_calcular("d", lambda: 4) == 4
+    assert cache.obtener_o_calcular("d", lambda: 5) == 4
+
+
+def test_disco_persiste_desaloja_e_invalida_por_version(tmp_path):
+    cache = CacheResultados(tmp_path, max_bytes=10**6, version="v1")
+    cache.guardar("x", list(range(100)))
+    otra = CacheResultados(tmp_path, version="v1")
+    assert otra.obtener("x") == list(range(100))
+    assert otra.aciertos_disco == 1
+
+    chica = CacheResultados(tmp_path, max_bytes=2000, version="v1")
+    for clave in "abcdefgh":
+        chica.guardar(clave, bytes(600))
+    assert chica.bytes_disco <= 2000 and chica.desalojos_disco > 0
+    assert len(os.listdir(tmp_path / "v1")) == chica.estadisticas()["entradas_disco"]
+
+    nueva = CacheResultados(tmp_path, version="v2")
+    assert nueva.obtener("x") is None
+    assert os.listdir(tmp_path) == ["v2"]
+
+
+def test_simular_con_cache_reproduce_la_corrida():
+    cache = CacheResultados()
+    directo = SimuladorSIGET()
+    directo.procesos = generar_procesos_aleatorios(500, 3)
+    directo.algoritmo_actual = "Round Robin"
+    directo.ejecutar_simulacion()
+
+    simulador = SimuladorSIGET()
+    simulador.procesos = generar_procesos_aleatorios(500, 3)
+    simulador.algoritmo_actual = "Round Robin"
+    simulador.estadisticas = EstadisticasSimulacion()
+    assert not simular_con_cache(simulador, cache)
+    simulador.resetear_simulacion()
+    assert simular_con_cache(simulador, cache)
+    assert cache.aciertos == 1 and cache.fallos == 1
+
+    assert ([(p.id, p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in simulador.procesos_terminados]
+            == [(p.id, p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in directo.procesos_terminados])
+    assert (simulador.tiempo_actual, simulador.despachos) == (directo.tiempo_actual, directo.despachos)
+    assert simulador.estadisticas.cantidad == 500
+
+
+def test_cache_con_cambios_y_linea_de_tiempo():
+    """Como en la interfaz: la línea de tiempo se guarda y los cambios se publican"""
+    cache = CacheResultados()
+    simulador = SimuladorSIGET()
+    simulador.procesos = generar_procesos_aleatorios(300, 2)
+    simulador.algoritmo_actual = "SRTF"
+    simulador.linea_tiempo = LineaTiempo()
+    llamadas = []
+    assert not simular_con_cache(simulador, cache, lambda: llamadas.append(simulador.tiempo_actual))
+    segmentos = list(simulador.linea_tiempo.segmentos())
+    final = simulador.tiempo_actual
+
+    simulador.cambios = []
+    llamadas.clear()
+    assert simular_con_cache(simulador, cache, lambda: llamadas.append(simulador.tiempo_actual))
+    assert llamadas == [final]
+    assert list(simulador.linea_tiempo.segmentos()) == segmentos
+    assert {id(p) for p in simulador.cambios} == {id(p) for p in simulador.procesos}
+
+
+def test_barrido_invalida_si_cambia_su_codigo(monkeypatch):
+    cache = CacheResultados()
+    argumentos = (["FIFO"], [2], [0], 200, 1)
+    list(ejecutar_barrido(*argumentos, cache=cache))
+    monkeypatch.setattr(barrido_siget, "version_motor", lambda modulos: "otro codigo")
+    list(ejecutar_barrido(*argumentos, cache=cache))
+    assert cache.fallos == 2 and cache.aciertos == 0
+
+
+def test_barrido_repetido_solo_consulta_la_cache():
+    cache = CacheResultados()
+    argumentos = (["FIFO", "Round Robin"], [2, 4], [0, 1], 300, 2)
+    primero = sorted(ejecutar_barrido(*argumentos, cache=cache), key=lambda r: (r.algoritmo, r.quantum or 0, r.semilla))
+    assert cache.fallos == 6 and cache.aciertos == 0
+    segundo = sorted(ejecutar_barrido(*argumentos, cache=cache), key=lambda r: (r.algoritmo, r.quantum or 0, r.semilla))
+    assert cache.aciertos == 6
+    assert primero == segundo
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Pruebas del canal de instantáneas entre el motor y la interfaz
+"""
+
+import dataclasses
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from canal_siget import CanalInstantaneas, espera_de_fila
+from nucleo_siget import EstadoProceso, SimuladorSIGET
+
+
+def test_consumidor_lento_no_pierde_cambios():
+    """Aunque se descarten instantáneas intermedias, la vista final es la del motor"""
+    simulador = SimuladorSIGET()
+    simulador.crear_procesos_aleatorios(200, 1)
+    simulador.algoritmo_actual = "Round Robin"
+    canal = CanalInstantaneas()
+    canal.conectar(simulador)
+    vista = {}
+    versiones = []
+    pasos = 0
+    
+    def aplicar(instantanea):
+        versiones.append(instantanea.version)
+        vista.update(instantanea.filas)
+    
+    def al_actualizar():
+        nonlocal pasos
+        canal.publicar(simulador)
+        pasos += 1
+        if pasos % 7 == 0:  # la interfaz solo llega a ver una de cada siete
+            instantanea = canal.recibir()
+            if instantanea is not None:
+                aplicar(instantanea)
+    
+    simulador.ejecutar_simulacion(al_actualizar)
+    final = canal.recibir()
+    aplicar(final)
+    
+    assert versiones == sorted(versiones) and len(versiones) < pasos
+    assert canal.recibir() is None
+    assert final.conteos[EstadoProceso.TERMINADO] == 200
+    assert final.conteos[EstadoProceso.LISTO] == 0
+    assert {id_: (fila[7], espera_de_fila(fila, final.tiempo)) for id_, fila in vista.items()} == {
+        p.id: (p.estado, p.tiempo_espera) for p in simulador.procesos}
+    assert final.espera_promedio == sum(p.tiempo_espera for p in simulador.procesos) / 200
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        final.tiempo = 0
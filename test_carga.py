@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la carga de trazas en streaming
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from carga_siget import escribir_csv, escribir_jsonl, leer_csv, leer_traza, ordenar_llegadas
+from nucleo_siget import SimuladorSIGET, generar_procesos_aleatorios
+
+
+def test_flujo_desde_traza_igual_que_lista(tmp_path):
+    """Simular la traza en streaming da lo mismo que simular la lista completa"""
+    procesos = generar_procesos_aleatorios(400, 2)
+    escribir_csv(tmp_path / "traza.csv", procesos)
+    escribir_jsonl(tmp_path / "traza.jsonl", procesos)
+    
+    referencia = SimuladorSIGET()
+    referencia.procesos = procesos
+    referencia.algoritmo_actual = "SRTF"
+    referencia.ejecutar_simulacion()
+    esperado = [(p.id, p.tiempo_fin, p.tiempo_espera) for p in referencia.procesos_terminados]
+    
+    for nombre in ("traza.csv", "traza.jsonl"):
+        terminados = []
+        simulador = SimuladorSIGET()
+        simulador.algoritmo_actual = "SRTF"
+        simulador.ejecutar_flujo(leer_traza(tmp_path / nombre),
+                                 al_terminar=lambda p: terminados.append((p.id, p.tiempo_fin, p.tiempo_espera)))
+        assert terminados == esperado
+        assert simulador.procesos_terminados == []
+
+
+def test_llegadas_fuera_de_orden(tmp_path):
+    """Sin ventana se rechaza el desorden; con ventana se reordena dentro de ella"""
+    procesos = generar_procesos_aleatorios(6)
+    procesos[2], procesos[3] = procesos[3], procesos[2]
+    escribir_csv(tmp_path / "desordenada.csv", procesos)
+    
+    with pytest.raises(ValueError):
+        list(leer_csv(tmp_path / "desordenada.csv"))
+    ordenados = [p.tiempo_irrupcion for p in leer_csv(tmp_path / "desordenada.csv", ventana=2)]
+    assert ordenados == sorted(ordenados)
+    
+    procesos.append(procesos[0])
+    with pytest.raises(ValueError):
+        list(ordenar_llegadas(procesos, ventana=2))
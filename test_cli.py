@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la corrida sin interfaz
+"""
+
+import csv
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import traza_siget
+from cli_siget import abrir_fuente, crear_parser, main
+from nucleo_siget import SimuladorSIGET, generar_procesos_aleatorios
+from traza_siget import escribir_traza_binaria
+
+
+def test_importar_no_carga_tkinter_ni_numpy():
+    codigo = "import sys, cli_siget; sys.exit('tkinter' in sys.modules or 'numpy' in sys.modules)"
+    resultado = subprocess.run([sys.executable, "-c", codigo], cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert resultado.returncode == 0
+
+
+def test_csv_y_resumen_coinciden_con_el_motor(tmp_path):
+    salida, resumen = tmp_path / "r.csv", tmp_path / "r.json"
+    assert main(["--procesos", "800", "--semilla", "3", "--algoritmo", "Round Robin", "--quantum", "3",
+                 "--salida", str(salida), "--resumen", str(resumen)]) == 0
+
+    simulador = SimuladorSIGET()
+    simulador.procesos = generar_procesos_aleatorios(800, 3)
+    simulador.algoritmo_actual = "Round Robin"
+    simulador.quantum = 3
+    simulador.ejecutar_simulacion()
+
+    with open(salida, newline="", encoding="utf-8") as archivo:
+        filas = list(csv.DictReader(archivo))
+    assert [(int(f["id"]), int(f["tiempo_fin"]), int(f["tiempo_espera"])) for f in filas] == [
+        (p.id, p.tiempo_fin, p.tiempo_espera) for p in simulador.procesos_terminados]
+
+    metricas = json.loads(resumen.read_text(encoding="utf-8"))
+    assert metricas["procesos"] == 800 and metricas["quantum"] == 3
+    assert metricas["tiempo_total"] == simulador.tiempo_actual
+    esperada = sum(p.tiempo_espera for p in simulador.procesos_terminados) / 800
+    assert metricas["estadisticas"]["total"]["espera"]["media"] == pytest.approx(esperada)
+
+
+def test_traza_binaria_a_jsonl_y_resumen_por_salida_estandar(tmp_path, capsys):
+    traza, salida = tmp_path / "carga.bin", tmp_path / "r.jsonl"
+    escribir_traza_binaria(traza, generar_procesos_aleatorios(300, 5))
+    assert main(["--traza", str(traza), "--algoritmo", "SJF", "--salida", str(salida)]) == 0
+    assert json.loads(capsys.readouterr().out)["procesos"] == 300
+    registros = [json.loads(linea) for linea in salida.read_text(encoding="utf-8").splitlines()]
+    assert len(registros) == 300 and registros[0]["tipo"] in {"MONITOREO_TRAFICO", "GESTION_SEMAFOROS",
+                                                               "ANALISIS_DATOS"}
+
+
+def test_extension_json_es_un_documento_json(tmp_path):
+    salida = tmp_path / "r.json"
+    assert main(["--procesos", "200", "--salida", str(salida), "--resumen", str(tmp_path / "m.json")]) == 0
+    registros = json.loads(salida.read_text(encoding="utf-8"))
+    assert len(registros) == 200 and registros[0]["id"] == 1
+    vacia = tmp_path / "vacia.json"
+    assert main(["--procesos", "0", "--salida", str(vacia), "--resumen", str(tmp_path / "m.json")]) == 0
+    assert json.loads(vacia.read_text(encoding="utf-8")) == []
+
+
+def test_la_traza_binaria_se_cierra(tmp_path, monkeypatch):
+    traza = tmp_path / "carga.bin"
+    escribir_traza_binaria(traza, generar_procesos_aleatorios(50, 5))
+    cerradas = []
+    cerrar = traza_siget.TrazaBinaria.cerrar
+    monkeypatch.setattr(traza_siget.TrazaBinaria, "cerrar", lambda self: (cerradas.append(self), cerrar(self)))
+
+    # Aun si la corrida se interrumpe a mitad de la traza
+    with pytest.raises(RuntimeError):
+        with abrir_fuente(crear_parser().parse_args(["--traza", str(traza)])) as fuente:
+            next(fuente)
+            raise RuntimeError
+    assert len(cerradas) == 1 and cerradas[0]._mapa.closed
+    assert main(["--traza", str(traza), "--resumen", str(tmp_path / "r.json")]) == 0
+    assert len(cerradas) == 2
+
+
+def test_salida_en_columnas(tmp_path):
+    np = pytest.importorskip("numpy")
+    salida = tmp_path / "r.npz"
+    main(["--procesos", "500", "--algoritmo", "SRTF", "--salida", str(salida), "--resumen",
+          str(tmp_path / "r.json")])
+    columnas = np.load(salida)
+    assert len(columnas["id"]) == 500
+    assert columnas["prioridad_alerta"].dtype == np.int8
+    assert np.all(columnas["tiempo_respuesta"] == columnas["tiempo_fin"] - columnas["tiempo_irrupcion"])
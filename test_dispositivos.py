@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Pruebas del modelo de E/S (dispositivos y estado Bloqueado)
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from dispositivos_siget import SimuladorES
+from instrumentacion_siget import Instrumentacion
+from nucleo_siget import (
+    POLITICAS, CostoConmutacion, EstadoProceso, ProcesoSIGET, SimuladorSIGET, TipoProceso, generar_procesos_aleatorios
+)
+
+
+@pytest.mark.parametrize("algoritmo", list(POLITICAS))
+def test_sin_rafagas_de_es_coincide_con_el_motor_original(algoritmo):
+    esperado = SimuladorSIGET()
+    esperado.procesos = generar_procesos_aleatorios(300, semilla=8)
+    con_es = SimuladorES(rafagas_es=0)
+    con_es.procesos = generar_procesos_aleatorios(300, semilla=8)
+    for simulador in (esperado, con_es):
+        simulador.algoritmo_actual = algoritmo
+        simulador.ejecutar_simulacion()
+    
+    assert [(p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in con_es.procesos] == [
+        (p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in esperado.procesos]
+    assert con_es.despachos == esperado.despachos
+
+
+def test_la_cpu_se_solapa_con_la_transferencia():
+    # A: 4 de CPU, 100 MB a 10 MB/s (10 unidades), 4 de CPU; B corre mientras A transfiere
+    simulador = SimuladorES({"camaras": 10})
+    simulador.procesos = [
+        ProcesoSIGET(1, "A", TipoProceso.MONITOREO_TRAFICO, 0, 8, 1, 100, tiempo_restante=8),
+        ProcesoSIGET(2, "B", TipoProceso.ANALISIS_DATOS, 0, 6, 1, 0, tiempo_restante=6),
+    ]
+    estados = []
+    simulador.ejecutar_simulacion(lambda: estados.append(simulador.procesos[0].estado))
+    a, b = simulador.procesos
+    
+    assert EstadoProceso.BLOQUEADO in estados
+    assert (a.tiempo_fin, b.tiempo_fin) == (18, 10)
+    assert simulador.makespan == 18
+    assert simulador.tiempo_solapado == 6
+    assert simulador.espera_es == 10
+    camaras = simulador.resumen_es()["dispositivos"]["camaras"]
+    assert camaras["mb_transferidos"] == 100 and camaras["transferencias"] == 1
+
+
+def test_cuello_de_botella_segun_el_ancho_de_banda():
+    asignacion = {TipoProceso.MONITOREO_TRAFICO: "camaras", TipoProceso.ANALISIS_DATOS: "disco",
+                  TipoProceso.GESTION_SEMAFOROS: "red"}
+    lento = SimuladorES({"camaras": 5, "disco": 500, "red": 500}, asignacion, rafagas_es=2)
+    rapido = SimuladorES({"camaras": 5000, "disco": 5000, "red": 5000}, asignacion, rafagas_es=2)
+    for simulador in (lento, rapido):
+        simulador.procesos = generar_procesos_aleatorios(500, semilla=1)
+        simulador.algoritmo_actual = "Round Robin"
+        simulador.ejecutar_simulacion()
+        assert simulador.cantidad_terminados == 500
+        assert simulador.cantidad_bloqueados == 0
+        assert simulador.tiempo_cpu_ocupada == sum(p.tiempo_ejecucion for p in simulador.procesos)
+        assert simulador.tiempo_solapado <= min(simulador.tiempo_cpu_ocupada, simulador.tiempo_es_ocupada)
+    
+    assert lento.cuello_de_botella() == "camaras"
+    assert rapido.cuello_de_botella() == "CPU"
+    assert lento.makespan > rapido.makespan
+    camaras = lento.dispositivos["camaras"]
+    esperado = sum(p.tamaño_datos for p in lento.procesos if p.tipo == TipoProceso.MONITOREO_TRAFICO)
+    assert camaras.mb_transferidos == pytest.approx(esperado)
+    assert camaras.transferencias == 2 * sum(p.tipo == TipoProceso.MONITOREO_TRAFICO for p in lento.procesos)
+
+
+def test_rechaza_costo_e_instrumentacion():
+    """Lo que el modelo de E/S no modela no se ignora en silencio"""
+    simulador = SimuladorES()
+    simulador.crear_procesos_ejemplo()
+    simulador.costo_conmutacion = CostoConmutacion(5, 5)
+    with pytest.raises(NotImplementedError):
+        simulador.ejecutar_simulacion()
+    simulador.costo_conmutacion = None
+    simulador.instrumentacion = Instrumentacion()
+    with pytest.raises(NotImplementedError):
+        simulador.ejecutar_simulacion()
+
+
+def test_ids_repetidos():
+    """Los ids vienen de trazas del usuario y pueden repetirse"""
+    simuladores = []
+    for repetir in (False, True):
+        simulador = SimuladorES({"camaras": 50, "disco": 200, "red": 100}, rafagas_es=2)
+        simulador.procesos = generar_procesos_aleatorios(50, semilla=3)
+        if repetir:
+            for proceso in simulador.procesos[:3]:
+                proceso.id = 1
+        simulador.algoritmo_actual = "Round Robin"
+        simulador.ejecutar_simulacion()
+        simuladores.append(simulador)
+    unicos, repetidos = simuladores
+    
+    assert repetidos.cantidad_terminados == 50
+    assert ([(p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in repetidos.procesos] ==
+            [(p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in unicos.procesos])
+    assert repetidos.espera_es == unicos.espera_es
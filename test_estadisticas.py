@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Pruebas de las estadísticas incrementales (Welford y P²)
+"""
+
+import os
+import random
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from estadisticas_siget import EstadisticaIncremental, EstadisticasSimulacion
+from nucleo_siget import SimuladorSIGET, TipoProceso
+
+
+def test_welford_y_percentiles_contra_valores_exactos():
+    azar = random.Random(5)
+    muestras = [azar.expovariate(1 / 40) for _ in range(20000)]
+    estadistica = EstadisticaIncremental()
+    for valor in muestras:
+        estadistica.agregar(valor)
+    
+    assert estadistica.cantidad == len(muestras)
+    assert abs(estadistica.media - statistics.fmean(muestras)) < 1e-9
+    assert abs(estadistica.varianza - statistics.variance(muestras)) < 1e-6 * statistics.variance(muestras)
+    assert estadistica.minimo == min(muestras) and estadistica.maximo == max(muestras)
+    
+    ordenadas = sorted(muestras)
+    for p in (0.5, 0.95, 0.99):
+        exacto = ordenadas[int(p * (len(ordenadas) - 1))]
+        assert abs(estadistica.percentil(p) - exacto) < 0.03 * exacto
+
+
+def test_pocas_muestras_usa_valores_exactos():
+    estadistica = EstadisticaIncremental()
+    for valor in (7, 3, 9):
+        estadistica.agregar(valor)
+    assert estadistica.percentil(0.5) == 7
+    assert estadistica.resumen()["p99"] == 9
+
+
+def test_el_motor_registra_cada_terminacion_por_tipo_y_prioridad():
+    simulador = SimuladorSIGET()
+    simulador.crear_procesos_aleatorios(500, semilla=2)
+    simulador.algoritmo_actual = "Round Robin"
+    simulador.estadisticas = EstadisticasSimulacion()
+    simulador.ejecutar_simulacion()
+    
+    estadisticas = simulador.estadisticas
+    esperas = [p.tiempo_espera for p in simulador.procesos]
+    assert estadisticas.cantidad == 500
+    assert estadisticas.total["espera"].media == sum(esperas) / 500
+    assert estadisticas.total["respuesta"].maximo == max(p.tiempo_respuesta for p in simulador.procesos)
+    
+    for tipo in TipoProceso:
+        del_tipo = [p.tiempo_espera for p in simulador.procesos if p.tipo == tipo]
+        assert estadisticas.por_tipo[tipo]["espera"].media == sum(del_tipo) / len(del_tipo)
+    assert sum(g["espera"].cantidad for g in estadisticas.por_prioridad.values()) == 500
+    
+    # Repetir la corrida reinicia los acumulados
+    simulador.ejecutar_simulacion()
+    assert estadisticas.cantidad == 500
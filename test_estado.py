@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Pruebas de pausa, capturas, restauración y ramas del motor
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from estadisticas_siget import EstadisticasSimulacion
+from estado_siget import capturar, cargar_captura
+from linea_tiempo_siget import LineaTiempo
+from nucleo_siget import (POLITICAS, CostoConmutacion, ProcesoSIGET, SimuladorSIGET, TipoProceso,
+                          generar_procesos_aleatorios)
+
+
+def _simulador(algoritmo, costo=None):
+    simulador = SimuladorSIGET()
+    simulador.procesos = generar_procesos_aleatorios(400, 5)
+    simulador.algoritmo_actual = algoritmo
+    simulador.quantum = 3
+    simulador.costo_conmutacion = costo
+    simulador.estadisticas = EstadisticasSimulacion()
+    return simulador
+
+
+def _resultados(simulador):
+    return ([(p.id, p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in simulador.procesos_terminados],
+            sorted((p.id, p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in simulador.procesos),
+            (simulador.tiempo_actual, simulador.despachos, simulador.cantidad_terminados,
+             simulador.cambios_contexto, simulador.tiempo_sobrecarga, simulador.tiempo_util),
+            simulador.estadisticas.resumen())
+
+
+def test_pausas_no_cambian_el_resultado():
+    for algoritmo in POLITICAS:
+        referencia = _simulador(algoritmo, CostoConmutacion(1, 1))
+        referencia.ejecutar_simulacion()
+        simulador = _simulador(algoritmo, CostoConmutacion(1, 1))
+        limite = 0
+        while simulador.ejecutar_hasta(limite):
+            assert simulador.tiempo_actual >= limite
+            limite += 61
+        assert simulador.pausa is None
+        assert _resultados(simulador) == _resultados(referencia), algoritmo
+
+
+def test_rebobinar_y_bifurcar():
+    for algoritmo in POLITICAS:
+        referencia = _simulador(algoritmo)
+        referencia.ejecutar_simulacion()
+        simulador = _simulador(algoritmo)
+        simulador.linea_tiempo = LineaTiempo()
+        assert simulador.ejecutar_hasta(referencia.tiempo_actual // 2)
+        captura = capturar(simulador)
+        simulador.ejecutar_hasta(None)
+        segmentos = list(simulador.linea_tiempo.segmentos())
+
+        captura.restaurar(simulador)
+        assert simulador.tiempo_actual == captura.tiempo and simulador.pausa is not None
+        simulador.ejecutar_hasta(None)
+        assert _resultados(simulador) == _resultados(referencia), algoritmo
+        assert list(simulador.linea_tiempo.segmentos()) == segmentos
+
+        # Una rama con un pico de incidentes no afecta a las demás
+        pico = captura.bifurcar()
+        pico.procesos.extend(ProcesoSIGET(10000 + i, "Incidente", TipoProceso.MONITOREO_TRAFICO,
+                                          captura.tiempo + 3, 5, 1, 40) for i in range(30))
+        pico.ejecutar_hasta(None)
+        assert pico.cantidad_terminados == referencia.cantidad_terminados + 30
+        pico.resetear_simulacion()
+        pico.ejecutar_simulacion()
+        rama = captura.bifurcar()
+        rama.ejecutar_hasta(None)
+        assert _resultados(rama) == _resultados(referencia), algoritmo
+
+
+def test_editar_pendientes_en_una_rama():
+    referencia = _simulador("SJF", CostoConmutacion(1, 1))
+    referencia.ejecutar_simulacion()
+    simulador = _simulador("SJF", CostoConmutacion(1, 1))
+    assert simulador.ejecutar_hasta(1000)
+    captura = capturar(simulador)
+    columnas = {nombre: list(columna) for nombre, columna in captura.columnas.items()}
+
+    editada = captura.bifurcar()
+    otra = captura.bifurcar()
+    pendientes = [p for p in editada.procesos if p.tiempo_irrupcion > captura.tiempo]
+    assert pendientes
+    for proceso in pendientes:
+        proceso.tiempo_ejecucion += 5
+        proceso.tiempo_restante += 5
+    editada.costo_conmutacion.cambio_contexto = 4
+    editada.ejecutar_hasta(None)
+
+    otra.ejecutar_hasta(None)
+    assert _resultados(otra) == _resultados(referencia)
+    assert {nombre: list(columna) for nombre, columna in captura.columnas.items()} == columnas
+    tercera = captura.bifurcar()
+    tercera.ejecutar_hasta(None)
+    assert _resultados(tercera) == _resultados(referencia)
+
+
+def test_formato_binario(tmp_path):
+    referencia = _simulador("Prioridad Expropiativa", CostoConmutacion(2, por_tipo={TipoProceso.ANALISIS_DATOS: 4}))
+    referencia.ejecutar_simulacion()
+    simulador = _simulador("Prioridad Expropiativa", CostoConmutacion(2, por_tipo={TipoProceso.ANALISIS_DATOS: 4}))
+    simulador.ejecutar_hasta(referencia.tiempo_actual // 3)
+    ruta = tmp_path / "captura.bin"
+    capturar(simulador).guardar(ruta)
+
+    cargada = cargar_captura(ruta)
+    rama = cargada.bifurcar()
+    rama.estadisticas = EstadisticasSimulacion()
+    cargada.restaurar(rama)
+    rama.ejecutar_hasta(None)
+    assert _resultados(rama) == _resultados(referencia)
+    assert [p.nombre for p in rama.procesos] == [p.nombre for p in referencia.procesos]
+
+    datos = bytearray(ruta.read_bytes())
+    datos[8] = 99  # Versión desconocida
+    ruta.write_bytes(bytes(datos))
+    with pytest.raises(ValueError):
+        cargar_captura(ruta)
+
+
+def test_solo_motor_base_detenido():
+    simulador = _simulador("FIFO")
+    simulador.ejecutando = True
+    with pytest.raises(RuntimeError):
+        capturar(simulador)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Pruebas del generador vectorizado de cargas sintéticas
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+np = pytest.importorskip("numpy")
+
+from generador_siget import (PERFILES_SIGET, HoraPico, PerfilTipo, generar_columnas,
+                             iterar_procesos, tabla_desde_columnas)
+from nucleo_siget import SimuladorSIGET, TipoProceso
+
+
+def test_misma_semilla_misma_carga():
+    a = generar_columnas(5000, semilla=3)
+    b = generar_columnas(5000, semilla=3)
+    c = generar_columnas(5000, semilla=4)
+    assert all(np.array_equal(a[nombre], b[nombre]) for nombre in a)
+    assert not np.array_equal(a["irrupcion"], c["irrupcion"])
+
+
+def test_columnas_ordenadas_y_validas():
+    columnas = generar_columnas(20000, semilla=1)
+    assert len(columnas["id"]) == 20000
+    assert np.all(np.diff(columnas["irrupcion"]) >= 0)
+    assert columnas["ejecucion"].min() >= 1
+    assert columnas["tamaño"].min() >= 0
+    assert set(np.unique(columnas["prioridad"])) <= {1, 2, 3, 4, 5}
+
+
+def test_mezcla_de_tipos_segun_tasas():
+    columnas = generar_columnas(100000, semilla=2, hora_pico=None)
+    total = sum(perfil.tasa_media for perfil in PERFILES_SIGET.values())
+    for codigo, tipo in enumerate(TipoProceso):
+        esperada = PERFILES_SIGET[tipo].tasa_media / total
+        assert abs(np.mean(columnas["tipo"] == codigo) - esperada) < 0.02
+
+
+def test_hora_pico_sube_las_alertas_urgentes():
+    pico = HoraPico(periodo=1000, ventanas=((0, 500),), prioridades=(1.0, 0, 0, 0, 0))
+    perfiles = {TipoProceso.GESTION_SEMAFOROS: PerfilTipo(1.0, prioridades=(0, 0, 0, 0, 1.0))}
+    columnas = generar_columnas(10000, semilla=5, perfiles=perfiles, hora_pico=pico)
+    en_pico = columnas["irrupcion"] % 1000 < 500
+    assert np.all(columnas["prioridad"][en_pico] == 1)
+    assert np.all(columnas["prioridad"][~en_pico] == 5)
+
+
+def test_mmpp_es_mas_irregular_que_poisson():
+    def dispersion(perfil):
+        perfiles = {TipoProceso.MONITOREO_TRAFICO: perfil}
+        llegadas = generar_columnas(50000, semilla=6, perfiles=perfiles, hora_pico=None)["irrupcion"]
+        cuentas = np.bincount(llegadas // 100)
+        return cuentas.var() / cuentas.mean()
+
+    poisson = dispersion(PerfilTipo(0.5))
+    mmpp = dispersion(PerfilTipo(0.2, tasa_rafaga=3.0, duracion_normal=500, duracion_rafaga=100))
+    assert poisson < 2 < mmpp
+
+
+def test_columnas_y_objetos_simulan_igual():
+    columnas = generar_columnas(3000, semilla=7)
+    procesos = list(iterar_procesos(columnas, bloque=1000))
+    assert [(p.id, p.tiempo_irrupcion, p.tiempo_ejecucion, p.prioridad_alerta, p.tamaño_datos)
+            for p in procesos[:5]] == list(zip(*(columnas[nombre][:5].tolist() for nombre in
+                                                 ("id", "irrupcion", "ejecucion", "prioridad", "tamaño"))))
+
+    con_vistas = SimuladorSIGET()
+    con_vistas.procesos = tabla_desde_columnas(columnas).vistas()
+    con_vistas.algoritmo_actual = "SJF"
+    con_vistas.ejecutar_simulacion()
+
+    con_objetos = SimuladorSIGET()
+    con_objetos.procesos = procesos
+    con_objetos.algoritmo_actual = "SJF"
+    con_objetos.ejecutar_simulacion()
+    assert ([(p.id, p.tiempo_fin) for p in con_vistas.procesos_terminados]
+            == [(p.id, p.tiempo_fin) for p in con_objetos.procesos_terminados])
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la re-simulación incremental con puntos de control
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from estadisticas_siget import EstadisticasSimulacion
+from incremental_siget import PuntosControl, resimular
+from nucleo_siget import (POLITICAS, CostoConmutacion, ProcesoSIGET, SimuladorSIGET, TipoProceso,
+                          generar_procesos_aleatorios)
+
+
+def _simulador(algoritmo, cantidad=600, semilla=3, **opciones):
+    simulador = SimuladorSIGET()
+    simulador.procesos = generar_procesos_aleatorios(cantidad, semilla)
+    simulador.algoritmo_actual = algoritmo
+    simulador.estadisticas = EstadisticasSimulacion()
+    simulador.puntos_control = PuntosControl(**opciones)
+    simulador.ejecutar_simulacion()
+    return simulador
+
+
+def _resultados(simulador):
+    return ([(p.id, p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in simulador.procesos_terminados],
+            sorted((p.id, p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in simulador.procesos),
+            (simulador.tiempo_actual, simulador.despachos, simulador.cantidad_terminados,
+             simulador.cambios_contexto, simulador.tiempo_util),
+            simulador.estadisticas.resumen())
+
+
+def _desde_cero(simulador):
+    """Misma carga y configuración, simulada completa en otro motor"""
+    referencia = SimuladorSIGET()
+    referencia.procesos = [ProcesoSIGET(p.id, p.nombre, p.tipo, p.tiempo_irrupcion, p.tiempo_ejecucion,
+                                        p.prioridad_alerta, p.tamaño_datos) for p in simulador.procesos]
+    referencia.algoritmo_actual = simulador.algoritmo_actual
+    referencia.quantum = simulador.quantum
+    referencia.estadisticas = EstadisticasSimulacion()
+    referencia.ejecutar_simulacion()
+    return referencia
+
+
+def test_equivale_a_simular_desde_cero():
+    azar = random.Random(7)
+    for algoritmo in POLITICAS:
+        simulador = _simulador(algoritmo, intervalo=20, max_puntos=8)
+        for paso in range(3):
+            proceso = azar.choice(simulador.procesos)
+            proceso.prioridad_alerta = azar.randint(1, 5)
+            # Un trabajo tardío y uno menos
+            simulador.procesos.append(ProcesoSIGET(10000 + paso, "Tardío", TipoProceso.ANALISIS_DATOS,
+                                                   azar.randint(0, simulador.tiempo_actual), 4, 1, 100))
+            simulador.procesos.pop(azar.randrange(len(simulador.procesos) - 1))
+            informe = resimular(simulador)
+            assert _resultados(simulador) == _resultados(_desde_cero(simulador)), (algoritmo, informe)
+
+
+def test_reanuda_tarde_y_converge():
+    simulador = _simulador("FIFO", cantidad=2000, intervalo=50)
+    proceso = sorted(simulador.procesos, key=lambda p: p.tiempo_irrupcion)[1500]
+    proceso.prioridad_alerta = 6 - proceso.prioridad_alerta  # FIFO no la usa
+    informe = resimular(simulador)
+    assert not informe["completa"]
+    assert 0 < informe["reanudado_en"] <= proceso.tiempo_irrupcion
+    assert informe["convergio_en"] is not None
+    assert _resultados(simulador) == _resultados(_desde_cero(simulador))
+
+
+def test_puntos_acotados():
+    simulador = _simulador("Round Robin", cantidad=3000, intervalo=1, max_puntos=16)
+    assert 0 < len(simulador.puntos_control) <= 16
+    assert simulador.puntos_control.intervalo > 1
+
+
+def test_sin_cambios_o_con_otra_configuracion():
+    simulador = _simulador("SJF")
+    assert resimular(simulador) == {"completa": False, "reanudado_en": None, "convergio_en": None}
+    simulador.algoritmo_actual = "SRTF"
+    simulador.procesos[0].tiempo_ejecucion += 1
+    assert resimular(simulador)["completa"]
+    assert _resultados(simulador) == _resultados(_desde_cero(simulador))
+
+
+
+def test_costo_editado_en_el_lugar():
+    simulador = _simulador("Round Robin")
+    costo = simulador.costo_conmutacion = CostoConmutacion(1, por_tipo={TipoProceso.ANALISIS_DATOS: 2})
+    simulador.ejecutar_simulacion()
+    costo.cambio_contexto = 5
+    costo.por_tipo[TipoProceso.ANALISIS_DATOS] = 7
+    simulador.procesos[-1].tiempo_ejecucion += 1
+    assert resimular(simulador)["completa"]
+
+    referencia = _desde_cero(simulador)
+    referencia.costo_conmutacion = CostoConmutacion(5, por_tipo={TipoProceso.ANALISIS_DATOS: 7})
+    referencia.ejecutar_simulacion()
+    assert _resultados(simulador) == _resultados(referencia)
+    assert simulador.tiempo_sobrecarga == referencia.tiempo_sobrecarga
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la instrumentación del motor (tramos, contadores y exportadores)
+"""
+
+import json
+import os
+import pstats
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from instrumentacion_siget import Instrumentacion
+from nucleo_siget import SimuladorSIGET, generar_procesos_aleatorios
+
+
+def _correr(instrumentacion=None, algoritmo="Round Robin"):
+    simulador = SimuladorSIGET()
+    simulador.procesos = generar_procesos_aleatorios(500, semilla=6)
+    simulador.algoritmo_actual = algoritmo
+    simulador.instrumentacion = instrumentacion
+    simulador.ejecutar_simulacion(lambda: None)
+    return simulador
+
+
+def test_tramos_por_fase_sin_cambiar_resultados():
+    instrumentacion = Instrumentacion()
+    medido = _correr(instrumentacion)
+    sin_medir = _correr()
+    assert [p.tiempo_fin for p in medido.procesos] == [p.tiempo_fin for p in sin_medir.procesos]
+    
+    tramos = instrumentacion.tramos
+    assert tramos["simulacion"][0] == 1
+    assert tramos["seleccion"][0] == tramos["espera"][0] == medido.despachos
+    assert tramos["ejecucion"][0] == tramos["callback"][0] == medido.despachos
+    assert instrumentacion.contadores["terminaciones"] == 500
+    assert instrumentacion.contadores["llegadas"] == 500
+    assert sum(total for nombre, (_, total, _) in tramos.items() if nombre != "simulacion") <= tramos["simulacion"][1]
+
+
+def test_exportadores_pstats_y_chrome(tmp_path):
+    instrumentacion = Instrumentacion(max_eventos=100)
+    _correr(instrumentacion, "SRTF")
+    
+    instrumentacion.exportar_pstats(tmp_path / "perfil.prof")
+    estadisticas = pstats.Stats(str(tmp_path / "perfil.prof"))
+    assert {funcion for _, _, funcion in estadisticas.stats} == set(instrumentacion.tramos)
+    assert abs(estadisticas.total_tt - instrumentacion.tramos["simulacion"][1] / 1e9) < 1e-6
+    
+    instrumentacion.exportar_chrome(tmp_path / "traza.json")
+    with open(tmp_path / "traza.json", encoding="utf-8") as archivo:
+        traza = json.load(archivo)
+    completos = [evento for evento in traza["traceEvents"] if evento["ph"] == "X"]
+    assert len(completos) == 100
+    assert traza["otherData"]["eventos_descartados"] > 0
+    assert {evento["name"] for evento in traza["traceEvents"] if evento["ph"] == "C"} >= {"despachos"}
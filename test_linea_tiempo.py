@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la línea de tiempo de ejecución
+"""
+
+import csv
+import json
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from dispositivos_siget import SimuladorES
+from linea_tiempo_siget import LineaTiempo, PistaCPU
+from multinucleo_siget import SimuladorMultinucleo
+from nucleo_siget import SimuladorSIGET, generar_procesos_aleatorios
+
+
+def _correr(simulador, algoritmo, cantidad=400, semilla=2):
+    simulador.linea_tiempo = LineaTiempo()
+    simulador.procesos = generar_procesos_aleatorios(cantidad, semilla)
+    simulador.algoritmo_actual = algoritmo
+    simulador.ejecutar_simulacion()
+    return simulador.linea_tiempo
+
+
+def _verificar(linea, procesos):
+    """Cada proceso ejecuta exactamente su ráfaga, sin solapes dentro de una CPU"""
+    ejecutado = Counter()
+    for pista in linea.pistas.values():
+        for indice, (pid, inicio, fin) in enumerate(zip(pista.pid, pista.inicio, pista.fin)):
+            assert inicio < fin
+            assert indice == 0 or pista.fin[indice - 1] <= inicio
+            ejecutado[pid] += fin - inicio
+    assert ejecutado == Counter({p.id: p.tiempo_ejecucion for p in procesos})
+
+
+def test_round_robin_conserva_el_intercalado():
+    simulador = SimuladorSIGET()
+    simulador.crear_procesos_ejemplo()
+    simulador.linea_tiempo = LineaTiempo()
+    simulador.algoritmo_actual = "Round Robin"
+    simulador.quantum = 2
+    simulador.ejecutar_simulacion()
+    linea = simulador.linea_tiempo
+    _verificar(linea, simulador.procesos)
+    pista = linea.pistas[0]
+    assert len(pista) > len(simulador.procesos)  # Hubo intercalado
+    # Los tramos contiguos del mismo proceso se funden: nunca dos seguidos iguales y pegados
+    assert all(not (pista.pid[i] == pista.pid[i + 1] and pista.fin[i] == pista.inicio[i + 1])
+               for i in range(len(pista) - 1))
+    assert linea.fin == simulador.tiempo_actual
+
+
+def test_un_segmento_por_despacho_como_maximo():
+    for algoritmo in ("FIFO", "SRTF", "Prioridad Expropiativa"):
+        simulador = SimuladorSIGET()
+        linea = _correr(simulador, algoritmo)
+        _verificar(linea, simulador.procesos)
+        assert len(linea) <= simulador.despachos
+    simulador = SimuladorSIGET()
+    assert len(_correr(simulador, "FIFO")) == 400
+
+
+def test_multinucleo_y_es_registran_cada_cpu():
+    simulador = SimuladorMultinucleo(nucleos=3)
+    linea = _correr(simulador, "SRTF")
+    _verificar(linea, simulador.procesos)
+    assert linea.cpus == [0, 1, 2]
+
+    simulador = SimuladorES(rafagas_es=2)
+    linea = _correr(simulador, "Round Robin")
+    _verificar(linea, simulador.procesos)
+
+
+def test_resetear_vacia_la_linea():
+    simulador = SimuladorSIGET()
+    linea = _correr(simulador, "FIFO")
+    simulador.resetear_simulacion()
+    assert len(linea) == 0
+
+
+def test_ventana_reducida_acota_el_dibujo():
+    pista = PistaCPU()
+    for indice in range(200000):
+        pista.agregar(indice % 7, 3 * indice, 3 * indice + 2)
+    completa = list(pista.ventana(1000, 2000))
+    assert completa[0][2] > 1000 and completa[-1][1] < 2000
+    assert len(completa) == len([i for i in range(200000) if 3 * i < 2000 and 3 * i + 2 > 1000])
+
+    reducida = pista.ventana_reducida(0, 600000, 600)  # 1000 celdas
+    assert len(reducida) <= 1001
+    assert reducida[0] == (0, 0, 2) and reducida[-1][2] <= 600000
+    # Con resolución fina no se pierde ningún segmento
+    assert pista.ventana_reducida(1000, 2000, 0.5) == completa
+
+
+def test_exportar_csv_y_chrome(tmp_path):
+    simulador = SimuladorMultinucleo(nucleos=2)
+    linea = _correr(simulador, "Round Robin", cantidad=100)
+    assert linea.exportar_csv(tmp_path / "linea.csv") == len(linea)
+    with open(tmp_path / "linea.csv", newline="", encoding="utf-8") as archivo:
+        filas = list(csv.DictReader(archivo))
+    assert len(filas) == len(linea)
+    assert [int(f["inicio"]) for f in filas] == sorted(int(f["inicio"]) for f in filas)
+
+    assert linea.exportar_chrome(tmp_path / "linea.json") == len(linea)
+    eventos = json.loads((tmp_path / "linea.json").read_text(encoding="utf-8"))["traceEvents"]
+    duraciones = [e for e in eventos if e["ph"] == "X"]
+    assert len(duraciones) == len(linea)
+    assert sum(e["dur"] for e in duraciones) == sum(p.tiempo_ejecucion for p in simulador.procesos)
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la evaluación por lotes con NumPy
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+np = pytest.importorskip("numpy")
+
+from lote_siget import evaluar_lote
+from nucleo_siget import ProcesoSIGET, SimuladorSIGET, TipoProceso
+
+
+def test_lote_coincide_con_el_motor_escalar():
+    """Inicio, fin, espera y respuesta por proceso iguales a los de SimuladorSIGET"""
+    azar = np.random.default_rng(7)
+    llegada = azar.integers(0, 120, (20, 25))
+    rafaga = azar.integers(0, 12, (20, 25))
+    prioridad = azar.integers(1, 6, (20, 25))
+    
+    for algoritmo in ("FIFO", "SJF", "Prioridad"):
+        resultado = evaluar_lote(llegada, rafaga, prioridad, algoritmo=algoritmo)
+        for carga in range(llegada.shape[0]):
+            procesos = [
+                ProcesoSIGET(i, f"P{i}", TipoProceso.ANALISIS_DATOS, int(llegada[carga, i]),
+                             int(rafaga[carga, i]), int(prioridad[carga, i]), 50,
+                             tiempo_restante=int(rafaga[carga, i]))
+                for i in range(llegada.shape[1])
+            ]
+            simulador = SimuladorSIGET()
+            simulador.procesos = procesos
+            simulador.algoritmo_actual = algoritmo
+            simulador.ejecutar_simulacion()
+            
+            assert resultado.inicio[carga].tolist() == [p.tiempo_inicio for p in procesos]
+            assert resultado.fin[carga].tolist() == [p.tiempo_fin for p in procesos]
+            assert resultado.espera[carga].tolist() == [p.tiempo_espera for p in procesos]
+            assert resultado.respuesta[carga].tolist() == [p.tiempo_respuesta for p in procesos]
+            assert resultado.espera_llegada[carga].tolist() == [p.espera_desde_llegada for p in procesos]
+
+
+def test_lote_rechaza_politicas_expropiativas():
+    """Solo las políticas no expropiativas tienen forma cerrada por lotes"""
+    with pytest.raises(ValueError):
+        evaluar_lote([[0, 1]], [[3, 2]], algoritmo="SRTF")
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Pruebas del motor multinúcleo
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from multinucleo_siget import SimuladorMultinucleo
+from instrumentacion_siget import Instrumentacion
+from nucleo_siget import POLITICAS, CostoConmutacion, ProcesoSIGET, SimuladorSIGET, TipoProceso, generar_procesos_aleatorios
+
+
+def _resultados(simulador):
+    return [(p.id, p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in simulador.procesos]
+
+
+@pytest.mark.parametrize("algoritmo", list(POLITICAS))
+def test_un_nucleo_coincide_con_el_motor_original(algoritmo):
+    esperado = SimuladorSIGET()
+    esperado.procesos = generar_procesos_aleatorios(400, semilla=4)
+    multinucleo = SimuladorMultinucleo(nucleos=1)
+    multinucleo.procesos = generar_procesos_aleatorios(400, semilla=4)
+    for simulador in (esperado, multinucleo):
+        simulador.algoritmo_actual = algoritmo
+        simulador.quantum = 3
+        simulador.ejecutar_simulacion()
+    
+    assert _resultados(multinucleo) == _resultados(esperado)
+    assert multinucleo.despachos == esperado.despachos
+    assert multinucleo.tiempo_actual == esperado.tiempo_actual
+    assert multinucleo.migraciones == 0
+
+
+def test_fifo_reparte_rafagas_iguales_entre_los_nucleos():
+    simulador = SimuladorMultinucleo(nucleos=4)
+    simulador.procesos = [ProcesoSIGET(i, f"P{i}", TipoProceso.ANALISIS_DATOS, 0, 5, 1, 10,
+                                       tiempo_restante=5) for i in range(10)]
+    simulador.ejecutar_simulacion()
+    
+    assert simulador.makespan == 15
+    assert simulador.ocupado_por_nucleo == [15, 15, 10, 10]
+    assert sorted(p.tiempo_inicio for p in simulador.procesos) == [0] * 4 + [5] * 4 + [10] * 2
+
+
+@pytest.mark.parametrize("modo", ["compartida", "por_nucleo"])
+@pytest.mark.parametrize("algoritmo", ["FIFO", "Round Robin", "SRTF", "Prioridad Expropiativa"])
+def test_invariantes_con_varios_nucleos(modo, algoritmo):
+    simulador = SimuladorMultinucleo(nucleos=8, modo=modo)
+    simulador.procesos = generar_procesos_aleatorios(2000, semilla=9, carga=6)
+    simulador.algoritmo_actual = algoritmo
+    simulador.ejecutar_simulacion()
+    
+    procesos = simulador.procesos
+    trabajo = sum(p.tiempo_ejecucion for p in procesos)
+    assert simulador.cantidad_terminados == len(procesos)
+    assert sum(simulador.ocupado_por_nucleo) == trabajo
+    assert simulador.makespan == max(p.tiempo_fin for p in procesos)
+    assert simulador.makespan >= trabajo / 8
+    assert all(0 < u <= 1 for u in simulador.utilizacion_por_nucleo)
+    for p in procesos:
+        assert p.tiempo_fin - p.tiempo_irrupcion >= p.tiempo_ejecucion
+        assert p.tiempo_respuesta == p.tiempo_fin - p.tiempo_irrupcion
+
+
+def test_robo_de_trabajo_equilibra_colas_desparejas():
+    # Los procesos largos caen todos en la cola del núcleo 0
+    procesos = [ProcesoSIGET(i, f"P{i}", TipoProceso.MONITOREO_TRAFICO, 0, 20 if i % 2 == 0 else 1,
+                             1, 10) for i in range(40)]
+    for proceso in procesos:
+        proceso.tiempo_restante = proceso.tiempo_ejecucion
+    simulador = SimuladorMultinucleo(nucleos=2, modo="por_nucleo")
+    simulador.procesos = procesos
+    simulador.ejecutar_simulacion()
+    
+    assert simulador.robos > 0
+    assert simulador.makespan < 20 * 20
+    assert abs(simulador.ocupado_por_nucleo[0] - simulador.ocupado_por_nucleo[1]) <= 20
+    
+    simulador.algoritmo_actual = "Round Robin"
+    simulador.ejecutar_simulacion()
+    assert simulador.migraciones > 0
+
+
+def test_rechaza_costo_e_instrumentacion():
+    """Lo que el motor de N núcleos no modela no se ignora en silencio"""
+    simulador = SimuladorMultinucleo(nucleos=2)
+    simulador.crear_procesos_ejemplo()
+    simulador.costo_conmutacion = CostoConmutacion(5, 5)
+    with pytest.raises(NotImplementedError):
+        simulador.ejecutar_simulacion()
+    simulador.costo_conmutacion = None
+    simulador.instrumentacion = Instrumentacion()
+    with pytest.raises(NotImplementedError):
+        simulador.ejecutar_simulacion()
+
+
+@pytest.mark.parametrize("modo", ["compartida", "por_nucleo"])
+@pytest.mark.parametrize("algoritmo", ["FIFO", "Round Robin"])
+def test_ids_repetidos(modo, algoritmo):
+    """Los ids vienen de trazas del usuario y pueden repetirse"""
+    simuladores = []
+    for repetir in (False, True):
+        simulador = SimuladorMultinucleo(nucleos=4, modo=modo)
+        simulador.procesos = generar_procesos_aleatorios(50, semilla=3, carga=3)
+        if repetir:
+            for proceso in simulador.procesos[:3]:
+                proceso.id = 1
+        simulador.algoritmo_actual = algoritmo
+        simulador.ejecutar_simulacion()
+        simuladores.append(simulador)
+    unicos, repetidos = simuladores
+    
+    assert repetidos.cantidad_terminados == 50
+    assert ([(p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in repetidos.procesos] ==
+            [(p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in unicos.procesos])
+    assert repetidos.migraciones == unicos.migraciones
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Pruebas del motor de planificación del SIGET (sin interfaz gráfica)
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nucleo_siget import (
+    ProcesoSIGET, SimuladorSIGET, TipoProceso, EstadoProceso, AlgoritmoPlanificacion,
+    CostoConmutacion
+)
+
+# Resultados del bucle original (con time.sleep) sobre crear_procesos_ejemplo:
+# (id, tiempo_inicio, tiempo_fin, tiempo_espera, tiempo_respuesta) en orden de
+# terminación
+RESULTADOS_EJEMPLO = {
+    ("FIFO", 2): [(1, 0, 8, 0, 8), (2, 8, 13, 0, 11), (3, 13, 25, 5, 21),
+                  (4, 25, 31, 17, 25), (5, 31, 34, 23, 26), (6, 34, 41, 21, 31)],
+    ("Round Robin", 1): [(2, 3, 20, 13, 18), (1, 0, 24, 16, 24), (5, 12, 25, 14, 17),
+                         (4, 9, 32, 20, 26), (6, 15, 37, 20, 27), (3, 6, 41, 25, 37)],
+    ("Round Robin", 2): [(1, 0, 16, 8, 16), (2, 4, 23, 16, 21), (5, 16, 26, 15, 18),
+                         (4, 12, 32, 20, 26), (6, 20, 39, 22, 29), (3, 8, 41, 25, 37)],
+    ("Round Robin", 3): [(1, 0, 11, 3, 11), (2, 6, 19, 11, 17), (5, 19, 22, 10, 14),
+                         (4, 14, 31, 19, 25), (6, 22, 38, 20, 28), (3, 11, 41, 23, 37)],
+    ("Round Robin", 4): [(1, 0, 8, 0, 8), (5, 20, 23, 12, 15), (2, 8, 24, 15, 22),
+                         (4, 16, 34, 20, 28), (6, 24, 37, 18, 27), (3, 12, 41, 25, 37)],
+    ("Round Robin", 5): [(1, 0, 8, 0, 8), (2, 8, 13, 3, 11), (5, 23, 26, 15, 18),
+                         (4, 18, 37, 23, 31), (6, 26, 39, 19, 29), (3, 13, 41, 24, 37)],
+}
+
+
+def simular(algoritmo, quantum=2, procesos=None):
+    simulador = SimuladorSIGET()
+    if procesos is None:
+        simulador.crear_procesos_ejemplo()
+    else:
+        simulador.procesos = procesos
+    simulador.algoritmo_actual = algoritmo
+    simulador.quantum = quantum
+    simulador.ejecutar_simulacion()
+    return simulador
+
+
+# Diagramas de Gantt calculados a mano sobre crear_procesos_ejemplo:
+# P1(0,8,p1) P2(2,5,p2) P3(4,12,p3) P4(6,6,p2) P5(8,3,p1) P6(10,7,p4)
+# como (id, inicio, fin) de cada tramo de CPU
+GANTT_EJEMPLO = {
+    "SJF": [(1, 0, 8), (5, 8, 11), (2, 11, 16), (4, 16, 22), (6, 22, 29), (3, 29, 41)],
+    "Prioridad": [(1, 0, 8), (5, 8, 11), (2, 11, 16), (4, 16, 22), (3, 22, 34), (6, 34, 41)],
+    # P2 (5) desaloja a P1 (6) en t=2; P5 (3) desaloja a P1 (5) en t=8
+    "SRTF": [(1, 0, 2), (2, 2, 7), (1, 7, 8), (5, 8, 11), (1, 11, 16), (4, 16, 22),
+             (6, 22, 29), (3, 29, 41)],
+    # P5 llega en t=8 con la misma prioridad que P1, que termina sin ser desalojado
+    "Prioridad Expropiativa": [(1, 0, 8), (5, 8, 11), (2, 11, 16), (4, 16, 22),
+                               (3, 22, 34), (6, 34, 41)],
+}
+
+
+def simular_gantt(algoritmo, quantum=2, procesos=None):
+    """Reconstruye el Gantt observando qué proceso consumió CPU en cada paso"""
+    simulador = SimuladorSIGET()
+    if procesos is None:
+        simulador.crear_procesos_ejemplo()
+    else:
+        simulador.procesos = procesos
+    simulador.algoritmo_actual = algoritmo
+    simulador.quantum = quantum
+    restante = {}
+    gantt = []
+    
+    def al_actualizar():
+        for proceso in simulador.procesos:
+            consumido = restante.get(proceso.id, proceso.tiempo_ejecucion) - proceso.tiempo_restante
+            restante[proceso.id] = proceso.tiempo_restante
+            if consumido:
+                inicio = simulador.tiempo_actual - consumido
+                if gantt and gantt[-1][0] == proceso.id and gantt[-1][2] == inicio:
+                    gantt[-1] = (proceso.id, gantt[-1][1], simulador.tiempo_actual)
+                else:
+                    gantt.append((proceso.id, inicio, simulador.tiempo_actual))
+    
+    simulador.ejecutar_simulacion(al_actualizar)
+    return gantt
+
+
+def test_resultados_coinciden_con_bucle_original():
+    """El motor por eventos reproduce exactamente el bucle original"""
+    for (algoritmo, quantum), esperado in RESULTADOS_EJEMPLO.items():
+        simulador = simular(algoritmo, quantum)
+        obtenido = [(p.id, p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera, p.tiempo_respuesta)
+                    for p in simulador.procesos_terminados]
+        assert obtenido == esperado, (algoritmo, quantum)
+        assert simulador.tiempo_actual == 41
+        assert all(p.estado == EstadoProceso.TERMINADO for p in simulador.procesos)
+
+
+def test_politicas_eligen_sobre_la_cola_de_listos_vigente():
+    """SJF, Prioridad, SRTF y Prioridad Expropiativa contra Gantt calculados a mano"""
+    for algoritmo, esperado in GANTT_EJEMPLO.items():
+        assert simular_gantt(algoritmo) == esperado, algoritmo
+
+
+def test_prioridad_expropiativa_desaloja_al_llegar():
+    """Una llegada de mayor prioridad interrumpe al proceso en ejecución"""
+    procesos = [
+        ProcesoSIGET(1, "A", TipoProceso.ANALISIS_DATOS, 0, 5, 3, 10, tiempo_restante=5),
+        ProcesoSIGET(2, "B", TipoProceso.MONITOREO_TRAFICO, 1, 2, 1, 10, tiempo_restante=2),
+        ProcesoSIGET(3, "C", TipoProceso.GESTION_SEMAFOROS, 2, 3, 2, 10, tiempo_restante=3),
+    ]
+    gantt = simular_gantt("Prioridad Expropiativa", procesos=procesos)
+    assert gantt == [(1, 0, 1), (2, 1, 3), (3, 3, 6), (1, 6, 10)]
+
+
+def test_cpu_ociosa_salta_a_la_siguiente_llegada():
+    """Un hueco entre llegadas no bloquea el motor"""
+    procesos = [
+        ProcesoSIGET(1, "A", TipoProceso.MONITOREO_TRAFICO, 0, 2, 1, 10),
+        ProcesoSIGET(2, "B", TipoProceso.ANALISIS_DATOS, 100, 3, 1, 10),
+    ]
+    for proceso in procesos:
+        proceso.tiempo_restante = proceso.tiempo_ejecucion
+    simulador = simular("FIFO", procesos=procesos)
+    assert simulador.tiempo_actual == 103
+    assert procesos[1].tiempo_inicio == 100
+
+
+def test_espera_en_vivo_bajo_demanda():
+    """Durante la corrida la espera se calcula al pedirla, sin recorrer la cola"""
+    simulador = SimuladorSIGET()
+    simulador.crear_procesos_ejemplo()
+    observado = {}
+    
+    def al_actualizar():
+        if simulador.ejecutando and simulador.tiempo_actual == 13:
+            observado.update((p.id, simulador.tiempo_espera_actual(p)) for p in simulador.procesos)
+    
+    simulador.ejecutar_simulacion(al_actualizar)
+    # FIFO: P3, P4 y P5 esperan en la cola desde t=8; P6 aún no fue admitido
+    assert observado == {1: 0, 2: 0, 3: 5, 4: 5, 5: 5, 6: 0}
+
+
+def test_constructor_conserva_los_campos_originales():
+    """``tiempo_espera`` sigue siendo un campo: por nombre, por posición y en asdict"""
+    proceso = ProcesoSIGET(1, "A", TipoProceso.ANALISIS_DATOS, 0, 5, 3, 10, tiempo_espera=3)
+    assert proceso.tiempo_espera == proceso.espera_en(50) == 3
+    posicional = ProcesoSIGET(1, "A", TipoProceso.ANALISIS_DATOS, 0, 5, 3, 10, EstadoProceso.LISTO, 5, 3, 8)
+    assert (posicional.tiempo_espera, posicional.tiempo_respuesta) == (3, 8)
+    assert asdict(posicional)["tiempo_espera"] == 3 and "tiempo_espera=3" in repr(posicional)
+
+
+def test_espera_desde_llegada():
+    """La espera desde la llegada no depende de cuándo decide la política"""
+    simulador = simular("FIFO")
+    p2 = simulador.procesos[1]
+    assert (p2.tiempo_espera, p2.espera_desde_llegada) == (0, 6)
+    for algoritmo in ("FIFO", "SRTF", "Prioridad Expropiativa"):
+        simulador = simular(algoritmo)
+        for p in simulador.procesos:
+            assert p.espera_desde_llegada == p.tiempo_fin - p.tiempo_irrupcion - p.tiempo_ejecucion
+            if algoritmo != "FIFO":
+                assert p.espera_desde_llegada == p.tiempo_espera
+    assert ProcesoSIGET(1, "A", TipoProceso.ANALISIS_DATOS, 0, 5, 3, 10).espera_desde_llegada is None
+
+
+def test_costo_de_conmutacion():
+    """Cada cambio de contexto consume tiempo de CPU y baja la eficiencia"""
+    simulador = SimuladorSIGET()
+    simulador.crear_procesos_ejemplo()
+    simulador.costo_conmutacion = CostoConmutacion(cambio_contexto=1)
+    simulador.ejecutar_simulacion()
+    assert (simulador.cambios_contexto, simulador.tiempo_sobrecarga, simulador.tiempo_actual) == (6, 6, 47)
+    assert simulador.eficiencia_cpu == 41 / 47
+    # La conmutación cuenta como espera del proceso despachado
+    assert [p.tiempo_inicio for p in simulador.procesos] == [1, 10, 16, 29, 36, 40]
+    assert simulador.procesos[1].tiempo_espera == 1
+    
+    eficiencias = []
+    for quantum in (1, 2, 5):
+        simulador.algoritmo_actual = "Round Robin"
+        simulador.quantum = quantum
+        simulador.costo_conmutacion = CostoConmutacion(
+            despacho=1, por_tipo={TipoProceso.ANALISIS_DATOS: 3}, cambio_contexto=2)
+        simulador.ejecutar_simulacion()
+        assert simulador.tiempo_util == 41
+        assert simulador.tiempo_actual == 41 + simulador.tiempo_sobrecarga
+        assert simulador.despachos + 2 * simulador.cambios_contexto <= simulador.tiempo_sobrecarga
+        assert simulador.tiempo_sobrecarga <= simulador.despachos + 3 * simulador.cambios_contexto
+        eficiencias.append(simulador.eficiencia_cpu)
+    assert eficiencias == sorted(eficiencias)
+
+
+def test_colas_de_listos_por_algoritmo():
+    """Cada algoritmo usa su estructura: deque para FIFO/RR y montículo para SJF/Prioridad"""
+    simulador = SimuladorSIGET()
+    simulador.crear_procesos_ejemplo()
+    
+    cola = AlgoritmoPlanificacion.crear_cola("SJF")
+    for proceso in simulador.procesos:
+        cola.agregar(proceso)
+    assert [cola.extraer().tiempo_ejecucion for _ in range(len(cola))] == [3, 5, 6, 7, 8, 12]
+    
+    cola = AlgoritmoPlanificacion.crear_cola("Round Robin")
+    for proceso in simulador.procesos:
+        cola.agregar(proceso)
+    assert [cola.extraer().id for _ in range(len(cola))] == [1, 2, 3, 4, 5, 6]
+
+
+def test_nucleo_no_importa_tkinter():
+    """El motor se puede usar en servidores sin pantalla"""
+    codigo = "import sys, nucleo_siget; sys.exit('tkinter' in sys.modules)"
+    resultado = subprocess.run([sys.executable, "-c", codigo],
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert resultado.returncode == 0
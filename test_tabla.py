@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la tabla de procesos en columnas
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nucleo_siget import EstadoProceso, SimuladorSIGET, generar_procesos_aleatorios
+from tabla_siget import TablaProcesos
+
+
+def test_motor_sobre_vistas_igual_que_sobre_dataclasses():
+    """Las vistas con __slots__ sirven al motor igual que ProcesoSIGET"""
+    for algoritmo in ("Round Robin", "SRTF"):
+        tabla = TablaProcesos.desde_procesos(generar_procesos_aleatorios(500, 4))
+        con_vistas = SimuladorSIGET()
+        con_vistas.procesos = tabla.vistas()
+        con_vistas.algoritmo_actual = algoritmo
+        con_vistas.ejecutar_simulacion()
+        
+        con_objetos = SimuladorSIGET()
+        con_objetos.crear_procesos_aleatorios(500, 4)
+        con_objetos.algoritmo_actual = algoritmo
+        con_objetos.ejecutar_simulacion()
+        
+        assert ([(p.id, p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in con_vistas.procesos_terminados]
+                == [(p.id, p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in con_objetos.procesos_terminados])
+        assert tabla[0].estado == EstadoProceso.TERMINADO
+
+
+def test_tabla_ocupa_bytes_fijos_por_proceso():
+    """Las columnas ocupan 83 bytes por proceso"""
+    tabla = TablaProcesos.desde_procesos(generar_procesos_aleatorios(1000))
+    assert tabla.nbytes == 83 * len(tabla)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Pruebas del almacén de filas de la tabla virtualizada
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from canal_siget import fila_de_proceso
+from nucleo_siget import EstadoProceso, SimuladorSIGET, TipoProceso
+from tabla_virtual_siget import AlmacenFilas
+
+
+def _almacen(cantidad=1000):
+    simulador = SimuladorSIGET()
+    simulador.crear_procesos_aleatorios(cantidad, semilla=3)
+    almacen = AlmacenFilas(intervalo_reindexado=0)
+    almacen.actualizar(fila_de_proceso(p) for p in simulador.procesos)
+    almacen.reindexar()
+    return simulador, almacen
+
+
+def test_pagina_solo_la_ventana_pedida():
+    simulador, almacen = _almacen()
+    assert len(almacen) == len(simulador.procesos)
+    pagina = almacen.pagina(100, 18)
+    assert [fila[0] for fila in pagina] == [p.id for p in simulador.procesos[100:118]]
+    assert len(almacen.pagina(len(almacen) - 5, 18)) == 5
+
+
+def test_ordenar_y_filtrar_sobre_el_indice():
+    simulador, almacen = _almacen()
+    almacen.ordenar(4, descendente=True)
+    almacen.reindexar()
+    ejecuciones = [fila[4] for fila in almacen.pagina(0, len(almacen))]
+    assert ejecuciones == sorted(ejecuciones, reverse=True)
+    
+    almacen.filtrar(tipo=TipoProceso.ANALISIS_DATOS.value, prioridad=2)
+    almacen.reindexar()
+    esperados = [p for p in simulador.procesos
+                 if p.tipo == TipoProceso.ANALISIS_DATOS and p.prioridad_alerta == 2]
+    assert len(almacen) == len(esperados)
+    assert all(fila[2] == TipoProceso.ANALISIS_DATOS.value and fila[5] == 2
+               for fila in almacen.pagina(0, len(almacen)))
+
+
+def test_cambio_de_estado_reindexa_el_filtro():
+    simulador, almacen = _almacen(50)
+    almacen.filtrar(estado=EstadoProceso.TERMINADO)
+    almacen.reindexar()
+    assert len(almacen) == 0
+    
+    proceso = simulador.procesos[7]
+    proceso.estado = EstadoProceso.TERMINADO
+    almacen.actualizar([fila_de_proceso(proceso)])
+    almacen.reindexar()
+    assert [fila[0] for fila in almacen.pagina(0, 10)] == [proceso.id]
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Pruebas de la reproducción en tiempo real escalado
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from nucleo_siget import POLITICAS, ProcesoSIGET, SimuladorSIGET, TipoProceso, generar_procesos_aleatorios
+from tiempo_real_siget import ReproductorTiempoReal, servir_llegadas
+
+
+def _ejemplo(algoritmo):
+    simulador = SimuladorSIGET()
+    simulador.crear_procesos_ejemplo()
+    simulador.algoritmo_actual = algoritmo
+    return simulador
+
+
+def _terminados(simulador):
+    return [(p.id, p.tiempo_inicio, p.tiempo_fin, p.tiempo_espera) for p in simulador.procesos_terminados]
+
+
+def test_sigue_el_reloj_escalado():
+    for algoritmo in POLITICAS:
+        referencia = _ejemplo(algoritmo)
+        referencia.ejecutar_simulacion()
+        simulador = _ejemplo(algoritmo)
+        publicados = []
+        reproductor = ReproductorTiempoReal(
+            simulador, velocidad=500, al_publicar=lambda: publicados.append((simulador.tiempo_actual, time.monotonic())))
+        asyncio.run(reproductor.ejecutar())
+        assert _terminados(simulador) == _terminados(referencia), algoritmo
+
+        # Cada estado se publica cuando vence, sin acumular desvío
+        tiempos = [tiempo for tiempo, _ in publicados]
+        assert tiempos == sorted(tiempos) and tiempos[-1] == referencia.tiempo_actual
+        inicio = publicados[0][1] - publicados[0][0] / 500
+        assert all(real >= inicio + tiempo / 500 - 0.002 for tiempo, real in publicados)
+        assert publicados[-1][1] - (inicio + tiempos[-1] / 500) < 0.05
+
+
+def test_recupera_atraso_en_lotes():
+    referencia = SimuladorSIGET()
+    referencia.procesos = generar_procesos_aleatorios(3000, 2)
+    referencia.ejecutar_simulacion()
+    simulador = SimuladorSIGET()
+    simulador.procesos = generar_procesos_aleatorios(3000, 2)
+
+    # Un reloj que salta medio recorrido hacia adelante, como tras un bloqueo del bucle
+    salto = [0.0]
+    reproductor = ReproductorTiempoReal(simulador, velocidad=20000, max_lote=500,
+                                        reloj=lambda: time.monotonic() + salto[0])
+    reproductor.al_publicar = lambda: salto.__setitem__(0, 0.5 * referencia.tiempo_actual / 20000)
+    asyncio.run(reproductor.ejecutar())
+    assert reproductor.lotes_atrasados > 0
+    assert reproductor.atraso_maximo > 0.1
+    assert _terminados(simulador) == _terminados(referencia)
+
+
+def test_llegada_en_vivo_se_sella_con_el_reloj():
+    async def escenario():
+        simulador = SimuladorSIGET()
+        simulador.procesos = [ProcesoSIGET(1, "Larga", TipoProceso.ANALISIS_DATOS, 0, 1000, 3, 10)]
+        llegadas = asyncio.Queue()
+        reproductor = ReproductorTiempoReal(simulador, velocidad=2000)
+        tarea = asyncio.ensure_future(reproductor.ejecutar(llegadas))
+        await asyncio.sleep(0.1)  # t≈200, a mitad de la única rebanada
+        await llegadas.put(ProcesoSIGET(2, "Incidente", TipoProceso.MONITOREO_TRAFICO, 0, 5, 1, 10))
+        await llegadas.put(None)
+        await tarea
+        return simulador
+
+    simulador = asyncio.run(escenario())
+    vivo = next(p for p in simulador.procesos_terminados if p.id == 2)
+    # Se sella al recibirla, no al fin de la rebanada que el motor ya había simulado
+    assert 100 <= vivo.tiempo_irrupcion < 600
+    assert vivo.tiempo_inicio == 1000 and vivo.tiempo_fin == 1005
+    assert vivo.tiempo_respuesta == 1005 - vivo.tiempo_irrupcion
+
+
+def test_cambiar_velocidad_sin_saltos():
+    reproductor = ReproductorTiempoReal(SimuladorSIGET(), velocidad=60)
+    reproductor._anclar(100)
+    antes = reproductor.reloj_simulado()
+    reproductor.cambiar_velocidad(600)
+    assert abs(reproductor.reloj_simulado() - antes) < 1
+
+
+def test_llegadas_en_vivo_por_cola_y_socket():
+    async def escenario():
+        simulador = _ejemplo("SRTF")
+        llegadas = asyncio.Queue()
+        reproductor = ReproductorTiempoReal(simulador, velocidad=400)
+        servidor = await servir_llegadas(llegadas)
+        puerto = servidor.sockets[0].getsockname()[1]
+        tarea = asyncio.ensure_future(reproductor.ejecutar(llegadas))
+
+        await llegadas.put(ProcesoSIGET(50, "Incidente", TipoProceso.MONITOREO_TRAFICO, 0, 3, 1, 10))
+        await asyncio.sleep(0.2)  # El ejemplo termina en t=41; el motor queda esperando llegadas
+        lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+        escritor.write(b"no es json\n")
+        escritor.write((json.dumps({"id": 51, "tipo": "GESTION_SEMAFOROS", "tiempo_ejecucion": 4,
+                                    "prioridad_alerta": 2, "tamaño_datos": 5}) + "\n").encode())
+        await escritor.drain()
+        assert (await lector.readline()).startswith(b"error")
+        await asyncio.sleep(0.1)
+        escritor.close()
+        await llegadas.put(None)
+        await tarea
+        servidor.close()
+        await servidor.wait_closed()
+        return simulador, reproductor
+
+    simulador, reproductor = asyncio.run(escenario())
+    assert reproductor.inyectados == 2
+    vivos = {p.id: p for p in simulador.procesos_terminados if p.id >= 50}
+    assert set(vivos) == {50, 51}
+    assert vivos[51].tiempo_irrupcion > 41
+    assert vivos[51].tiempo_fin == vivos[51].tiempo_irrupcion + 4
+    assert simulador.cantidad_terminados == 8
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Pruebas del formato binario de trazas
+"""
+
+import os
+import struct
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from carga_siget import escribir_csv
+from nucleo_siget import SimuladorSIGET, generar_procesos_aleatorios
+from traza_siget import TrazaBinaria, VERSION, convertir_traza
+
+
+def test_conversion_y_replay_sin_copias(tmp_path):
+    """CSV → binario → motor da los mismos resultados que la lista original"""
+    procesos = generar_procesos_aleatorios(300, 9)
+    escribir_csv(tmp_path / "traza.csv", procesos)
+    assert convertir_traza(tmp_path / "traza.csv", tmp_path / "traza.bin") == 300
+    assert os.path.getsize(tmp_path / "traza.bin") == 32 + 34 * 300
+    
+    referencia = SimuladorSIGET()
+    referencia.procesos = procesos
+    referencia.algoritmo_actual = "Round Robin"
+    referencia.ejecutar_simulacion()
+    esperado = [(p.id, p.tiempo_fin, p.tiempo_espera) for p in referencia.procesos_terminados]
+    
+    with TrazaBinaria(tmp_path / "traza.bin") as traza:
+        assert list(traza.columnas["irrupcion"]) == [p.tiempo_irrupcion for p in procesos]
+        
+        simulador = SimuladorSIGET()
+        simulador.procesos = traza.tabla().vistas()
+        simulador.algoritmo_actual = "Round Robin"
+        simulador.ejecutar_simulacion()
+        assert [(p.id, p.tiempo_fin, p.tiempo_espera) for p in simulador.procesos_terminados] == esperado
+        
+        terminados = []
+        simulador.ejecutar_flujo(traza.procesos(),
+                                 al_terminar=lambda p: terminados.append((p.id, p.tiempo_fin, p.tiempo_espera)))
+        assert terminados == esperado
+
+
+def test_columnas_numpy_sobre_el_mapa(tmp_path):
+    """NumPy lee las columnas directamente del archivo mapeado"""
+    np = pytest.importorskip("numpy")
+    procesos = generar_procesos_aleatorios(50)
+    escribir_csv(tmp_path / "traza.csv", procesos)
+    convertir_traza(tmp_path / "traza.csv", tmp_path / "traza.bin")
+    with TrazaBinaria(tmp_path / "traza.bin") as traza:
+        columnas = traza.columnas_numpy()
+        assert columnas["ejecucion"].sum() == sum(p.tiempo_ejecucion for p in procesos)
+        assert not columnas["id"].flags.writeable
+        del columnas
+
+
+def test_version_incompatible(tmp_path):
+    """Un archivo de otra versión se rechaza"""
+    escribir_csv(tmp_path / "traza.csv", generar_procesos_aleatorios(3))
+    convertir_traza(tmp_path / "traza.csv", tmp_path / "traza.bin")
+    with open(tmp_path / "traza.bin", "r+b") as archivo:
+        archivo.seek(8)
+        archivo.write(struct.pack("<H", VERSION + 1))
+    with pytest.raises(ValueError):
+        TrazaBinaria(tmp_path / "traza.bin")
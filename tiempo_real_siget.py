@@ -0,0 +1,197 @@
+"""
+Reproducción del SIGET en tiempo real escalado, sobre asyncio.
+
+``ReproductorTiempoReal`` avanza el motor con ``ejecutar_hasta`` para que
+el reloj simulado siga a un reloj monótono multiplicado por ``velocidad``
+(unidades de tiempo simulado por segundo real: con unidades de un segundo,
+60 es 60×). Cada punto de decisión se publica cuando el reloj real llega a
+su instante. Los vencimientos se calculan desde un origen fijo y no como
+suma de esperas, así que lo que se duerme de más en un paso no se acumula.
+
+Si la simulación queda atrasada (el bucle estuvo ocupado o el motor no da
+abasto), se pone al día en lotes de a lo sumo ``max_lote`` unidades,
+cediendo el bucle de eventos entre lotes. Las llegadas en vivo (p. ej. el
+feed de los sensores) se leen de una ``asyncio.Queue``, y
+``servir_llegadas`` ofrece un socket local que acepta una por línea en
+JSON. Cada llegada se sella con el reloj simulado del momento en que se
+recibe, pero el motor la admite recién en el próximo punto de decisión:
+``ejecutar_hasta`` avanza rebanadas enteras, así que el estado del motor
+puede ir hasta una rebanada por delante del reloj y una llegada en vivo no
+desaloja ni se despacha antes del fin de la rebanada en curso (la espera
+desde la llegada sí la cuenta, ver ``ProcesoSIGET.espera_desde_llegada``).
+Para detener la reproducción se cancela la tarea.
+"""
+
+import asyncio
+import json
+import time
+from typing import Callable, Optional
+
+from carga_siget import proceso_desde_registro
+from incremental_siget import PuntoControl
+from nucleo_siget import POLITICAS, ProcesoSIGET, SimuladorSIGET
+
+# Segundos de simulación real que como máximo se recuperan por lote
+LOTE_SEGUNDOS = 0.1
+
+
+class ReproductorTiempoReal:
+    """Ejecuta un ``SimuladorSIGET`` al ritmo de un reloj monótono escalado"""
+
+    def __init__(self, simulador: SimuladorSIGET, velocidad: float = 1.0, max_lote: Optional[int] = None,
+                 al_publicar: Optional[Callable[[], None]] = None, reloj: Callable[[], float] = time.monotonic):
+        if velocidad <= 0:
+            raise ValueError("La velocidad debe ser positiva")
+        self.simulador = simulador
+        self.velocidad = velocidad
+        # Unidades simuladas por lote al recuperar atraso (por defecto, LOTE_SEGUNDOS de reloj real)
+        self.max_lote = max_lote
+        self.al_publicar = al_publicar
+        self.reloj = reloj
+        self._origen_real = 0.0
+        self._origen_simulado = 0
+        self.lotes = 0
+        self.lotes_atrasados = 0
+        self.atraso_maximo = 0.0  # Segundos reales
+        self.inyectados = 0
+
+    def _anclar(self, tiempo_simulado: float):
+        self._origen_real = self.reloj()
+        self._origen_simulado = tiempo_simulado
+
+    def reloj_simulado(self) -> float:
+        """Instante simulado que corresponde al reloj real actual"""
+        return self._origen_simulado + (self.reloj() - self._origen_real) * self.velocidad
+
+    def vencimiento(self, tiempo_simulado: float) -> float:
+        """Instante del reloj real en que vence ``tiempo_simulado``"""
+        return self._origen_real + (tiempo_simulado - self._origen_simulado) / self.velocidad
+
+    def cambiar_velocidad(self, velocidad: float):
+        """Cambia la velocidad sin saltos en el reloj simulado (se aplica desde el próximo paso)"""
+        if velocidad <= 0:
+            raise ValueError("La velocidad debe ser positiva")
+        self._anclar(self.reloj_simulado())
+        self.velocidad = velocidad
+
+    @property
+    def lote(self) -> int:
+        return self.max_lote or max(1, int(self.velocidad * LOTE_SEGUNDOS))
+
+    def inyectar(self, proceso: ProcesoSIGET):
+        """Agrega una llegada en vivo, sellada con el reloj simulado actual.
+
+        Si el motor ya simuló más allá de ese instante, el proceso se admite
+        en su próximo punto de decisión (``simulador.tiempo_actual``).
+        """
+        simulador = self.simulador
+        proceso.tiempo_irrupcion = int(self.reloj_simulado())
+        proceso.tiempo_restante = proceso.tiempo_ejecucion
+        simulador.procesos.append(proceso)
+        if simulador.pausa is None:
+            # El motor había vaciado su trabajo: se reanuda con la cola vacía
+            cola = POLITICAS[simulador.algoritmo_actual].crear_cola()
+            simulador.pausa = PuntoControl(simulador.tiempo_actual, None, None, cola.estado(), (
+                simulador.despachos, simulador.cantidad_admitidos, simulador.cantidad_terminados,
+                simulador.cambios_contexto, simulador.tiempo_sobrecarga, simulador.tiempo_util), ())
+        self.inyectados += 1
+
+    def _publicar(self):
+        if self.al_publicar is not None:
+            self.al_publicar()
+
+    async def _esperar(self, hasta: Optional[float], llegadas: Optional[asyncio.Queue]) -> bool:
+        """Duerme hasta el instante real ``hasta`` (None: sin límite) o hasta una llegada.
+
+        Devuelve False si la fuente se cerró.
+        """
+        espera = None if hasta is None else max(hasta - self.reloj(), 0)
+        if llegadas is None:
+            await asyncio.sleep(espera)
+            return True
+        try:
+            proceso = await asyncio.wait_for(llegadas.get(), espera)
+        except asyncio.TimeoutError:
+            return True
+        if proceso is None:
+            return False
+        self.inyectar(proceso)
+        return True
+
+    def _recibir(self, llegadas: asyncio.Queue) -> bool:
+        """Inyecta las llegadas ya encoladas; False si la fuente se cerró (``None``)"""
+        while not llegadas.empty():
+            proceso = llegadas.get_nowait()
+            if proceso is None:
+                return False
+            self.inyectar(proceso)
+        return True
+
+    async def ejecutar(self, llegadas: Optional[asyncio.Queue] = None):
+        """Reproduce hasta que no queda trabajo y la fuente en vivo (si hay) se cerró con ``None``.
+
+        Si el simulador está en pausa (p. ej. restaurado de una captura de
+        ``estado_siget``), la reproducción sigue desde su reloj.
+        """
+        simulador = self.simulador
+        if simulador.pausa is None:
+            simulador.ejecutar_hasta(0)
+        self._anclar(simulador.tiempo_actual)
+        abierta = llegadas is not None
+
+        while True:
+            if abierta:
+                abierta = self._recibir(llegadas)
+            tiempo = simulador.tiempo_actual
+            if tiempo > self.reloj_simulado():
+                # El estado del motor está adelantado: se publica cuando vence
+                if abierta:
+                    abierta = await self._esperar(self.vencimiento(tiempo), llegadas)
+                else:
+                    await self._esperar(self.vencimiento(tiempo), None)
+                if self.reloj_simulado() < tiempo:
+                    continue  # Llegó un proceso antes del vencimiento
+            self._publicar()
+            if simulador.pausa is None:
+                if not abierta:
+                    break
+                # Sin trabajo: esperar la próxima llegada en vivo
+                abierta = await self._esperar(None, llegadas)
+                continue
+
+            limite = max(int(self.reloj_simulado()), tiempo + 1)
+            if limite - tiempo > self.lote:
+                limite = tiempo + self.lote
+                self.lotes_atrasados += 1
+            self.atraso_maximo = max(self.atraso_maximo, self.reloj() - self.vencimiento(tiempo))
+            simulador.ejecutar_hasta(limite)
+            self.lotes += 1
+            # Ceder el bucle entre lotes, aun si hay atraso
+            await asyncio.sleep(0)
+
+
+async def servir_llegadas(llegadas: asyncio.Queue, host: str = "127.0.0.1", puerto: int = 0):
+    """Servidor local que encola un proceso por línea JSON (claves de ``carga_siget``).
+
+    ``tiempo_irrupcion`` puede omitirse: el reproductor sella cada llegada
+    al recibirla. Las líneas inválidas se responden con un error y se
+    descartan. Devuelve el ``asyncio.Server`` (el puerto elegido está en
+    ``server.sockets[0].getsockname()``).
+    """
+    async def atender(lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        try:
+            async for linea in lector:
+                if not linea.strip():
+                    continue
+                try:
+                    registro = json.loads(linea)
+                    registro.setdefault("tiempo_irrupcion", 0)
+                    proceso = proceso_desde_registro(registro)
+                except (ValueError, KeyError, TypeError) as error:
+                    escritor.write(f"error: {error}\n".encode("utf-8"))
+                    continue
+                await llegadas.put(proceso)
+        finally:
+            escritor.close()
+
+    return await asyncio.start_server(atender, host, puerto)
@@ -0,0 +1,211 @@
+"""
+Formato binario de trazas SIGET y lector sobre ``mmap`` sin copias.
+
+Disposición (little-endian):
+
+    encabezado (32 bytes)
+        magia        8s   b"SIGETBIN"
+        versión      u16  VERSION
+        banderas     u16  bit 0: llegadas ordenadas por tiempo_irrupcion
+        reservado    u32
+        cantidad     u64  número de procesos n
+        reservado    u64
+    columnas, contiguas y en este orden:
+        id, tiempo_irrupcion, tiempo_ejecucion, tamaño_datos   int64 × n cada una
+        tipo (posición en TipoProceso), prioridad_alerta        int8 × n cada una
+
+Son 34 bytes por proceso. Los nombres no se guardan (se derivan del id).
+Cualquier cambio de disposición o de los códigos de tipo debe subir
+``VERSION``.
+"""
+
+import mmap
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Iterable, Iterator
+
+from nucleo_siget import ProcesoSIGET, TipoProceso
+from tabla_siget import TablaProcesos
+
+MAGIA = b"SIGETBIN"
+VERSION = 1
+ENCABEZADO = struct.Struct("<8sHHIQQ")
+BANDERA_ORDENADA = 0x1
+
+# (nombre de columna en TablaProcesos, código de array)
+COLUMNAS_TRAZA = (
+    ("id", "q"),
+    ("irrupcion", "q"),
+    ("ejecucion", "q"),
+    ("tamaño", "q"),
+    ("tipo", "b"),
+    ("prioridad", "b"),
+)
+
+_TIPOS = tuple(TipoProceso)
+_CODIGO_TIPO = {tipo: codigo for codigo, tipo in enumerate(_TIPOS)}
+_FILAS_POR_BLOQUE = 65536
+
+
+class EscritorTrazaBinaria:
+    """Escribe una traza binaria en streaming, con memoria acotada.
+
+    Cada columna se acumula en bloques que se vuelcan a un archivo temporal;
+    al cerrar se escribe el encabezado y se concatenan las columnas.
+    """
+    
+    def __init__(self, ruta):
+        if sys.byteorder != "little":
+            raise OSError("El formato binario SIGET requiere una máquina little-endian")
+        self._ruta = ruta
+        self._temporales = [tempfile.TemporaryFile() for _ in COLUMNAS_TRAZA]
+        self._bloques = [array(codigo) for _, codigo in COLUMNAS_TRAZA]
+        self._cantidad = 0
+        self._ultima_llegada = None
+        self._ordenada = True
+    
+    def agregar(self, id_: int, tipo: TipoProceso, tiempo_irrupcion: int, tiempo_ejecucion: int,
+                prioridad_alerta: int, tamaño_datos: int):
+        """Agrega un proceso al final de la traza"""
+        if self._ultima_llegada is not None and tiempo_irrupcion < self._ultima_llegada:
+            self._ordenada = False
+        self._ultima_llegada = tiempo_irrupcion
+        id_col, irrupcion, ejecucion, tamaño, tipo_col, prioridad = self._bloques
+        id_col.append(id_)
+        irrupcion.append(tiempo_irrupcion)
+        ejecucion.append(tiempo_ejecucion)
+        tamaño.append(tamaño_datos)
+        tipo_col.append(_CODIGO_TIPO[tipo])
+        prioridad.append(prioridad_alerta)
+        self._cantidad += 1
+        if len(id_col) == _FILAS_POR_BLOQUE:
+            self._volcar()
+    
+    def agregar_proceso(self, proceso: ProcesoSIGET):
+        self.agregar(proceso.id, proceso.tipo, proceso.tiempo_irrupcion, proceso.tiempo_ejecucion,
+                     proceso.prioridad_alerta, proceso.tamaño_datos)
+    
+    def _volcar(self):
+        for temporal, bloque in zip(self._temporales, self._bloques):
+            bloque.tofile(temporal)
+            del bloque[:]
+    
+    def cerrar(self):
+        """Escribe el archivo final y libera los temporales"""
+        self._volcar()
+        banderas = BANDERA_ORDENADA if self._ordenada else 0
+        with open(self._ruta, "wb") as archivo:
+            archivo.write(ENCABEZADO.pack(MAGIA, VERSION, banderas, 0, self._cantidad, 0))
+            for temporal in self._temporales:
+                temporal.seek(0)
+                shutil.copyfileobj(temporal, archivo, 1 << 20)
+                temporal.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, tipo, valor, traza):
+        if tipo is None:
+            self.cerrar()
+        else:
+            for temporal in self._temporales:
+                temporal.close()
+
+
+def escribir_traza_binaria(ruta, procesos: Iterable[ProcesoSIGET]) -> int:
+    """Guarda procesos (por ejemplo, la salida de ``carga_siget.leer_traza``) y devuelve cuántos"""
+    with EscritorTrazaBinaria(ruta) as escritor:
+        for proceso in procesos:
+            escritor.agregar_proceso(proceso)
+    return escritor._cantidad
+
+
+def convertir_traza(origen, destino, ventana: int = 0) -> int:
+    """Convierte una traza CSV/JSONL al formato binario"""
+    from carga_siget import leer_traza
+    return escribir_traza_binaria(destino, leer_traza(origen, ventana))
+
+
+class TrazaBinaria:
+    """Traza binaria abierta con ``mmap``: las columnas se leen sin copiar ni crear objetos"""
+    
+    def __init__(self, ruta):
+        self._archivo = open(ruta, "rb")
+        try:
+            self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # archivo vacío
+            self._archivo.close()
+            raise ValueError(f"{ruta} no es una traza binaria SIGET")
+        if len(self._mapa) < ENCABEZADO.size:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es una traza binaria SIGET")
+        magia, version, banderas, _, cantidad, _ = ENCABEZADO.unpack_from(self._mapa)
+        if magia != MAGIA:
+            self.cerrar()
+            raise ValueError(f"{ruta} no es una traza binaria SIGET")
+        if version != VERSION:
+            self.cerrar()
+            raise ValueError(f"Versión de traza {version} no soportada (se esperaba {VERSION})")
+        self.cantidad = cantidad
+        self.ordenada = bool(banderas & BANDERA_ORDENADA)
+        
+        vista = memoryview(self._mapa)
+        self._desplazamientos = {}
+        self.columnas = {}
+        desplazamiento = ENCABEZADO.size
+        for nombre, codigo in COLUMNAS_TRAZA:
+            tamaño = cantidad * array(codigo).itemsize
+            if desplazamiento + tamaño > len(self._mapa):
+                self.cerrar()
+                raise ValueError(f"{ruta} está truncada")
+            self._desplazamientos[nombre] = (desplazamiento, codigo)
+            self.columnas[nombre] = vista[desplazamiento:desplazamiento + tamaño].cast(codigo)
+            desplazamiento += tamaño
+    
+    def __len__(self):
+        return self.cantidad
+    
+    def columnas_numpy(self) -> dict:
+        """Columnas como arreglos de NumPy de solo lectura sobre el mapa de memoria.
+
+        Los arreglos (y las tablas de ``tabla()``) deben liberarse antes de
+        ``cerrar()``.
+        """
+        try:
+            import numpy as np  # Opcional, y se importa recién aquí para no demorar el arranque
+        except ImportError:
+            raise ImportError("columnas_numpy requiere NumPy (pip install numpy)") from None
+        return {nombre: np.frombuffer(self._mapa, dtype=codigo, count=self.cantidad, offset=desplazamiento)
+                for nombre, (desplazamiento, codigo) in self._desplazamientos.items()}
+    
+    def tabla(self) -> TablaProcesos:
+        """Tabla para el motor: columnas de entrada sin copia y columnas de estado nuevas"""
+        return TablaProcesos.desde_columnas(**self.columnas)
+    
+    def procesos(self) -> Iterator[ProcesoSIGET]:
+        """Genera ``ProcesoSIGET`` de a uno, para ``SimuladorSIGET.ejecutar_flujo``"""
+        if not self.ordenada:
+            raise ValueError("La traza no está ordenada por tiempo_irrupcion")
+        columnas = self.columnas
+        for id_, irrupcion, ejecucion, tamaño, tipo, prioridad in zip(
+                columnas["id"], columnas["irrupcion"], columnas["ejecucion"],
+                columnas["tamaño"], columnas["tipo"], columnas["prioridad"]):
+            yield ProcesoSIGET(id_, f"P{id_}", _TIPOS[tipo], irrupcion, ejecucion, prioridad, tamaño,
+                               tiempo_restante=ejecucion)
+    
+    def cerrar(self):
+        # Las vistas deben liberarse antes de cerrar el mapa
+        for columna in getattr(self, "columnas", {}).values():
+            columna.release()
+        self.columnas = {}
+        self._mapa.close()
+        self._archivo.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *excepcion):
+        self.cerrar()